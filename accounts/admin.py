@@ -3,8 +3,10 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils import timezone
 from .emails import EmailService
-from .models import UserProfile, Subscription, Payment, DiscountCode, ReferralReward, ReferralSettings, Payout, PromoSettings
+from .models import UserProfile, Subscription, Payment, DiscountCode, ReferralReward, ReferralSettings, Payout, PromoSettings, OutboundEmail, StripeEvent, ReferralBalance, ReferralLedgerEntry
+from .referral_ledger import InsufficientReferralBalance
 
 
 @admin.register(UserProfile)
@@ -128,7 +130,7 @@ class UserProfileAdmin(admin.ModelAdmin):
 
 @admin.register(Subscription)
 class SubscriptionAdmin(admin.ModelAdmin):
-    list_display = ['user', 'plan_type', 'referral_balance_display', 'is_active', 'started_at']
+    list_display = ['user', 'plan_type', 'is_active', 'started_at']
     list_filter = ['plan_type', 'is_active', 'started_at']
     search_fields = ['user__username', 'user__email']
     readonly_fields = ['stripe_customer_id', 'created_at', 'updated_at']
@@ -141,9 +143,6 @@ class SubscriptionAdmin(admin.ModelAdmin):
             'fields': ('stripe_customer_id',),
             'classes': ('collapse',)
         }),
-        ('Referral Earnings', {
-            'fields': ('referral_cash_balance',)
-        }),
         ('Dates', {
             'fields': ('started_at', 'created_at', 'updated_at'),
             'classes': ('collapse',)
@@ -152,24 +151,6 @@ class SubscriptionAdmin(admin.ModelAdmin):
 
     actions = ['upgrade_to_standard', 'downgrade_to_basic']
 
-    def referral_balance_display(self, obj):
-        """Display referral cash balance"""
-        balance = float(obj.referral_cash_balance)
-
-        if balance <= 0:
-            color = '#999'
-        elif balance < 10:
-            color = 'orange'
-        else:
-            color = 'green'
-
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">${}</span>',
-            color,
-            f'{balance:.2f}'
-        )
-    referral_balance_display.short_description = 'Referral Earnings'
-
     def upgrade_to_standard(self, request, queryset):
         """Upgrade users to Standard plan"""
         count = queryset.update(plan_type='standard')
@@ -528,6 +509,14 @@ class PayoutAdmin(admin.ModelAdmin):
     )
     
     actions = ['approve_payouts', 'mark_as_completed', 'reject_payouts']
+
+    def get_readonly_fields(self, request, obj=None):
+        """Status only changes through the actions, which post to the referral ledger"""
+        readonly = [*self.readonly_fields, 'status']
+        if obj is not None and obj.status != 'pending':
+            # The ledger holds or has paid this amount for this user
+            readonly += ['user', 'amount']
+        return readonly
     
     def user_email(self, obj):
         return obj.user.email
@@ -560,8 +549,12 @@ class PayoutAdmin(admin.ModelAdmin):
         """Approve selected payout requests"""
         count = 0
         for payout in queryset.filter(status='pending'):
-            payout.approve(admin_user=request.user)
-            
+            try:
+                payout.approve(admin_user=request.user)
+            except InsufficientReferralBalance as e:
+                self.message_user(request, f'Cannot approve payout {payout.id}: {e}', level='error')
+                continue
+
             # Send approval email
             EmailService.send_payout_approved(
                 user=payout.user,
@@ -594,9 +587,9 @@ class PayoutAdmin(admin.ModelAdmin):
     mark_as_completed.short_description = 'Mark as completed (deduct balance)'
     
     def reject_payouts(self, request, queryset):
-        """Reject selected payout requests"""
+        """Reject selected payout requests, releasing approved payouts' reservations"""
         count = 0
-        for payout in queryset.filter(status='pending'):
+        for payout in queryset.filter(status__in=['pending', 'approved', 'processing']):
             payout.reject(reason='Rejected by admin', admin_user=request.user)
             count += 1
         
@@ -606,4 +599,91 @@ class PayoutAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """Optimize queries"""
         qs = super().get_queryset(request)
-        return qs.select_related('user', 'processed_by')
\ No newline at end of file
+        return qs.select_related('user', 'processed_by')
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'to_email', 'status', 'attempts', 'created_at', 'sent_at']
+    list_filter = ['status', 'template_name']
+    search_fields = ['to_email', 'subject']
+    readonly_fields = [
+        'to_email', 'from_email', 'subject', 'text_body', 'html_body', 'template_name',
+        'attempts', 'last_error', 'claimed_at', 'sent_at', 'created_at'
+    ]
+    actions = ['retry_now']
+
+    def retry_now(self, request, queryset):
+        """Queue failed or waiting messages for immediate delivery"""
+        count = queryset.filter(status__in=['pending', 'failed']).update(
+            status='pending', next_attempt_at=timezone.now()
+        )
+        EmailService.schedule_delivery()
+        self.message_user(request, f'{count} email(s) queued for delivery.')
+    retry_now.short_description = 'Retry selected emails now'
+
+@admin.register(StripeEvent)
+class StripeEventAdmin(admin.ModelAdmin):
+    list_display = ['event_id', 'event_type', 'status', 'attempts', 'received_at', 'processed_at']
+    list_filter = ['status', 'event_type']
+    search_fields = ['event_id']
+    readonly_fields = ['event_id', 'event_type', 'payload', 'attempts', 'last_error', 'received_at', 'processed_at']
+    actions = ['reprocess']
+
+    def reprocess(self, request, queryset):
+        """Queue failed events to be applied again"""
+        from .tasks import process_stripe_event
+        events = list(queryset.filter(status='failed').values_list('pk', flat=True))
+        for event_pk in events:
+            process_stripe_event.delay(event_pk)
+        self.message_user(request, f'{len(events)} event(s) queued for processing.')
+    reprocess.short_description = 'Reprocess selected failed events'
+
+
+@admin.register(ReferralBalance)
+class ReferralBalanceAdmin(admin.ModelAdmin):
+    """Running referral balances; changed only through ReferralLedger postings"""
+    list_display = ['user', 'available_display', 'reserved', 'total_earned', 'total_paid_out', 'referral_count', 'updated_at']
+    search_fields = ['user__username', 'user__email']
+    readonly_fields = ['user', 'available', 'reserved', 'total_earned', 'total_paid_out', 'referral_count', 'updated_at']
+
+    def available_display(self, obj):
+        """Display available cash balance"""
+        balance = float(obj.available)
+
+        if balance <= 0:
+            color = '#999'
+        elif balance < 10:
+            color = 'orange'
+        else:
+            color = 'green'
+
+        return format_html(
+            '<span style="color: {}; font-weight: bold;">${}</span>',
+            color,
+            f'{balance:.2f}'
+        )
+    available_display.short_description = 'Available'
+    available_display.admin_order_field = 'available'
+
+    def has_add_permission(self, request):
+        return False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
+
+
+@admin.register(ReferralLedgerEntry)
+class ReferralLedgerEntryAdmin(admin.ModelAdmin):
+    list_display = ['created_at', 'user', 'account', 'amount', 'memo', 'posting_id']
+    list_filter = ['account', 'created_at']
+    search_fields = ['user__username', 'user__email', 'posting_id']
+    readonly_fields = ['posting_id', 'user', 'account', 'amount', 'reward', 'payout', 'memo', 'created_at']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
@@ -0,0 +1,76 @@
+# accounts/discounts.py
+"""
+Discount code lookup and redemption for the Section 1983 Lawsuit Generator.
+
+Codes are looked up by DiscountCode.normalized_code (unique index) rather
+than code__iexact. The pricing page validates a code on every keystroke, so
+valid codes are cached for a minute in the 'discount_codes' namespace; that
+only affects what the page shows, since redeem() always counts uses in the
+database.
+"""
+import logging
+
+from core.cache import discount_cache
+
+from .models import DiscountCode
+
+logger = logging.getLogger(__name__)
+
+
+class DiscountCodeService:
+    """Find, validate and redeem discount codes"""
+
+    @staticmethod
+    def get(code):
+        """The DiscountCode for a code as typed, or None"""
+        normalized = DiscountCode.normalize(code)
+        if not normalized:
+            return None
+        return DiscountCode.objects.filter(normalized_code=normalized).first()
+
+    @classmethod
+    def lookup(cls, code):
+        """
+        Find and validate a code for display, from the cache when possible.
+
+        Returns:
+            (DiscountCode or None, is_valid, message)
+        """
+        normalized = DiscountCode.normalize(code)
+        discount_obj = discount_cache.get(normalized)
+        if discount_obj is None:
+            discount_obj = cls.get(code)
+            if discount_obj is None:
+                return None, False, 'Code not found'
+
+        is_valid, message = discount_obj.is_valid()
+        if is_valid:
+            discount_cache.set(normalized, discount_obj)
+        else:
+            discount_cache.delete(normalized)
+        return discount_obj, is_valid, message
+
+    @classmethod
+    def invalidate(cls, code):
+        """Drop a code's cached lookup; called whenever it changes"""
+        discount_cache.delete(DiscountCode.normalize(code))
+
+    @classmethod
+    def redeem(cls, code):
+        """
+        Count one use of a code as typed.
+
+        Returns:
+            The DiscountCode if the use was counted, else None (unknown, used
+            up or no longer valid)
+        """
+        discount_obj = cls.get(code)
+        if discount_obj is None:
+            return None
+        used = discount_obj.use_code()
+        # use_code updates the row directly, without post_save
+        cls.invalidate(discount_obj.code)
+        if not used:
+            logger.warning(f"Discount code {discount_obj.code} could not be redeemed: used up or no longer valid")
+            return None
+        return discount_obj
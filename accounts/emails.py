@@ -2,12 +2,20 @@
 """
 Email notification service for the Section 1983 Lawsuit Generator.
 Centralizes all email sending logic with HTML and plain text templates.
+
+Messages are rendered in the caller and stored in the OutboundEmail outbox;
+a Celery task (or, without a worker, the send_queued_email cron job)
+delivers them in batches over one SMTP connection, so signup, checkout and
+admin actions never wait on the mail server.
 """
 
-from django.core.mail import EmailMultiAlternatives
+from datetime import timedelta
+
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
 from django.template.loader import render_to_string
 from django.conf import settings
-from decimal import Decimal
+from django.utils import timezone
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,17 +33,33 @@ class EmailService:
             'support_email': settings.SUPPORT_EMAIL,
         }
     
+    # Seconds to wait before each retry; a message is marked failed once
+    # these are used up
+    RETRY_DELAYS = [60, 5 * 60, 30 * 60, 2 * 60 * 60, 6 * 60 * 60]
+
+    # Messages per batch (one SMTP connection each)
+    BATCH_SIZE = 100
+
+    # A message claimed for this long without a result is assumed lost
+    # with its worker and becomes pending again
+    CLAIM_TIMEOUT = timedelta(minutes=10)
+
     @staticmethod
     def send_email(subject, to_email, template_name, context):
         """
-        Generic email sender with HTML and plain text versions.
+        Render an email with HTML and plain text versions and queue it for delivery.
         
         Args:
             subject: Email subject line
             to_email: Recipient email address
             template_name: Base template name (without extension)
             context: Dictionary of template variables
+
+        Returns:
+            True if the message was queued
         """
+        from .models import OutboundEmail
+
         try:
             # Merge with base context
             full_context = {**EmailService._get_base_context(), **context}
@@ -51,24 +75,128 @@ class EmailService:
                 f'accounts/emails/{template_name}.txt',
                 full_context
             )
-            
-            # Create email with both versions
-            email = EmailMultiAlternatives(
-                subject=subject,
-                body=text_content,
+
+            OutboundEmail.objects.create(
+                to_email=to_email,
                 from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[to_email]
+                subject=subject,
+                text_body=text_content,
+                html_body=html_content,
+                template_name=template_name,
             )
-            email.attach_alternative(html_content, "text/html")
-            email.send()
-            
-            logger.info(f"Email sent successfully: {subject} to {to_email}")
+            EmailService.schedule_delivery()
+
+            logger.info(f"Email queued: {subject} to {to_email}")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {str(e)}")
+            logger.error(f"Failed to queue email to {to_email}: {str(e)}")
             return False
-    
+
+    @staticmethod
+    def schedule_delivery(countdown=None):
+        """
+        Run the outbox sender once the current transaction commits.
+
+        When Celery runs eagerly (no worker configured) nothing is queued:
+        the task would drain the outbox over SMTP inside the request. The
+        send_queued_email cron job delivers the row instead.
+        """
+        if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+            return
+
+        from .tasks import send_outbound_emails
+        transaction.on_commit(lambda: send_outbound_emails.apply_async(countdown=countdown))
+
+    @classmethod
+    def deliver_pending(cls, batch_size=None):
+        """
+        Send one batch of due outbox messages over a single SMTP connection.
+
+        Rows are claimed atomically (skipping rows another worker has locked),
+        so concurrent senders never send a message twice.
+
+        Returns:
+            (sent, failed) counts for the batch
+        """
+        from .models import OutboundEmail
+
+        now = timezone.now()
+        OutboundEmail.objects.filter(
+            status='sending', claimed_at__lt=now - cls.CLAIM_TIMEOUT
+        ).update(status='pending', claimed_at=None)
+
+        with transaction.atomic():
+            claimed_ids = list(
+                OutboundEmail.objects.select_for_update(skip_locked=True).filter(
+                    status='pending', next_attempt_at__lte=now
+                ).order_by('next_attempt_at').values_list('pk', flat=True)[:batch_size or cls.BATCH_SIZE]
+            )
+            OutboundEmail.objects.filter(pk__in=claimed_ids).update(status='sending', claimed_at=now)
+
+        messages = list(OutboundEmail.objects.filter(pk__in=claimed_ids).order_by('pk'))
+        if not messages:
+            return 0, 0
+
+        sent_ids = []
+        failed = 0
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            # Server unreachable: the whole batch waits for its retry
+            for message in messages:
+                cls._record_failure(message, e)
+            return 0, len(messages)
+
+        try:
+            for message in messages:
+                email = EmailMultiAlternatives(
+                    subject=message.subject,
+                    body=message.text_body,
+                    from_email=message.from_email,
+                    to=[message.to_email],
+                    connection=connection,
+                )
+                if message.html_body:
+                    email.attach_alternative(message.html_body, "text/html")
+                try:
+                    email.send()
+                except Exception as e:
+                    cls._record_failure(message, e)
+                    failed += 1
+                    # Replace a possibly broken connection for the rest of the batch
+                    connection.close()
+                    try:
+                        connection.open()
+                    except Exception:
+                        logger.warning("Could not reopen the SMTP connection; later sends will retry it", exc_info=True)
+                else:
+                    sent_ids.append(message.pk)
+        finally:
+            connection.close()
+            OutboundEmail.objects.filter(pk__in=sent_ids).update(
+                status='sent', sent_at=timezone.now(), claimed_at=None, last_error=''
+            )
+
+        logger.info(f"Outbox batch: {len(sent_ids)} sent, {failed} failed")
+        return len(sent_ids), failed
+
+    @classmethod
+    def _record_failure(cls, message, error):
+        """Schedule a retry with backoff, or give up after the last one"""
+        message.attempts += 1
+        message.last_error = str(error)[:1000]
+        message.claimed_at = None
+        if message.attempts > len(cls.RETRY_DELAYS):
+            message.status = 'failed'
+            logger.error(f"Giving up on email to {message.to_email} after {message.attempts} attempts: {error}")
+        else:
+            message.status = 'pending'
+            message.next_attempt_at = timezone.now() + timedelta(seconds=cls.RETRY_DELAYS[message.attempts - 1])
+            logger.warning(f"Email to {message.to_email} failed (attempt {message.attempts}), will retry: {error}")
+        message.save(update_fields=['attempts', 'last_error', 'claimed_at', 'status', 'next_attempt_at'])
+
     @classmethod
     def send_welcome_email(cls, user):
         """Send welcome email to newly registered user."""
@@ -132,30 +260,6 @@ class EmailService:
             context=context
         )
     
-    @classmethod
-    def send_low_credit_warning(cls, user, subscription, threshold=0.50):
-        """
-        Send warning email when API credit balance is low.
-        
-        Args:
-            user: User to notify
-            subscription: Subscription with low balance
-            threshold: Balance threshold that triggered the warning
-        """
-        context = {
-            'user': user,
-            'subscription': subscription,
-            'balance': subscription.api_credit_balance,
-            'threshold': Decimal(str(threshold)),
-        }
-        
-        return cls.send_email(
-            subject='Low API Credit Balance - Action Needed',
-            to_email=user.email,
-            template_name='low_credit_warning',
-            context=context
-        )
-    
     @classmethod
     def send_payout_approved(cls, user, payout):
         """Send notification when payout request is approved."""
@@ -0,0 +1,240 @@
+# accounts/fulfillment.py
+"""
+Checkout fulfillment for the Section 1983 Lawsuit Generator.
+
+Applies a paid Stripe Checkout Session: plan upgrade, document limits or
+add-on bundle, Payment record, discount code use, referral reward and
+confirmation email. Driven by the checkout.session.completed webhook (see
+process_stripe_event in tasks.py), with the payment_success page as a
+fallback. Fulfillment is keyed by the payment intent, so however many times
+a session is applied, it is fulfilled once.
+
+Stripe does not redeliver an acknowledged event, so events that were never
+applied (a lost broker publish, retries used up, or no worker at all) are
+picked up again by the requeue_stripe_events sweep.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+import logging
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .discounts import DiscountCodeService
+from .emails import EmailService
+from .models import Payment, ReferralReward, ReferralSettings, StripeEvent, Subscription
+from .referral_ledger import ReferralLedger
+
+logger = logging.getLogger(__name__)
+
+
+class FulfillmentService:
+    """Apply paid checkout sessions and stored Stripe events"""
+
+    # Event types that carry a paid (or now paid) Checkout Session
+    CHECKOUT_EVENTS = {'checkout.session.completed', 'checkout.session.async_payment_succeeded'}
+
+    # Unapplied events this old are re-queued by the sweep; longer than
+    # process_stripe_event's own retries (about 15 minutes) take
+    STALE_EVENT_AGE = timedelta(minutes=20)
+
+    # The sweep gives up on an event after this many attempts in all
+    MAX_EVENT_ATTEMPTS = 20
+
+    # Events re-queued per sweep
+    SWEEP_BATCH_SIZE = 100
+
+    @staticmethod
+    def schedule_event(event_pk):
+        """
+        Queue processing of a stored event once the current transaction commits.
+
+        When Celery runs eagerly (no worker configured) nothing is queued, so
+        the webhook is acknowledged without running fulfillment; the
+        process_stripe_events cron job applies the event instead.
+        """
+        if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+            return
+
+        from .tasks import process_stripe_event
+        transaction.on_commit(lambda: process_stripe_event.delay(event_pk))
+
+    @classmethod
+    def stale_event_ids(cls):
+        """Pending or failed events for the sweep to queue again, oldest first"""
+        # Without a worker nothing else will pick an event up, so take them all
+        eager = getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False)
+        received_before = timezone.now() - (timedelta(0) if eager else cls.STALE_EVENT_AGE)
+        return list(
+            StripeEvent.objects.filter(
+                status__in=['pending', 'failed'],
+                received_at__lte=received_before,
+                attempts__lt=cls.MAX_EVENT_ATTEMPTS,
+            ).order_by('received_at').values_list('pk', flat=True)[:cls.SWEEP_BATCH_SIZE]
+        )
+
+    @classmethod
+    def process_event(cls, event_pk):
+        """
+        Apply one stored StripeEvent, at most once.
+
+        Returns:
+            The event's final status
+        """
+        with transaction.atomic():
+            event = StripeEvent.objects.select_for_update().get(pk=event_pk)
+            if event.status in ('processed', 'ignored'):
+                return event.status
+
+            event.attempts += 1
+            session = event.payload['data']['object']
+            if event.event_type in cls.CHECKOUT_EVENTS and session.get('payment_status') == 'paid':
+                cls.fulfill_checkout_session(session)
+                event.status = 'processed'
+            else:
+                event.status = 'ignored'
+            event.processed_at = timezone.now()
+            event.last_error = ''
+            event.save(update_fields=['attempts', 'status', 'processed_at', 'last_error'])
+        return event.status
+
+    @staticmethod
+    def record_failure(event_pk, error):
+        """Note a failed processing attempt on the event"""
+        StripeEvent.objects.filter(pk=event_pk).update(
+            status='failed', attempts=F('attempts') + 1, last_error=str(error)[:1000]
+        )
+
+    @classmethod
+    def fulfill_checkout_session(cls, session):
+        """
+        Apply a paid Checkout Session (a webhook payload dict or a stripe.checkout.Session).
+
+        Returns:
+            The session's Payment, newly created or from an earlier fulfillment
+        """
+        existing = Payment.objects.filter(stripe_payment_intent_id=session['payment_intent']).first()
+        if existing:
+            return existing
+
+        try:
+            with transaction.atomic():
+                payment = cls._apply(session)
+        except IntegrityError:
+            # The webhook and the success page raced; the other one won
+            return Payment.objects.get(stripe_payment_intent_id=session['payment_intent'])
+
+        EmailService.send_payment_confirmation(
+            user=payment.user,
+            payment=payment,
+            subscription=payment.user.subscription
+        )
+        return payment
+
+    @classmethod
+    def _apply(cls, session):
+        metadata = session.get('metadata') or {}
+        plan_type = metadata.get('plan_type')
+        document_id = metadata.get('document_id')
+        discount_code = metadata.get('discount_code')
+        user = User.objects.get(pk=metadata.get('user_id') or session['client_reference_id'])
+
+        # Stripe gives cents, convert to dollars
+        payment_amount = Decimal(str(session['amount_total'])) / Decimal('100')
+
+        # Created first: its unique payment intent makes a second, concurrent
+        # fulfillment of this session fail here before anything is granted
+        payment = Payment.objects.create(
+            user=user,
+            payment_type=plan_type,
+            stripe_payment_intent_id=session['payment_intent'],
+            stripe_checkout_session_id=session['id'],
+            amount=payment_amount,
+            discount_code=discount_code or None,
+            discount_amount=Decimal('0.00'),
+            final_amount=payment_amount,
+            document_id=document_id or None,
+            status='completed',
+            completed_at=timezone.now()
+        )
+
+        subscription, _ = Subscription.objects.select_for_update().get_or_create(
+            user=user, defaults={'plan_type': 'basic'}
+        )
+
+        if plan_type == 'standard':
+            subscription.plan_type = 'standard'
+            subscription.stripe_customer_id = session.get('customer')
+            subscription.save()
+
+            if document_id:
+                cls._grant_standard(user, document_id, session)
+        elif plan_type == 'addon_bundle':
+            cls._grant_addon(user, document_id, session, payment_amount)
+
+        if discount_code:
+            cls._apply_discount_code(discount_code, user, plan_type, payment, payment_amount)
+
+        logger.info(f"Fulfilled {plan_type} checkout {session['id']} for {user.username}")
+        return payment
+
+    @staticmethod
+    def _grant_standard(user, document_id, session):
+        """Give a document the Standard plan limits"""
+        from documents.models import LawsuitDocument
+
+        document = LawsuitDocument.objects.get(pk=document_id, user=user)
+        document.ai_generations_purchased = settings.STANDARD_AI_GENERATIONS
+        document.extraction_minutes_purchased = settings.STANDARD_EXTRACTION_MINUTES
+        document.stripe_payment_intent_id = session['payment_intent']
+        document.stripe_customer_id = session.get('customer')
+        document.purchased_at = timezone.now()
+        document.save()
+
+    @staticmethod
+    def _grant_addon(user, document_id, session, payment_amount):
+        """Record an add-on bundle and raise the document's limits by it"""
+        from documents.models import DocumentAddon, LawsuitDocument
+
+        document = LawsuitDocument.objects.get(pk=document_id, user=user)
+        DocumentAddon.objects.create(
+            document=document,
+            ai_generations_added=settings.ADDON_AI_GENERATIONS,
+            extraction_minutes_added=settings.ADDON_EXTRACTION_MINUTES,
+            amount=payment_amount,
+            stripe_payment_intent_id=session['payment_intent']
+        )
+        LawsuitDocument.objects.filter(pk=document.pk).update(
+            ai_generations_purchased=F('ai_generations_purchased') + settings.ADDON_AI_GENERATIONS,
+            extraction_minutes_purchased=F('extraction_minutes_purchased') + settings.ADDON_EXTRACTION_MINUTES
+        )
+
+    @staticmethod
+    def _apply_discount_code(discount_code, user, plan_type, payment, payment_amount):
+        """Count the code's use and reward the referrer who created it"""
+        # No reward for a use past max_uses (checkouts racing for the last use)
+        code_obj = DiscountCodeService.redeem(discount_code)
+        if code_obj is None or not code_obj.created_by:
+            return
+
+        reward_amount = ReferralSettings.get_settings().calculate_reward(plan_type, payment_amount)
+
+        reward = ReferralReward.objects.create(
+            referrer=code_obj.created_by,
+            referred_user=user,
+            discount_code_used=code_obj,
+            payment=payment,
+            reward_amount=reward_amount,
+            reward_type='api_credit',
+            is_paid=True,
+            paid_at=timezone.now()
+        )
+        ReferralLedger.record_reward(reward)
+        logger.info(
+            f"Referral reward: {code_obj.created_by.username} earned ${reward_amount} "
+            f"from {user.username}'s ${payment_amount} {plan_type} purchase"
+        )
@@ -0,0 +1,150 @@
+# accounts/gateways.py
+"""
+Payment gateways for the Section 1983 Lawsuit Generator.
+
+The checkout views talk to Stripe only through get_gateway(), chosen by
+settings.PAYMENT_GATEWAY:
+
+- StripeGateway: the live Stripe API (the default)
+- FakeGateway: a local stand-in that issues Checkout Sessions, "pays" them,
+  and produces checkout.session.completed events signed with
+  STRIPE_WEBHOOK_SECRET exactly as Stripe signs them, so the real webhook
+  view verifies and processes them. Used by the loadtest_checkout command.
+
+FakeGateway keeps sessions and events in the Django cache, so every web
+process must share one cache (Redis) when running more than one worker.
+It grants purchases without payment, so it only loads with DEBUG on, and
+its pay/replay routes are only registered then.
+"""
+import hashlib
+import hmac
+import json
+import time
+import uuid
+
+import stripe
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
+
+class StripeGateway:
+    """The live Stripe API"""
+
+    def create_checkout_session(self, **params):
+        """Create a Checkout Session; takes stripe.checkout.Session.create's arguments"""
+        return stripe.checkout.Session.create(**params)
+
+    def retrieve_checkout_session(self, session_id):
+        return stripe.checkout.Session.retrieve(session_id)
+
+    def construct_event(self, payload, sig_header):
+        """Verify a webhook's signature and parse it; raises like stripe.Webhook.construct_event"""
+        return stripe.Webhook.construct_event(payload, sig_header, settings.STRIPE_WEBHOOK_SECRET)
+
+
+class FakeGateway(StripeGateway):
+    """Local Stripe stand-in: no network calls, no real payments"""
+
+    CACHE_PREFIX = 'fake_stripe'
+    CACHE_TIMEOUT = 24 * 60 * 60
+
+    def _key(self, kind, object_id):
+        return f'{self.CACHE_PREFIX}:{kind}:{object_id}'
+
+    def create_checkout_session(self, line_items, success_url, mode='payment', client_reference_id=None,
+                                metadata=None, **params):
+        session_id = f'cs_test_{uuid.uuid4().hex}'
+        session = {
+            'id': session_id,
+            'object': 'checkout.session',
+            'amount_total': sum(item['price_data']['unit_amount'] * item.get('quantity', 1) for item in line_items),
+            'currency': 'usd',
+            'client_reference_id': client_reference_id,
+            'customer': None,
+            'metadata': dict(metadata or {}),
+            'mode': mode,
+            'payment_intent': None,
+            'payment_status': 'unpaid',
+            'status': 'open',
+            'success_url': success_url.replace('{CHECKOUT_SESSION_ID}', session_id),
+            'url': reverse('fake_stripe_pay', args=[session_id]),
+        }
+        cache.set(self._key('session', session_id), session, self.CACHE_TIMEOUT)
+        return stripe.checkout.Session.construct_from(session, None)
+
+    def retrieve_checkout_session(self, session_id):
+        session = cache.get(self._key('session', session_id))
+        if session is None:
+            raise stripe.error.InvalidRequestError(f'No such checkout.session: {session_id}', 'id')
+        return stripe.checkout.Session.construct_from(session, None)
+
+    def pay_checkout_session(self, session_id):
+        """
+        Complete a session as if the customer paid.
+
+        Returns:
+            The checkout.session.completed event (a dict), stored for replay_event
+        """
+        session = cache.get(self._key('session', session_id))
+        if session is None:
+            raise stripe.error.InvalidRequestError(f'No such checkout.session: {session_id}', 'id')
+        if session['payment_status'] != 'paid':
+            session.update(
+                payment_intent=f'pi_test_{uuid.uuid4().hex}',
+                customer=session['customer'] or f'cus_test_{uuid.uuid4().hex[:14]}',
+                payment_status='paid',
+                status='complete',
+            )
+            cache.set(self._key('session', session_id), session, self.CACHE_TIMEOUT)
+
+        event = {
+            'id': f'evt_test_{uuid.uuid4().hex}',
+            'object': 'event',
+            'type': 'checkout.session.completed',
+            'created': int(time.time()),
+            'data': {'object': session},
+        }
+        cache.set(self._key('event', event['id']), event, self.CACHE_TIMEOUT)
+        return event
+
+    def replay_event(self, event_id):
+        """A stored event, for redelivery as Stripe does when a webhook is not acknowledged"""
+        event = cache.get(self._key('event', event_id))
+        if event is None:
+            raise stripe.error.InvalidRequestError(f'No such event: {event_id}', 'id')
+        return event
+
+    @staticmethod
+    def sign(payload, timestamp=None):
+        """A Stripe-Signature header for payload (str), signed with STRIPE_WEBHOOK_SECRET"""
+        timestamp = int(time.time()) if timestamp is None else timestamp
+        signature = hmac.new(
+            settings.STRIPE_WEBHOOK_SECRET.encode('utf-8'),
+            f'{timestamp}.{payload}'.encode('utf-8'),
+            hashlib.sha256
+        ).hexdigest()
+        return f't={timestamp},v1={signature}'
+
+    @classmethod
+    def signed_delivery(cls, event):
+        """(payload, Stripe-Signature header) for delivering event to the webhook"""
+        payload = json.dumps(event)
+        return payload, cls.sign(payload)
+
+
+def fake_gateway_enabled():
+    """Whether FakeGateway is configured and allowed to run (DEBUG only)"""
+    return settings.DEBUG and issubclass(import_string(settings.PAYMENT_GATEWAY), FakeGateway)
+
+
+def get_gateway():
+    """The configured payment gateway"""
+    gateway_class = import_string(settings.PAYMENT_GATEWAY)
+    if issubclass(gateway_class, FakeGateway) and not settings.DEBUG:
+        raise ImproperlyConfigured(
+            f'{settings.PAYMENT_GATEWAY} grants purchases without payment and needs DEBUG on'
+        )
+    return gateway_class()
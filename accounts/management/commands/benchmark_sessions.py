@@ -0,0 +1,93 @@
+# accounts/management/commands/benchmark_sessions.py
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import Subscription
+
+
+class Command(BaseCommand):
+    help = ('Benchmark authenticated page throughput with the db, cached_db and cache session '
+            'engines, and check whether a login made under the db engine survives the switch '
+            '(runs in a rolled-back transaction)')
+
+    ENGINES = (
+        ('db', 'django.contrib.sessions.backends.db'),
+        ('cached_db', 'core.sessions'),
+        ('cache', 'django.contrib.sessions.backends.cache'),
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500,
+                            help='Requests per engine')
+        parser.add_argument('--rounds', type=int, default=3,
+                            help='Interleaved passes over the engines; the best is reported')
+        parser.add_argument('--path', default=None,
+                            help='Page to request (default: the dashboard)')
+
+    def handle(self, *args, **options):
+        path = options['path'] or reverse('dashboard')
+        requests = options['requests']
+        self.stdout.write(
+            f"{path}, {requests} requests per engine (best of {options['rounds']}), cache backend "
+            f"{settings.CACHES['default']['BACKEND'].rsplit('.', 1)[-1]}"
+        )
+        if (settings.CACHES['default']['BACKEND'] != 'django.core.cache.backends.redis.RedisCache'
+                or connection.vendor != 'postgresql'):
+            self.stdout.write(self.style.WARNING(
+                f'Not running on Redis and PostgreSQL (database: {connection.vendor}): session reads '
+                f'cost no network round trip here, so req/s does not reflect production. Set REDIS_URL '
+                f'and DATABASE_URL to the real services to compare throughput.'
+            ))
+        self.stdout.write(f'{"engine":<10}{"kept login":>11}{"req/s":>9}{"ms/req":>8}{"queries":>9}{"session":>9}')
+
+        with transaction.atomic(), override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            user = User.objects.create_user('benchmark-sessions', 'benchmark-sessions@example.com')
+            Subscription.objects.get_or_create(user=user, defaults={'plan_type': 'basic'})
+
+            # An existing login, made before the engine is switched
+            with override_settings(SESSION_ENGINE='django.contrib.sessions.backends.db'):
+                existing = Client()
+                existing.force_login(user)
+            cookie = existing.cookies[settings.SESSION_COOKIE_NAME].value
+
+            clients = {}
+            results = {}
+            for label, engine in self.ENGINES:
+                with override_settings(SESSION_ENGINE=engine):
+                    # A new client builds its middleware, and so its session store, under this engine
+                    client = Client()
+                    client.cookies[settings.SESSION_COOKIE_NAME] = cookie
+                    kept_login = client.get(path).status_code == 200
+                    if not kept_login:
+                        client.force_login(user)
+                clients[label] = (engine, client, kept_login)
+
+            for _ in range(options['rounds']):
+                for label, (engine, client, kept_login) in clients.items():
+                    with override_settings(SESSION_ENGINE=engine):
+                        client.get(path)
+                        with CaptureQueriesContext(connection) as queries:
+                            start = time.perf_counter()
+                            for _ in range(requests):
+                                client.get(path)
+                            elapsed = time.perf_counter() - start
+                    if label not in results or elapsed < results[label][0]:
+                        results[label] = (elapsed, queries.captured_queries)
+
+            for label, (engine, client, kept_login) in clients.items():
+                elapsed, captured = results[label]
+                session_queries = sum('django_session' in query['sql'] for query in captured)
+                self.stdout.write(
+                    f'{label:<10}{"yes" if kept_login else "NO":>11}{requests / elapsed:>9,.0f}'
+                    f'{elapsed / requests * 1000:>8.2f}{len(captured) / requests:>9.1f}'
+                    f'{session_queries / requests:>9.1f}'
+                )
+
+            transaction.set_rollback(True)
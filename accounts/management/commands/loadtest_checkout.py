@@ -0,0 +1,253 @@
+# accounts/management/commands/loadtest_checkout.py
+import html
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urljoin, urlparse
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+
+class ScenarioError(Exception):
+    """A step failed; the virtual user stops there"""
+
+    def __init__(self, step, message):
+        super().__init__(f'{step}: {message}')
+        self.step = step
+
+
+class Recorder:
+    """Thread-safe per-step latencies and error counts"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.completed = 0
+
+    def record(self, step, seconds):
+        with self._lock:
+            self.latencies[step].append(seconds * 1000)
+
+    def error(self, step):
+        with self._lock:
+            self.errors[step] += 1
+
+    def complete(self):
+        with self._lock:
+            self.completed += 1
+
+
+class RequestPacer:
+    """Spaces HTTP requests from every worker to one aggregate requests/s target"""
+
+    def __init__(self, rps):
+        self.interval = 1 / rps if rps else 0
+        self._lock = threading.Lock()
+        self._next = time.perf_counter()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.perf_counter()
+            slot = max(self._next, now)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an ascending list"""
+    return sorted_values[max(math.ceil(p / 100 * len(sorted_values)) - 1, 0)]
+
+
+class VirtualUser:
+    """One customer: sign up, create a document, buy Standard, buy an add-on"""
+
+    PASSWORD = 'Load-test-pw-8841'
+    WEBHOOK_DELIVERIES = 3
+    REFRESH_RE = re.compile(r'<meta http-equiv="refresh" content="[^;"]*;url=([^"]*)"')
+
+    def __init__(self, base_url, recorder, pacer, replay_rate, poll_interval, timeout):
+        self.base_url = base_url
+        self.recorder = recorder
+        self.pacer = pacer
+        self.replay_rate = replay_rate
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.http = requests.Session()
+        self.email = f'load-{uuid.uuid4().hex[:12]}@example.com'
+
+    def request(self, step, method, path, expect=(200,), **kwargs):
+        kwargs.setdefault('allow_redirects', False)
+        kwargs.setdefault('timeout', self.timeout)
+        self.pacer.wait()
+        start = time.perf_counter()
+        response = self.http.request(method, urljoin(self.base_url, path), **kwargs)
+        self.recorder.record(step, time.perf_counter() - start)
+        if response.status_code not in expect:
+            raise ScenarioError(step, f'HTTP {response.status_code}')
+        return response
+
+    def form_post(self, step, path, data, expect=(302,)):
+        data = {**data, 'csrfmiddlewaretoken': self.http.cookies.get('csrftoken', '')}
+        return self.request(step, 'POST', path, expect=expect, data=data, headers={'Referer': self.base_url})
+
+    def run(self):
+        self.request('signup_page', 'GET', '/accounts/register/')
+        self.form_post('signup', '/accounts/register/', {
+            'email': self.email, 'first_name': 'Load', 'last_name': 'Test',
+            'password1': self.PASSWORD, 'password2': self.PASSWORD,
+        })
+        self.form_post('profile', '/accounts/profile/', {
+            'full_legal_name': 'Load Test', 'street_address': '400 Main St', 'city': 'Clarion',
+            'state': 'PA', 'zip_code': '16214', 'phone_number': '555-123-4567', 'email': self.email,
+        })
+        response = self.form_post('create_document', '/documents/create/', {
+            'title': 'Load test - unlawful detention at traffic stop',
+            'description': 'Officers detained the plaintiff for forty minutes without reasonable suspicion '
+                           'and searched the vehicle without consent or a warrant.',
+            'incident_location': 'Main St, Clarion, PA',
+            'user_confirmed_district': 'United States District Court for the Western District of Pennsylvania',
+            'defendants': 'Officer John Doe, Clarion Police Department',
+        })
+        document_id = urlparse(response.headers['Location']).path.rstrip('/').split('/')[-1]
+
+        self.purchase('standard', document_id)
+        self.purchase('addon_bundle', document_id)
+
+    def purchase(self, plan_type, document_id):
+        session = self.request(
+            f'checkout_{plan_type}', 'POST', '/accounts/create-checkout-session/',
+            json={'plan_type': plan_type, 'document_id': document_id},
+            headers={'X-CSRFToken': self.http.cookies.get('csrftoken', ''), 'Referer': self.base_url}
+        ).json()
+        delivery = self.request('stripe_pay', 'POST', session['url']).json()
+
+        webhook_sent = time.perf_counter()
+        self.deliver('webhook', delivery)
+        if random.random() < self.replay_rate:
+            replay = self.request('stripe_replay', 'POST', f"/accounts/fake-stripe/events/{delivery['event_id']}/replay/")
+            self.deliver('webhook_replay', replay.json())
+
+        # Follow the success page's auto-refresh, as a browser would, until
+        # the purchase is fulfilled
+        deadline = webhook_sent + self.timeout
+        url = delivery['success_url']
+        while True:
+            page = self.request('payment_success', 'GET', url)
+            refresh = self.REFRESH_RE.search(page.text)
+            if not refresh:
+                break
+            if time.perf_counter() > deadline:
+                raise ScenarioError('fulfillment', 'not fulfilled before timeout')
+            url = urljoin(page.url, html.unescape(refresh.group(1)))
+            time.sleep(self.poll_interval)
+        self.recorder.record('fulfillment', time.perf_counter() - webhook_sent)
+
+    def deliver(self, step, delivery):
+        """
+        POST a signed event to the webhook outside the customer's session, as
+        Stripe does, redelivering after a failed response (each one counted)
+        """
+        for attempt in range(self.WEBHOOK_DELIVERIES):
+            self.pacer.wait()
+            start = time.perf_counter()
+            response = requests.post(
+                urljoin(self.base_url, '/accounts/stripe-webhook/'), data=delivery['payload'],
+                headers={'Stripe-Signature': delivery['signature'], 'Content-Type': 'application/json'},
+                timeout=self.timeout
+            )
+            self.recorder.record(step, time.perf_counter() - start)
+            if response.status_code == 200:
+                return
+            self.recorder.error(step)
+            time.sleep(self.poll_interval * 2 ** attempt)
+        raise ScenarioError(step, f'HTTP {response.status_code} after {self.WEBHOOK_DELIVERIES} deliveries')
+
+
+class Command(BaseCommand):
+    help = ('Load-test signup -> create document -> purchase -> add-on against a running server '
+            'started with DEBUG=true and PAYMENT_GATEWAY=accounts.gateways.FakeGateway, and report latency percentiles. '
+            'Users arrive at --rate on up to --concurrency workers; --target-rps caps the requests/s those '
+            'workers send in aggregate')
+
+    # Recorded timings that are not HTTP requests
+    DERIVED_STEPS = {'fulfillment', 'start_lag'}
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:8000')
+        parser.add_argument('--users', type=int, default=50, help='Virtual users to run in total')
+        parser.add_argument('--rate', type=float, default=2.0, help='Virtual users started per second')
+        parser.add_argument('--concurrency', type=int, default=20, help='Most virtual users running at once')
+        parser.add_argument('--target-rps', type=float, default=0,
+                            help='Aggregate requests/s across all workers (0 = unpaced)')
+        parser.add_argument('--replay-rate', type=float, default=0.1,
+                            help='Share of webhooks Stripe delivers twice')
+        parser.add_argument('--poll-interval', type=float, default=0.25)
+        parser.add_argument('--timeout', type=float, default=30.0)
+
+    def handle(self, *args, **options):
+        base_url = options['base_url'].rstrip('/') + '/'
+        try:
+            requests.get(urljoin(base_url, '/accounts/register/'), timeout=options['timeout'])
+        except requests.RequestException as e:
+            raise CommandError(f'Server not reachable at {base_url}: {e}')
+
+        recorder = Recorder()
+        pacer = RequestPacer(options['target_rps'])
+
+        def scenario(arrival):
+            # Time spent waiting for a free worker: the offered rate outran --concurrency
+            recorder.record('start_lag', time.perf_counter() - arrival)
+            user = VirtualUser(base_url, recorder, pacer, options['replay_rate'], options['poll_interval'],
+                               options['timeout'])
+            try:
+                user.run()
+                recorder.complete()
+            except ScenarioError as e:
+                recorder.error(e.step)
+            except (requests.RequestException, KeyError, ValueError):
+                recorder.error('connection')
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            futures = []
+            for i in range(options['users']):
+                # Open model: users arrive on schedule whether or not earlier ones finished
+                arrival = start + i / options['rate']
+                delay = arrival - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(pool.submit(scenario, arrival))
+            wait(futures)
+        elapsed = time.perf_counter() - start
+
+        self.report(recorder, options['users'], elapsed, options['target_rps'])
+
+    def report(self, recorder, users, elapsed, target_rps):
+        requests_made = sum(
+            len(values) for step, values in recorder.latencies.items() if step not in self.DERIVED_STEPS
+        )
+        target = f' of {target_rps:.1f} targeted' if target_rps else ''
+        self.stdout.write(
+            f'{recorder.completed}/{users} scenarios completed in {elapsed:.1f} s; '
+            f'{requests_made} requests ({requests_made / elapsed:.1f} req/s{target})\n'
+        )
+        self.stdout.write(
+            f"{'step':<24}{'n':>6}{'err':>5}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}   (ms)"
+        )
+        for step in sorted(set(recorder.latencies) | set(recorder.errors)):
+            values = sorted(recorder.latencies.get(step, []))
+            if values:
+                stats = ''.join(f'{percentile(values, p):>9.0f}' for p in (50, 90, 95, 99, 100))
+            else:
+                stats = f"{'-':>9}" * 5
+            self.stdout.write(f'{step:<24}{len(values):>6}{recorder.errors.get(step, 0):>5}{stats}')
@@ -0,0 +1,13 @@
+# accounts/management/commands/process_stripe_events.py
+from django.core.management.base import BaseCommand
+
+from accounts.tasks import requeue_stripe_events
+
+
+class Command(BaseCommand):
+    help = ('Apply stored Stripe webhook events that are still pending or failed. '
+            'Run from cron every few minutes on deploys without a Celery worker and beat.')
+
+    def handle(self, *args, **options):
+        count = requeue_stripe_events()
+        self.stdout.write(f'{count} event(s) processed')
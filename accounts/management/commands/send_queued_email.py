@@ -0,0 +1,12 @@
+# accounts/management/commands/send_queued_email.py
+from django.core.management.base import BaseCommand
+
+from accounts.tasks import send_outbound_emails
+
+
+class Command(BaseCommand):
+    help = ('Deliver due outbox email, including retries and rows abandoned mid-send. '
+            'Run from cron every minute on deploys without a Celery worker and beat.')
+
+    def handle(self, *args, **options):
+        send_outbound_emails()
@@ -0,0 +1,40 @@
+# Add DiscountCode.normalized_code: lowercased code with a unique index
+
+from django.db import migrations, models
+
+
+def populate_normalized_code(apps, schema_editor):
+    DiscountCode = apps.get_model('accounts', 'DiscountCode')
+    taken = set()
+    codes = list(DiscountCode.objects.order_by('pk'))
+    for code in codes:
+        normalized = code.code.strip().lower()
+        if normalized in taken:
+            # Codes that differ only by case were already ambiguous to
+            # code__iexact lookups; the oldest keeps the code
+            normalized = f'{normalized[:40]}#{code.pk}'
+        taken.add(normalized)
+        code.normalized_code = normalized
+    DiscountCode.objects.bulk_update(codes, ['normalized_code'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_promosettings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='discountcode',
+            name='normalized_code',
+            field=models.CharField(default='', editable=False, max_length=50),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_normalized_code, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='discountcode',
+            name='normalized_code',
+            field=models.CharField(editable=False, max_length=50, unique=True),
+        ),
+    ]
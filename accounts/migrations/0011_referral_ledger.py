@@ -0,0 +1,122 @@
+# Replace Subscription.referral_cash_balance with a double-entry referral
+# ledger and a running ReferralBalance row per user
+
+from collections import defaultdict
+from decimal import Decimal
+import uuid
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def open_ledger(apps, schema_editor):
+    """Post every existing reward and payout, then reconcile to the old balance"""
+    Subscription = apps.get_model('accounts', 'Subscription')
+    ReferralReward = apps.get_model('accounts', 'ReferralReward')
+    Payout = apps.get_model('accounts', 'Payout')
+    ReferralBalance = apps.get_model('accounts', 'ReferralBalance')
+    ReferralLedgerEntry = apps.get_model('accounts', 'ReferralLedgerEntry')
+
+    entries = []
+    totals = defaultdict(lambda: defaultdict(Decimal))
+    counts = defaultdict(int)
+
+    def post(user_id, source, destination, amount, memo, reward_id=None, payout_id=None):
+        posting_id = uuid.uuid4()
+        for account, signed in ((source, -amount), (destination, amount)):
+            entries.append(ReferralLedgerEntry(
+                posting_id=posting_id, user_id=user_id, account=account, amount=signed,
+                reward_id=reward_id, payout_id=payout_id, memo=memo
+            ))
+            totals[user_id][account] += signed
+
+    for reward in ReferralReward.objects.order_by('created_at', 'pk'):
+        post(reward.referrer_id, 'rewards', 'available', reward.reward_amount,
+             'Referral reward (opening balance)', reward_id=reward.pk)
+        counts[reward.referrer_id] += 1
+
+    for payout in Payout.objects.filter(status__in=['approved', 'processing', 'completed']).order_by('requested_at'):
+        if payout.status == 'completed':
+            post(payout.user_id, 'available', 'paid_out', payout.amount,
+                 f'Payout #{payout.pk} completed (opening balance)', payout_id=payout.pk)
+        else:
+            post(payout.user_id, 'available', 'reserved', payout.amount,
+                 f'Payout #{payout.pk} approved (opening balance)', payout_id=payout.pk)
+
+    # The old balance was earned minus completed payouts, plus any admin edits
+    for user_id, cash_balance in Subscription.objects.values_list('user_id', 'referral_cash_balance'):
+        account = totals.get(user_id, {})
+        difference = cash_balance - (account.get('available', Decimal('0')) + account.get('reserved', Decimal('0')))
+        if difference:
+            post(user_id, 'adjustments', 'available', difference, 'Opening balance adjustment')
+
+    ReferralLedgerEntry.objects.bulk_create(entries, batch_size=1000)
+    ReferralBalance.objects.bulk_create([
+        ReferralBalance(
+            user_id=user_id,
+            available=account['available'],
+            reserved=account['reserved'],
+            total_earned=-account['rewards'],
+            total_paid_out=account['paid_out'],
+            referral_count=counts[user_id],
+        )
+        for user_id, account in totals.items()
+    ], batch_size=1000)
+
+
+def close_ledger(apps, schema_editor):
+    """Restore the old balance (earned minus completed payouts, with adjustments)"""
+    Subscription = apps.get_model('accounts', 'Subscription')
+    ReferralBalance = apps.get_model('accounts', 'ReferralBalance')
+    for balance in ReferralBalance.objects.all():
+        Subscription.objects.filter(user_id=balance.user_id).update(
+            referral_cash_balance=balance.available + balance.reserved
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('accounts', '0010_discountcode_normalized_code'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReferralBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('available', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Earnings the user can request a payout of', max_digits=10)),
+                ('reserved', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Held for approved payouts not yet sent', max_digits=10)),
+                ('total_earned', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10)),
+                ('total_paid_out', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10)),
+                ('referral_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='referral_balance', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ReferralLedgerEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('posting_id', models.UUIDField(db_index=True)),
+                ('account', models.CharField(choices=[('rewards', 'Referral rewards'), ('adjustments', 'Admin adjustments'), ('available', 'Available'), ('reserved', 'Reserved for payout'), ('paid_out', 'Paid out')], max_length=20)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('memo', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('payout', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ledger_entries', to='accounts.payout')),
+                ('reward', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ledger_entries', to='accounts.referralreward')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='referral_ledger_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at', 'id'],
+                'indexes': [models.Index(fields=['user', 'account'], name='accounts_re_user_id_e0c6cb_idx')],
+            },
+        ),
+        migrations.RunPython(open_ledger, close_ledger),
+        migrations.RemoveField(
+            model_name='subscription',
+            name='referral_cash_balance',
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.7 on 2026-10-19 09:40
+
+from django.db import migrations, models
+
+from core.migration_operations import RemoveFieldIfPresent
+
+
+# Plans from before the Basic/Standard model
+LEGACY_PLANS = {
+    'free': 'basic',
+    'pay_per_doc': 'standard',
+    'unlimited': 'standard',
+}
+
+
+def map_legacy_plans(apps, schema_editor):
+    Subscription = apps.get_model('accounts', 'Subscription')
+    for old_plan, new_plan in LEGACY_PLANS.items():
+        Subscription.objects.filter(plan_type=old_plan).update(plan_type=new_plan)
+
+
+class Migration(migrations.Migration):
+    # The credit-based Subscription fields were dropped from the model
+    # without a migration; databases created since then never had them
+
+    dependencies = [
+        ('accounts', '0011_referral_ledger'),
+    ]
+
+    operations = [
+        RemoveFieldIfPresent(
+            model_name='subscription',
+            name='api_credit_balance',
+        ),
+        RemoveFieldIfPresent(
+            model_name='subscription',
+            name='expires_at',
+        ),
+        RemoveFieldIfPresent(
+            model_name='subscription',
+            name='last_credit_refill',
+        ),
+        RemoveFieldIfPresent(
+            model_name='subscription',
+            name='stripe_subscription_id',
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='payment_type',
+            field=models.CharField(choices=[('standard', 'Standard Plan - Document Purchase'), ('addon_bundle', 'Add-on Bundle - AI + Video')], max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='subscription',
+            name='plan_type',
+            field=models.CharField(choices=[('basic', 'Basic (Free Trial)'), ('standard', 'Standard')], default='basic', max_length=20),
+        ),
+        migrations.RunPython(map_legacy_plans, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,58 @@
 # accounts/models.py
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.utils import timezone
 from decimal import Decimal
+import threading
+import time
+
+
+class CachedSingletonMixin:
+    """
+    Serve a pk=1 settings row from a process-local copy.
+
+    get_settings() is read on every pricing and checkout request, so each
+    process keeps the row for SETTINGS_CACHE_TTL seconds. Saving clears this
+    process's copy once the transaction commits; other gunicorn workers and
+    Celery pick the change up when their copy expires. Treat the returned
+    instance as read-only: edit settings through the admin or a fresh query.
+
+    Models using it define a load_settings() classmethod that fetches (or
+    creates) the row.
+    """
+
+    SETTINGS_CACHE_TTL = 30
+    _settings_lock = threading.Lock()
+
+    @classmethod
+    def get_settings(cls):
+        """The settings row, from this process's cache while it is fresh"""
+        cached = cls.__dict__.get('_cached_settings')
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        with cls._settings_lock:
+            cached = cls.__dict__.get('_cached_settings')
+            if cached is None or cached[0] <= time.monotonic():
+                cached = (time.monotonic() + cls.SETTINGS_CACHE_TTL, cls.load_settings())
+                cls._cached_settings = cached
+        return cached[1]
+
+    @classmethod
+    def clear_settings_cache(cls):
+        """Make the next get_settings() in this process read the database"""
+        cls._cached_settings = None
+
+    def save(self, *args, **kwargs):
+        """Ensure only one settings object exists (singleton pattern)"""
+        self.pk = 1
+        super().save(*args, **kwargs)
+        transaction.on_commit(type(self).clear_settings_cache)
+
+    def delete(self, *args, **kwargs):
+        """Prevent deletion of settings"""
+        pass
+
 
 class UserProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
@@ -103,7 +153,7 @@ class UserProfile(models.Model):
         self.save()
 
 # Signal to create profile when user is created
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 @receiver(post_save, sender=User)
@@ -142,14 +192,6 @@ class Subscription(models.Model):
     is_active = models.BooleanField(default=True)
     started_at = models.DateTimeField(auto_now_add=True)
 
-    # Referral earnings (separate from document purchases)
-    referral_cash_balance = models.DecimalField(
-        max_digits=10,
-        decimal_places=2,
-        default=0.00,
-        help_text="Referral earnings available for cash withdrawal"
-    )
-
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -206,6 +248,7 @@ class Payment(models.Model):
     # Stripe
     stripe_payment_intent_id = models.CharField(max_length=255, unique=True)
     stripe_charge_id = models.CharField(max_length=255, blank=True, null=True)
+    stripe_checkout_session_id = models.CharField(max_length=255, blank=True, db_index=True)
     
     # Amount
     amount = models.DecimalField(max_digits=10, decimal_places=2)
@@ -234,6 +277,8 @@ class DiscountCode(models.Model):
     ]
     
     code = models.CharField(max_length=50, unique=True)
+    # Lowercased code, so lookups are case-insensitive yet use the unique index
+    normalized_code = models.CharField(max_length=50, unique=True, editable=False)
     discount_type = models.CharField(max_length=20, choices=DISCOUNT_TYPE_CHOICES, default='percentage')
     discount_value = models.DecimalField(max_digits=10, decimal_places=2)
     
@@ -256,6 +301,32 @@ class DiscountCode(models.Model):
     
     def __str__(self):
         return f"{self.code} - {self.discount_value}{'%' if self.discount_type == 'percentage' else '$'}"
+
+    @staticmethod
+    def normalize(code):
+        """The lookup form of a code as a customer typed it"""
+        return (code or '').strip().lower()
+
+    def validate_unique(self, exclude=None):
+        """
+        Also reject a code that differs from another only in case.
+
+        normalized_code is not a form field, so ModelForms (the admin) leave
+        its unique check out and the clash would surface as an IntegrityError.
+        """
+        super().validate_unique(exclude)
+        if exclude and 'code' in exclude:
+            return
+        clash = DiscountCode.objects.filter(normalized_code=self.normalize(self.code)).exclude(pk=self.pk)
+        if clash.exists():
+            raise ValidationError({'code': 'A discount code with this name already exists (codes are not case-sensitive).'})
+
+    def save(self, *args, **kwargs):
+        self.normalized_code = self.normalize(self.code)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'code' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'normalized_code'}
+        super().save(*args, **kwargs)
     
     def is_valid(self):
         """Check if code is valid"""
@@ -288,9 +359,31 @@ class DiscountCode(models.Model):
         return min(discount, original_amount)
     
     def use_code(self):
-        """Increment usage counter"""
-        self.times_used += 1
-        self.save()
+        """
+        Count one use, atomically and only while the code is still valid, so
+        concurrent checkouts cannot take it past max_uses.
+
+        Returns:
+            True if the use was counted, False if the code is used up or no
+            longer valid
+        """
+        now = timezone.now()
+        used = DiscountCode.objects.filter(
+            models.Q(valid_until__isnull=True) | models.Q(valid_until__gte=now),
+            pk=self.pk,
+            is_active=True,
+            times_used__lt=models.F('max_uses'),
+            valid_from__lte=now,
+        ).update(times_used=models.F('times_used') + 1, updated_at=now)
+        self.refresh_from_db(fields=['times_used', 'updated_at'])
+        return bool(used)
+
+
+@receiver([post_save, post_delete], sender=DiscountCode)
+def invalidate_discount_code_lookup(sender, instance, **kwargs):
+    """Drop the cached lookup of an edited, toggled or deleted code"""
+    from .discounts import DiscountCodeService
+    DiscountCodeService.invalidate(instance.code)
 
 class ReferralReward(models.Model):
     """Track referral rewards earned"""
@@ -317,7 +410,7 @@ class ReferralReward(models.Model):
 # Add this at the VERY BOTTOM of accounts/models.py
 # After the ReferralReward class
 
-class ReferralSettings(models.Model):
+class ReferralSettings(CachedSingletonMixin, models.Model):
     """
     Global settings for the referral program.
     Only ONE row should exist in the database.
@@ -400,17 +493,8 @@ class ReferralSettings(models.Model):
     def __str__(self):
         return f"Referral Settings (Updated: {self.updated_at.strftime('%Y-%m-%d')})"
     
-    def save(self, *args, **kwargs):
-        """Ensure only one settings object exists (singleton pattern)"""
-        self.pk = 1
-        super().save(*args, **kwargs)
-    
-    def delete(self, *args, **kwargs):
-        """Prevent deletion of settings"""
-        pass
-    
     @classmethod
-    def get_settings(cls):
+    def load_settings(cls):
         """
         Get or create the single settings instance with defaults.
         This ensures settings always exist after database drops.
@@ -482,8 +566,7 @@ def create_user_subscription(sender, instance, created, **kwargs):
         Subscription.objects.get_or_create(
             user=instance,
             defaults={
-                'plan_type': 'free',
-                'api_credit_balance': Decimal('0.50'),
+                'plan_type': 'basic',
             }
         )
 
@@ -552,39 +635,113 @@ class Payout(models.Model):
     def __str__(self):
         return f"{self.user.username} - ${self.amount} ({self.get_status_display()})"
     
+    def _lock_status(self):
+        """Lock this payout's row and return its committed status"""
+        return Payout.objects.select_for_update().values_list('status', flat=True).get(pk=self.pk)
+
     def approve(self, admin_user=None):
-        """Approve the payout request"""
-        self.status = 'approved'
-        self.approved_at = timezone.now()
-        if admin_user:
-            self.processed_by = admin_user
-        self.save()
+        """Approve the payout request, reserving the amount from the user's balance"""
+        from .referral_ledger import ReferralLedger
+
+        with transaction.atomic():
+            if self._lock_status() != 'pending':
+                return
+            ReferralLedger.reserve_payout(self)
+            self.status = 'approved'
+            self.approved_at = timezone.now()
+            if admin_user:
+                self.processed_by = admin_user
+            self.save()
     
     def complete(self, transaction_id='', admin_user=None):
         """Mark payout as completed and deduct from user balance"""
-        self.status = 'completed'
-        self.completed_at = timezone.now()
-        self.transaction_id = transaction_id
-        if admin_user:
-            self.processed_by = admin_user
-        
-        # Deduct from user's cash balance
-        subscription = Subscription.objects.get(user=self.user)
-        subscription.referral_cash_balance -= self.amount
-        subscription.save()
-        
-        self.save()
+        from .referral_ledger import ReferralLedger
+
+        with transaction.atomic():
+            status = self._lock_status()
+            if status not in ('pending', 'approved', 'processing'):
+                raise ValueError(f'Payout is {status}')
+            ReferralLedger.pay_out(self, reserved=status != 'pending')
+            self.status = 'completed'
+            self.completed_at = timezone.now()
+            self.transaction_id = transaction_id
+            if admin_user:
+                self.processed_by = admin_user
+            self.save()
     
     def reject(self, reason='', admin_user=None):
-        """Reject the payout request"""
-        self.status = 'rejected'
-        self.admin_notes = reason
-        if admin_user:
-            self.processed_by = admin_user
-        self.save()
+        """Reject the payout request, releasing any reserved amount"""
+        from .referral_ledger import ReferralLedger
+
+        with transaction.atomic():
+            status = self._lock_status()
+            if status in ('completed', 'rejected', 'cancelled'):
+                return
+            if status != 'pending':
+                ReferralLedger.release_payout(self)
+            self.status = 'rejected'
+            self.admin_notes = reason
+            if admin_user:
+                self.processed_by = admin_user
+            self.save()
+
+
+class ReferralBalance(models.Model):
+    """
+    Running referral totals for one user, maintained by ReferralLedger in the
+    same transaction as each ledger posting. available + reserved + paid out
+    equals everything earned (plus admin adjustments).
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='referral_balance')
+    available = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'),
+                                    help_text="Earnings the user can request a payout of")
+    reserved = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'),
+                                   help_text="Held for approved payouts not yet sent")
+    total_earned = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'))
+    total_paid_out = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'))
+    referral_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user.username} - ${self.available} available"
+
+
+class ReferralLedgerEntry(models.Model):
+    """
+    One leg of a double-entry referral posting. Every posting moves an amount
+    from one of a user's accounts to another as two entries that sum to zero.
+    Entries are never edited; corrections are new postings.
+    """
+    ACCOUNT_CHOICES = [
+        ('rewards', 'Referral rewards'),
+        ('adjustments', 'Admin adjustments'),
+        ('available', 'Available'),
+        ('reserved', 'Reserved for payout'),
+        ('paid_out', 'Paid out'),
+    ]
+
+    posting_id = models.UUIDField(db_index=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='referral_ledger_entries')
+    account = models.CharField(max_length=20, choices=ACCOUNT_CHOICES)
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    reward = models.ForeignKey(ReferralReward, on_delete=models.SET_NULL, null=True, blank=True,
+                               related_name='ledger_entries')
+    payout = models.ForeignKey(Payout, on_delete=models.SET_NULL, null=True, blank=True,
+                               related_name='ledger_entries')
+    memo = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at', 'id']
+        indexes = [
+            models.Index(fields=['user', 'account']),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} {self.account} {self.amount:+}"
 
 
-class PromoSettings(models.Model):
+class PromoSettings(CachedSingletonMixin, models.Model):
     """
     Global settings for promotional pricing (launch discounts, sales, etc.)
     Only ONE row should exist in the database (singleton pattern).
@@ -671,17 +828,8 @@ class PromoSettings(models.Model):
         status = "ACTIVE" if self.is_active else "INACTIVE"
         return f"Promo Settings ({status}) - ${self.promo_price}"
 
-    def save(self, *args, **kwargs):
-        """Ensure only one settings object exists (singleton pattern)"""
-        self.pk = 1
-        super().save(*args, **kwargs)
-
-    def delete(self, *args, **kwargs):
-        """Prevent deletion of settings"""
-        pass
-
     @classmethod
-    def get_settings(cls):
+    def load_settings(cls):
         """
         Get or create the single settings instance with defaults.
         This ensures settings always exist.
@@ -724,3 +872,80 @@ class PromoSettings(models.Model):
         time_left = self.promo_end_date - timezone.now()
         return time_left.total_seconds() <= 86400  # 24 hours
 
+
+
+class OutboundEmail(models.Model):
+    """
+    Transactional email outbox.
+
+    EmailService renders a message and stores it here; a Celery task sends
+    pending rows in batches over one SMTP connection, retrying failures
+    with backoff, so no request waits on the mail server.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+
+    to_email = models.EmailField()
+    from_email = models.CharField(max_length=254)
+    subject = models.CharField(max_length=255)
+    text_body = models.TextField()
+    html_body = models.TextField(blank=True)
+    template_name = models.CharField(max_length=100, blank=True, help_text="Email template the body was rendered from")
+
+    # Delivery tracking
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now, help_text="Not sent before this time")
+    claimed_at = models.DateTimeField(null=True, blank=True, help_text="When a sender took this message")
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+        verbose_name = "Outbound Email"
+        verbose_name_plural = "Outbound Emails"
+
+    def __str__(self):
+        return f"{self.subject} to {self.to_email} ({self.get_status_display()})"
+
+
+class StripeEvent(models.Model):
+    """
+    Stripe webhook events, stored by event ID.
+
+    The webhook view only verifies, stores and acknowledges an event; a
+    Celery task applies it. The unique event ID makes Stripe's redeliveries
+    no-ops.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processed', 'Processed'),
+        ('ignored', 'Ignored'),
+        ('failed', 'Failed'),
+    ]
+
+    event_id = models.CharField(max_length=255, unique=True)
+    event_type = models.CharField(max_length=100)
+    payload = models.JSONField()
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-received_at']
+        verbose_name = "Stripe Event"
+        verbose_name_plural = "Stripe Events"
+
+    def __str__(self):
+        return f"{self.event_type} {self.event_id} ({self.get_status_display()})"
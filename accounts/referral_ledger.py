@@ -0,0 +1,106 @@
+# accounts/referral_ledger.py
+"""
+Double-entry ledger for referral earnings.
+
+Each posting moves an amount between two of a user's accounts:
+
+    reward             rewards   -> available
+    payout approved    available -> reserved
+    payout completed   reserved (or available, if never approved) -> paid_out
+    payout rejected    reserved  -> available
+    admin adjustment   adjustments -> available
+
+and writes one ReferralLedgerEntry per side, so the entries for a user always
+sum to zero. The same transaction updates the user's ReferralBalance row,
+which is what dashboards and payout requests read.
+"""
+from decimal import Decimal
+import uuid
+
+from django.db import transaction
+from django.db.models import F
+
+from .models import ReferralBalance, ReferralLedgerEntry
+
+
+class InsufficientReferralBalance(ValueError):
+    """A payout larger than the user's available referral balance"""
+
+
+class ReferralLedger:
+    """Post referral rewards and payouts"""
+
+    # ReferralBalance column for each account, and the sign it is kept in
+    BALANCE_COLUMNS = {
+        'rewards': ('total_earned', -1),
+        'available': ('available', 1),
+        'reserved': ('reserved', 1),
+        'paid_out': ('total_paid_out', 1),
+    }
+
+    @staticmethod
+    def balance_for(user):
+        """A user's running balance row (created empty on first use)"""
+        balance, _ = ReferralBalance.objects.get_or_create(user=user)
+        return balance
+
+    @classmethod
+    def _post(cls, user, source, destination, amount, memo, reward=None, payout=None, check_funds=False):
+        """Move amount from source to destination; returns the updated ReferralBalance"""
+        amount = Decimal(amount)
+        with transaction.atomic():
+            ReferralBalance.objects.get_or_create(user=user)
+            balance = ReferralBalance.objects.select_for_update().get(user=user)
+
+            if check_funds and getattr(balance, cls.BALANCE_COLUMNS[source][0]) < amount:
+                raise InsufficientReferralBalance(
+                    f"{user.username} has ${balance.available} available, not ${amount}"
+                )
+
+            posting_id = uuid.uuid4()
+            ReferralLedgerEntry.objects.bulk_create([
+                ReferralLedgerEntry(posting_id=posting_id, user=user, account=source, amount=-amount,
+                                    reward=reward, payout=payout, memo=memo),
+                ReferralLedgerEntry(posting_id=posting_id, user=user, account=destination, amount=amount,
+                                    reward=reward, payout=payout, memo=memo),
+            ])
+
+            updates = {}
+            for account, signed in ((source, -amount), (destination, amount)):
+                if account in cls.BALANCE_COLUMNS:
+                    column, sign = cls.BALANCE_COLUMNS[account]
+                    updates[column] = F(column) + sign * signed
+            if reward is not None:
+                updates['referral_count'] = F('referral_count') + 1
+            ReferralBalance.objects.filter(pk=balance.pk).update(**updates)
+            balance.refresh_from_db()
+        return balance
+
+    @classmethod
+    def record_reward(cls, reward):
+        """Credit a ReferralReward to its referrer"""
+        return cls._post(reward.referrer, 'rewards', 'available', reward.reward_amount,
+                         f'Referral reward for {reward.referred_user.username}', reward=reward)
+
+    @classmethod
+    def reserve_payout(cls, payout):
+        """Hold an approved payout's amount; raises InsufficientReferralBalance"""
+        return cls._post(payout.user, 'available', 'reserved', payout.amount,
+                         f'Payout #{payout.pk} approved', payout=payout, check_funds=True)
+
+    @classmethod
+    def pay_out(cls, payout, reserved):
+        """Record a payout as sent, from its reservation or straight from available"""
+        return cls._post(payout.user, 'reserved' if reserved else 'available', 'paid_out', payout.amount,
+                         f'Payout #{payout.pk} completed', payout=payout, check_funds=not reserved)
+
+    @classmethod
+    def release_payout(cls, payout):
+        """Return a rejected payout's reservation to available"""
+        return cls._post(payout.user, 'reserved', 'available', payout.amount,
+                         f'Payout #{payout.pk} rejected', payout=payout)
+
+    @classmethod
+    def adjust(cls, user, amount, memo):
+        """Admin correction of a user's available balance (amount may be negative)"""
+        return cls._post(user, 'adjustments', 'available', amount, memo)
@@ -8,6 +8,7 @@ from django.db.models import Sum, Count
 from django.utils import timezone
 from decimal import Decimal
 from accounts.models import DiscountCode, ReferralReward, Subscription, Payment
+from accounts.referral_ledger import ReferralLedger
 
 @login_required
 def referral_dashboard(request):
@@ -20,8 +21,7 @@ def referral_dashboard(request):
     subscription, created = Subscription.objects.get_or_create(
         user=user,
         defaults={
-            'plan_type': 'free',
-            'api_credit_balance': Decimal('0.50'),
+            'plan_type': 'basic',
             'is_active': True
         }
     )
@@ -37,21 +37,10 @@ def referral_dashboard(request):
         referrer=user
     ).select_related('referred_user', 'payment', 'discount_code_used').order_by('-created_at')
     
-    # Calculate totals
-    total_earned = rewards.aggregate(
-        total=Sum('reward_amount')
-    )['total'] or Decimal('0.00')
+    # Totals and cash balance come from the user's ledger balance row
+    balance = ReferralLedger.balance_for(user)
     
-    # Get actual cash balance (available to withdraw)
-    available_cash = subscription.referral_cash_balance
-    
-    # Calculate total paid out from Payout records
     from accounts.models import Payout
-    total_paid_out = Payout.objects.filter(
-        user=user,
-        status='completed'
-    ).aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
-    
     # Count referrals by type
     referral_stats = rewards.values('payment__payment_type').annotate(
         count=Count('id'),
@@ -79,12 +68,13 @@ def referral_dashboard(request):
     context = {
         'referral_code': referral_code,
         'code_stats': code_stats,
-        'total_earned': total_earned,
-        'available_cash': available_cash,
-        'total_paid_out': total_paid_out,
+        'total_earned': balance.total_earned,
+        'available_cash': balance.available,
+        'reserved_cash': balance.reserved,
+        'total_paid_out': balance.total_paid_out,
         'recent_referrals': recent_referrals,
         'recent_payouts': recent_payouts,
-        'referral_count': rewards.count(),
+        'referral_count': balance.referral_count,
         'referral_stats': referral_stats,
     }
     
@@ -125,7 +115,7 @@ def create_referral_code(request):
             return render(request, 'accounts/create_referral_code.html')
         
         # Check if code already exists
-        if DiscountCode.objects.filter(code__iexact=custom_code).exists():
+        if DiscountCode.objects.filter(normalized_code=DiscountCode.normalize(custom_code)).exists():
             messages.error(request, f'The code "{custom_code}" is already taken. Please choose another.')
             return render(request, 'accounts/create_referral_code.html')
         
@@ -192,10 +182,10 @@ def request_payout(request):
     Request cash payout of referral earnings
     """
     user = request.user
-    subscription = Subscription.objects.get(user=user)
+    available_cash = ReferralLedger.balance_for(user).available
     
     # Check if user has money to withdraw
-    if subscription.referral_cash_balance <= 0:
+    if available_cash <= 0:
         messages.error(request, 'You have no available cash to withdraw.')
         return redirect('referral_dashboard')
     
@@ -215,18 +205,18 @@ def request_payout(request):
             if amount <= 0:
                 messages.error(request, 'Amount must be greater than $0.')
                 return render(request, 'accounts/request_payout.html', {
-                    'available_cash': subscription.referral_cash_balance
+                    'available_cash': available_cash
                 })
             
-            if amount > subscription.referral_cash_balance:
-                messages.error(request, f'You only have ${subscription.referral_cash_balance} available.')
+            if amount > available_cash:
+                messages.error(request, f'You only have ${available_cash} available.')
                 return render(request, 'accounts/request_payout.html', {
-                    'available_cash': subscription.referral_cash_balance
+                    'available_cash': available_cash
                 })
         except (ValueError, TypeError):
             messages.error(request, 'Invalid amount.')
             return render(request, 'accounts/request_payout.html', {
-                'available_cash': subscription.referral_cash_balance
+                'available_cash': available_cash
             })
         
         # Create payout request
@@ -249,7 +239,7 @@ def request_payout(request):
     
     # GET request - show form
     context = {
-        'available_cash': subscription.referral_cash_balance
+        'available_cash': available_cash
     }
     
     return render(request, 'accounts/request_payout.html', context)
\ No newline at end of file
@@ -2,14 +2,18 @@
 import stripe
 from django.conf import settings
 from django.views.decorators.csrf import csrf_exempt
-from .models import Subscription, Payment, DiscountCode, ReferralReward
-from django.http import JsonResponse
+from .models import Subscription, Payment, StripeEvent
+from django.http import Http404, JsonResponse
+from django.views.decorators.http import require_POST
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.shortcuts import render, redirect
-from django.utils import timezone
+from django.db import transaction
+from urllib.parse import urlencode
 import json
-from .emails import EmailService
+from .discounts import DiscountCodeService
+from .fulfillment import FulfillmentService
+from .gateways import FakeGateway, get_gateway
 
 # Initialize Stripe
 stripe.api_key = settings.STRIPE_SECRET_KEY
@@ -70,18 +74,14 @@ def validate_discount_code(request):
                 'message': 'Invalid plan type'
             })
         
-        # Check if code exists
-        try:
-            discount_obj = DiscountCode.objects.get(code__iexact=discount_code)
-        except DiscountCode.DoesNotExist:
+        # Find and validate the code (valid codes are briefly cached)
+        discount_obj, is_valid, message = DiscountCodeService.lookup(discount_code)
+        if discount_obj is None:
             return JsonResponse({
                 'valid': False,
                 'message': f'Code "{discount_code}" not found. Please check spelling.'
             })
         
-        # Validate code
-        is_valid, message = discount_obj.is_valid()
-        
         if not is_valid:
             return JsonResponse({
                 'valid': False,
@@ -134,25 +134,30 @@ def create_checkout_session(request):
             promo = PromoSettings.get_settings()
             price = promo.current_price
             product_name = 'Standard Plan - Section 1983 Document'
+        elif plan_type == 'addon_bundle':
+            from documents.models import LawsuitDocument
+            if not document_id or not LawsuitDocument.objects.filter(pk=document_id, user=request.user).exists():
+                return JsonResponse({'error': 'Add-on bundles are bought for one of your documents'}, status=400)
+            price = settings.PRICE_ADDON_BUNDLE
+            product_name = f'Add-on Bundle - +{settings.ADDON_AI_GENERATIONS} AI Generations & +{settings.ADDON_EXTRACTION_MINUTES} Video Minutes'
         else:
             return JsonResponse({'error': 'Invalid plan type'}, status=400)
 
         # Apply discount code
         discount_amount = 0
         if discount_code:
-            try:
-                discount_obj = DiscountCode.objects.get(code__iexact=discount_code)
-                is_valid, message = discount_obj.is_valid()
-                if not is_valid:
-                    return JsonResponse({'error': message}, status=400)
-
-                discount_amount = float(discount_obj.calculate_discount(price))
-                price = price - discount_amount
-            except DiscountCode.DoesNotExist:
+            discount_obj = DiscountCodeService.get(discount_code)
+            if discount_obj is None:
                 return JsonResponse({'error': 'Invalid discount code'}, status=400)
+            is_valid, message = discount_obj.is_valid()
+            if not is_valid:
+                return JsonResponse({'error': message}, status=400)
+
+            discount_amount = float(discount_obj.calculate_discount(price))
+            price = price - discount_amount
 
         # Create Stripe checkout session
-        session = stripe.checkout.Session.create(
+        session = get_gateway().create_checkout_session(
             payment_method_types=['card'],
             line_items=[{
                 'price_data': {
@@ -176,175 +181,156 @@ def create_checkout_session(request):
             }
         )
         
-        return JsonResponse({'sessionId': session.id})
+        return JsonResponse({'sessionId': session.id, 'url': session.url})
         
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=400)
     
+# How many times the success page re-checks for the webhook's fulfillment
+# (every PAYMENT_PENDING_REFRESH seconds) before asking Stripe directly
+PAYMENT_PENDING_ATTEMPTS = 3
+PAYMENT_PENDING_REFRESH = 2
+
+
 @login_required
 def payment_success(request):
-    """Handle successful payment"""
+    """
+    Show a completed payment.
+
+    Fulfillment happens in the background from the checkout.session.completed
+    webhook; this page waits for it, and only if the webhook is late does it
+    retrieve the session from Stripe and fulfill it here (idempotently).
+    """
     session_id = request.GET.get('session_id')
-    
+
     if not session_id:
         messages.error(request, 'Invalid payment session')
         return redirect('pricing_page')
-    
-    try:
-        # Retrieve session from Stripe
-        session = stripe.checkout.Session.retrieve(session_id)
-        
-        if session.payment_status == 'paid':
-            from decimal import Decimal
-            from accounts.models import ReferralSettings
-            
-            plan_type = session.metadata.get('plan_type')
-            document_id = session.metadata.get('document_id')
-            discount_code = session.metadata.get('discount_code')
-            
-            # Get or create subscription
-            subscription, created = Subscription.objects.get_or_create(
-                user=request.user,
-                defaults={'plan_type': 'basic'}
-            )
-
-            # Track what was purchased for display
-            plan_name = ''
-            ai_generations = 0
-            video_minutes = 0
-            next_url = 'document_list'
-
-            # Update subscription based on plan type
-            if plan_type == 'standard':
-                # Update user's subscription to Standard
-                subscription.plan_type = 'standard'
-                subscription.stripe_customer_id = session.customer
-                subscription.save()
-
-                plan_name = 'Standard Plan'
-                ai_generations = settings.STANDARD_AI_GENERATIONS
-                video_minutes = settings.STANDARD_EXTRACTION_MINUTES
-
-                # If document_id provided, update that specific document
-                if document_id:
-                    from documents.models import LawsuitDocument
-                    document = LawsuitDocument.objects.get(pk=document_id, user=request.user)
-
-                    # Update document with Standard plan limits
-                    document.ai_generations_purchased = settings.STANDARD_AI_GENERATIONS
-                    document.extraction_minutes_purchased = settings.STANDARD_EXTRACTION_MINUTES
-                    document.stripe_payment_intent_id = session.payment_intent
-                    document.stripe_customer_id = session.customer
-                    document.purchased_at = timezone.now()
-                    document.save()
-
-                    next_url = f'/documents/{document_id}/'
-            
-            # Calculate payment amount (Stripe gives cents, convert to dollars)
-            payment_amount = Decimal(str(session.amount_total)) / Decimal('100')
-            
-            # Create Payment record for tracking (always create, not just for referrals)
-            payment_record = Payment.objects.create(
-                user=request.user,
-                payment_type=plan_type,
-                stripe_payment_intent_id=session.payment_intent,
-                amount=payment_amount,
-                discount_code=discount_code if discount_code else None,
-                discount_amount=Decimal('0.00'),  # Calculate if needed
-                final_amount=payment_amount,
-                status='completed',
-                completed_at=timezone.now()
-            )
-            
-            # Process referral reward if discount code used
-            if discount_code:
-                try:
-                    code_obj = DiscountCode.objects.get(code__iexact=discount_code)
-                    code_obj.use_code()
-                    
-                    if code_obj.created_by:
-                        # Get referral settings
-                        settings = ReferralSettings.get_settings()
-                        
-                        # Calculate reward based on plan type and amount
-                        reward_amount = settings.calculate_reward(plan_type, payment_amount)
-                        
-                        # Add reward to referrer's balance
-                        referrer_sub = Subscription.objects.get(user=code_obj.created_by)
-                        referrer_sub.referral_cash_balance += reward_amount
-                        referrer_sub.save()
-                        
-                        # Create reward record (linked to payment)
-                        ReferralReward.objects.create(
-                            referrer=code_obj.created_by,
-                            referred_user=request.user,
-                            discount_code_used=code_obj,
-                            payment=payment_record,  # Now links to payment created above
-                            reward_amount=reward_amount,
-                            reward_type='api_credit',
-                            is_paid=True,
-                            paid_at=timezone.now()
-                        )
-                        
-                        # Optional: Log for debugging
-                        print(f"Referral reward: {code_obj.created_by.username} earned ${reward_amount} from {request.user.username}'s ${payment_amount} {plan_type} purchase")
-                        
-                except DiscountCode.DoesNotExist:
-                    pass
-            
-            # Send payment confirmation email
-            EmailService.send_payment_confirmation(
-                user=request.user,
-                payment=payment_record,
-                subscription=subscription
-            )
-            
-            # Render success page with context
-            context = {
-                'plan_name': plan_name,
-                'ai_generations': ai_generations,
-                'video_minutes': video_minutes,
-                'is_standard': subscription.is_standard,
-                'next_url': next_url,
-            }
-            return render(request, 'accounts/payment-success.html', context)
-        
-        messages.error(request, 'Payment was not completed')
-        return redirect('pricing_page')
-        
-    except Exception as e:
-        messages.error(request, f'Error processing payment: {str(e)}')
-        return redirect('pricing_page')
+
+    payment = Payment.objects.filter(user=request.user, stripe_checkout_session_id=session_id).first()
+
+    if payment is None:
+        try:
+            attempt = int(request.GET.get('attempt', 0))
+        except ValueError:
+            attempt = 0
+
+        if attempt < PAYMENT_PENDING_ATTEMPTS:
+            return render(request, 'accounts/payment-success.html', {
+                'pending': True,
+                'refresh_seconds': PAYMENT_PENDING_REFRESH,
+                'refresh_url': f'?{urlencode({"session_id": session_id, "attempt": attempt + 1})}',
+            })
+
+        try:
+            session = get_gateway().retrieve_checkout_session(session_id)
+            if session.payment_status != 'paid' or session.client_reference_id != str(request.user.id):
+                messages.error(request, 'Payment was not completed')
+                return redirect('pricing_page')
+            payment = FulfillmentService.fulfill_checkout_session(session)
+        except Exception as e:
+            messages.error(request, f'Error processing payment: {str(e)}')
+            return redirect('pricing_page')
+
+    subscription = Subscription.objects.get(user=request.user)
+
+    # Track what was purchased for display
+    plan_name = ''
+    ai_generations = 0
+    video_minutes = 0
+    next_url = 'document_list'
+
+    if payment.payment_type == 'standard':
+        plan_name = 'Standard Plan'
+        ai_generations = settings.STANDARD_AI_GENERATIONS
+        video_minutes = settings.STANDARD_EXTRACTION_MINUTES
+    elif payment.payment_type == 'addon_bundle':
+        plan_name = 'Add-on Bundle'
+        ai_generations = settings.ADDON_AI_GENERATIONS
+        video_minutes = settings.ADDON_EXTRACTION_MINUTES
+
+    if payment.document_id:
+        next_url = f'/documents/{payment.document_id}/'
+
+    context = {
+        'plan_name': plan_name,
+        'ai_generations': ai_generations,
+        'video_minutes': video_minutes,
+        'is_standard': subscription.is_standard,
+        'next_url': next_url,
+    }
+    return render(request, 'accounts/payment-success.html', context)
 
 @csrf_exempt
 def stripe_webhook(request):
-    """Handle Stripe webhooks"""
+    """
+    Receive Stripe webhooks.
+
+    Verifies the signature, stores the event once by its ID and acknowledges
+    straight away; process_stripe_event applies it in the background (or the
+    process_stripe_events cron job, without a worker). Stripe redelivers
+    events, so a repeat of a stored event is acknowledged and otherwise
+    ignored.
+    """
     payload = request.body
     sig_header = request.META.get('HTTP_STRIPE_SIGNATURE')
     
     try:
-        event = stripe.Webhook.construct_event(
-            payload, sig_header, settings.STRIPE_WEBHOOK_SECRET
-        )
+        event = get_gateway().construct_event(payload, sig_header)
     except ValueError:
         return JsonResponse({'error': 'Invalid payload'}, status=400)
     except stripe.error.SignatureVerificationError:
         return JsonResponse({'error': 'Invalid signature'}, status=400)
-    
-    # Handle different event types
-    if event['type'] == 'checkout.session.completed':
-        session = event['data']['object']
-        # Payment was successful - already handled in payment_success view
-        pass
-    
-    elif event['type'] == 'payment_intent.succeeded':
-        payment_intent = event['data']['object']
-        # Log successful payment
-        pass
-    
-    elif event['type'] == 'payment_intent.payment_failed':
-        payment_intent = event['data']['object']
-        # Handle failed payment
-        pass
-    
-    return JsonResponse({'status': 'success'})
\ No newline at end of file
+
+    with transaction.atomic():
+        stored, created = StripeEvent.objects.get_or_create(
+            event_id=event['id'],
+            defaults={'event_type': event['type'], 'payload': json.loads(payload)}
+        )
+        if created:
+            FulfillmentService.schedule_event(stored.pk)
+
+    return JsonResponse({'status': 'success'})
+
+
+def _fake_gateway():
+    """The FakeGateway, or Http404 when the live gateway is configured"""
+    gateway = get_gateway()
+    if not isinstance(gateway, FakeGateway):
+        raise Http404
+    return gateway
+
+
+@csrf_exempt
+@require_POST
+def fake_stripe_pay(request, session_id):
+    """
+    FakeGateway's hosted checkout: pay a session and hand back the signed
+    checkout.session.completed webhook for the caller to deliver, as Stripe
+    would, to stripe_webhook.
+    """
+    gateway = _fake_gateway()
+    try:
+        event = gateway.pay_checkout_session(session_id)
+    except stripe.error.InvalidRequestError as e:
+        return JsonResponse({'error': str(e)}, status=404)
+    payload, signature = gateway.signed_delivery(event)
+    return JsonResponse({
+        'event_id': event['id'],
+        'payload': payload,
+        'signature': signature,
+        'success_url': event['data']['object']['success_url'],
+    })
+
+
+@csrf_exempt
+@require_POST
+def fake_stripe_replay(request, event_id):
+    """FakeGateway: re-sign a stored event for redelivery"""
+    gateway = _fake_gateway()
+    try:
+        event = gateway.replay_event(event_id)
+    except stripe.error.InvalidRequestError as e:
+        return JsonResponse({'error': str(e)}, status=404)
+    payload, signature = gateway.signed_delivery(event)
+    return JsonResponse({'event_id': event['id'], 'payload': payload, 'signature': signature})
@@ -0,0 +1,66 @@
+# accounts/tasks.py
+"""
+Celery tasks for the accounts app.
+"""
+import logging
+
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def send_outbound_emails():
+    """Deliver every due outbox message, then schedule a run for any retries"""
+    from .emails import EmailService
+    from .models import OutboundEmail
+
+    total_failed = 0
+    while True:
+        sent, failed = EmailService.deliver_pending()
+        total_failed += failed
+        if sent + failed < EmailService.BATCH_SIZE:
+            break
+
+    # Eager mode has no worker to run a delayed task; retries wait for the
+    # send_queued_email cron job (or the beat schedule with a worker)
+    if not total_failed or getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+        return
+
+    next_retry = OutboundEmail.objects.filter(status='pending').order_by('next_attempt_at').values_list(
+        'next_attempt_at', flat=True
+    ).first()
+    if next_retry is not None:
+        countdown = max((next_retry - timezone.now()).total_seconds(), 0)
+        send_outbound_emails.apply_async(countdown=countdown)
+
+
+@shared_task(bind=True, max_retries=5)
+def process_stripe_event(self, event_pk):
+    """Apply a stored Stripe webhook event, retrying with backoff on failure"""
+    from .fulfillment import FulfillmentService
+
+    try:
+        return FulfillmentService.process_event(event_pk)
+    except Exception as exc:
+        logger.exception("Processing Stripe event %s failed", event_pk)
+        FulfillmentService.record_failure(event_pk, exc)
+        if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+            # No worker to run the retry; the next sweep tries again
+            return 'failed'
+        raise self.retry(exc=exc, countdown=30 * 2 ** self.request.retries)
+
+
+@shared_task
+def requeue_stripe_events():
+    """Queue stored Stripe events that were never applied (lost publish, retries used up)"""
+    from .fulfillment import FulfillmentService
+
+    event_pks = FulfillmentService.stale_event_ids()
+    for event_pk in event_pks:
+        process_stripe_event.delay(event_pk)
+    if event_pks:
+        logger.warning("Re-queued %d unapplied Stripe event(s)", len(event_pks))
+    return len(event_pks)
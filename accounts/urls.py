@@ -3,6 +3,7 @@ from django.contrib.auth import views as auth_views
 from . import views
 from . import stripe_views
 from . import referral_views
+from .gateways import fake_gateway_enabled
 
 urlpatterns = [
     path('register/', views.register_view, name='register'),
@@ -63,4 +64,12 @@ urlpatterns = [
     path('referrals/payout/', referral_views.request_payout, name='request_payout'),
     path('validate-discount-code/', stripe_views.validate_discount_code, name='validate_discount_code'),
     path('manage-subscription/', views.manage_subscription, name='manage_subscription'),
-]
\ No newline at end of file
+]
+
+# FakeGateway's pay/replay endpoints take no login or CSRF token; they exist
+# only in DEBUG with FakeGateway configured
+if fake_gateway_enabled():
+    urlpatterns += [
+        path('fake-stripe/sessions/<str:session_id>/pay/', stripe_views.fake_stripe_pay, name='fake_stripe_pay'),
+        path('fake-stripe/events/<str:event_id>/replay/', stripe_views.fake_stripe_replay, name='fake_stripe_replay'),
+    ]
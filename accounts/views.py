@@ -57,8 +57,7 @@ def register_view(request):
             Subscription.objects.get_or_create(
                 user=user,
                 defaults={
-                    'plan_type': 'free',
-                    'api_credit_balance': Decimal('0.50'),
+                    'plan_type': 'basic',
                     'is_active': True
                 }
             )
@@ -123,53 +122,36 @@ def logout_view(request):
 @login_required
 def dashboard_view(request):
     """User dashboard - shows user's documents and profile"""
-    from documents.models import LawsuitDocument, DocumentSection
+    from documents.models import LawsuitDocument
+    from documents.services.document_stats_service import DocumentStatsService
 
     # Get user's recent documents
     recent_documents = LawsuitDocument.objects.filter(
         user=request.user
     ).order_by('-created_at')[:5]
 
-    # Get document counts
-    total_documents = LawsuitDocument.objects.filter(user=request.user).count()
-    draft_documents = LawsuitDocument.objects.filter(
-        user=request.user,
-        status='draft'
-    ).count()
-    completed_documents = LawsuitDocument.objects.filter(
-        user=request.user,
-        status='completed'
-    ).count()
+    # Document counts and AI-enhanced sections (cached per user)
+    stats = DocumentStatsService.for_user(request.user)
 
     # Get AI usage statistics
     profile = request.user.profile
     subscription = request.user.subscription
 
-    # Count AI-enhanced sections
-    ai_sections_count = DocumentSection.objects.filter(
-        document__user=request.user,
-        ai_enhanced=True
-    ).count()
-
     # Calculate estimated remaining AI documents
     avg_cost_per_doc = 0.06  # Average cost for 4 AI-enhanced sections
-    if subscription.plan_type == 'unlimited':
-        remaining_budget = float(subscription.api_credit_balance)
-        budget_limit = 10.00
-    else:
-        remaining_budget = profile.remaining_api_budget
-        budget_limit = float(profile.api_cost_limit)
+    remaining_budget = profile.remaining_api_budget
+    budget_limit = float(profile.api_cost_limit)
 
     remaining_ai_docs = int(remaining_budget / avg_cost_per_doc) if avg_cost_per_doc > 0 else 0
 
     context = {
         'recent_documents': recent_documents,
-        'total_documents': total_documents,
-        'draft_documents': draft_documents,
-        'completed_documents': completed_documents,
+        'total_documents': stats['total_documents'],
+        'draft_documents': stats['draft_documents'],
+        'completed_documents': stats['completed_documents'],
         'profile': profile,
         'subscription': subscription,
-        'ai_sections_count': ai_sections_count,
+        'ai_sections_count': stats['ai_sections_count'],
         'remaining_ai_docs': remaining_ai_docs,
         'remaining_budget': remaining_budget,
         'budget_limit': budget_limit,
@@ -238,7 +220,7 @@ def change_password_ajax(request):
 @login_required
 def manage_subscription(request):
     """Page where users can view and manage their subscription"""
-    from documents.models import DocumentSection
+    from documents.services.document_stats_service import DocumentStatsService
 
     subscription = request.user.subscription
     profile = request.user.profile
@@ -250,19 +232,13 @@ def manage_subscription(request):
     ).order_by('-completed_at')
 
     # Get AI usage statistics
-    ai_sections_count = DocumentSection.objects.filter(
-        document__user=request.user,
-        ai_enhanced=True
-    ).count()
+    ai_sections_count = DocumentStatsService.for_user(request.user)['ai_sections_count']
 
     total_ai_cost = float(profile.total_api_cost)
 
     # Calculate remaining AI documents estimate
     avg_cost_per_doc = 0.06
-    if subscription.plan_type == 'unlimited':
-        remaining_budget = float(subscription.api_credit_balance)
-    else:
-        remaining_budget = profile.remaining_api_budget
+    remaining_budget = profile.remaining_api_budget
 
     remaining_ai_docs = int(remaining_budget / avg_cost_per_doc) if avg_cost_per_doc > 0 else 0
 
@@ -154,6 +154,12 @@ STRIPE_PUBLIC_KEY = os.getenv('STRIPE_PUBLIC_KEY')
 STRIPE_SECRET_KEY = os.getenv('STRIPE_SECRET_KEY')
 STRIPE_WEBHOOK_SECRET = os.getenv('STRIPE_WEBHOOK_SECRET')
 
+# Payment gateway (see accounts/gateways.py). accounts.gateways.FakeGateway
+# issues sessions and signed webhooks locally for load tests and development;
+# it grants purchases without payment, so it refuses to load, and its routes
+# are not registered, unless DEBUG is on.
+PAYMENT_GATEWAY = os.getenv('PAYMENT_GATEWAY', 'accounts.gateways.StripeGateway')
+
 # Stripe Price IDs (to be configured in Stripe Dashboard)
 STRIPE_PRICE_STANDARD = os.getenv('STRIPE_PRICE_STANDARD', 'price_xxxxx')  # Regular $197
 STRIPE_PRICE_STANDARD_PROMO = os.getenv('STRIPE_PRICE_STANDARD_PROMO', 'price_xxxxx')  # Promo $129
@@ -176,8 +182,94 @@ ADDON_AI_GENERATIONS = 20
 ADDON_EXTRACTION_MINUTES = 15
 
 
+# Celery Configuration
+# docker-compose runs Redis for the worker; without REDIS_URL (single-service
+# deploys) there is no worker, so tasks run inline in the calling process.
+REDIS_URL = os.environ.get('REDIS_URL')
+CELERY_BROKER_URL = REDIS_URL or 'memory://'
+CELERY_TASK_ALWAYS_EAGER = not REDIS_URL
+CELERY_TASK_IGNORE_RESULT = True
+# PDF renders go to a dedicated worker pool that keeps WeasyPrint state warm
+CELERY_TASK_ROUTES = {
+    'documents.tasks.render_document_pdf': {'queue': 'pdf'},
+}
+# Run by the beat service in docker-compose. Without a worker (no REDIS_URL)
+# run `python manage.py send_queued_email` from cron every minute instead.
+CELERY_BEAT_SCHEDULE = {
+    # Outbox retries whose backoff has passed, and rows left in 'sending'
+    # by a worker that died mid-batch
+    'send-outbound-emails': {
+        'task': 'accounts.tasks.send_outbound_emails',
+        'schedule': 60.0,
+    },
+    # Stripe events acknowledged but never applied; Stripe will not resend
+    # them. Without a worker, run `python manage.py process_stripe_events`
+    # from cron instead.
+    'requeue-stripe-events': {
+        'task': 'accounts.tasks.requeue_stripe_events',
+        'schedule': 5 * 60.0,
+    },
+}
+
+
+# Cache
+# With REDIS_URL, web workers and Celery share one Redis cache (subsystems
+# use the namespaces in core/cache.py). Without it each process has its
+# own memory cache, which is only correct with a single process.
+# CACHE_VERSION invalidates every key at once, e.g. after a deploy that
+# changes what is pickled.
+# Point CACHE_REDIS_URL at a Redis with maxmemory and an allkeys-lru policy
+# (docker-compose runs one): some keys never expire, and sharing the
+# broker's instance would let the cache fill it or evict queued tasks.
+CACHE_VERSION = int(os.environ.get('CACHE_VERSION', '1'))
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('CACHE_REDIS_URL', REDIS_URL),
+            'KEY_PREFIX': 'lawsuit',
+            'VERSION': CACHE_VERSION,
+            'TIMEOUT': 300,
+            'OPTIONS': {
+                # Passed to the per-process redis connection pool
+                'max_connections': int(os.environ.get('CACHE_MAX_CONNECTIONS', '20')),
+                'socket_connect_timeout': 1,
+                'socket_timeout': 1,
+                'retry_on_timeout': True,
+                'health_check_interval': 30,
+            },
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'lawsuit',
+            'VERSION': CACHE_VERSION,
+            'TIMEOUT': 300,
+        }
+    }
+
+# Sessions
+# With the shared Redis cache, sessions are read from the cache and only
+# written through to django_session. A session missing from the cache
+# (existing logins, evicted keys) is loaded from the table, so switching
+# engines logs no one out and a Redis flush is harmless. Per-process memory
+# caches would serve stale sessions (e.g. after logout in another worker),
+# so without Redis sessions stay in the database. core.sessions is cached_db
+# with cache errors logged rather than raised, so a Redis outage falls back
+# to the table instead of failing requests.
+if REDIS_URL:
+    SESSION_ENGINE = 'core.sessions'
+else:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+
+
 # Site Configuration
 SITE_NAME = 'Section 1983 Lawsuit Generator'
+# Deployed code revision, part of HTTP validators such as the court lookup
+# ETag. Render sets RENDER_GIT_COMMIT; other deploys should set APP_VERSION.
+APP_VERSION = os.environ.get('APP_VERSION') or os.environ.get('RENDER_GIT_COMMIT', '')
 SUPPORT_EMAIL = 'info@1983ls.com'
 
 # Site URL - can be overridden by environment variable
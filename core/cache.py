@@ -0,0 +1,157 @@
+# core/cache.py
+"""
+Namespaced access to the shared Django cache.
+
+settings.CACHES points at Redis when REDIS_URL is set, so web workers and
+Celery share one cache. Each subsystem gets a CacheNamespace, which:
+
+- prefixes its keys with the namespace name and its own version, so a
+  change to what a subsystem stores is deployed by bumping that version
+  (CACHE_VERSION in settings invalidates everything at once);
+- treats cache errors as misses, so a Redis outage slows pages down
+  instead of failing them;
+- counts hits and misses in the process and adds them to shared counters
+  every METRICS_FLUSH_INTERVAL seconds, read by `manage.py cache_stats`.
+"""
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+_missing = object()
+
+
+class CacheNamespace:
+    """One subsystem's slice of the shared cache"""
+
+    METRICS_KEY = 'cache_metrics'
+    METRICS_FLUSH_INTERVAL = 30
+
+    # Every namespace created in this process, by name
+    registry = {}
+
+    def __init__(self, name, version=1, timeout=300):
+        self.name = name
+        self.version = version
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._counts = {'hits': 0, 'misses': 0, 'errors': 0}
+        self._flushed_at = time.monotonic()
+        CacheNamespace.registry[name] = self
+
+    def key(self, key):
+        return f'{self.name}:v{self.version}:{key}'
+
+    def get(self, key, default=None):
+        """The cached value for key, or default on a miss"""
+        try:
+            value = cache.get(self.key(key), _missing)
+        except Exception:
+            logger.warning(f"Cache get failed in namespace {self.name}", exc_info=True)
+            self.record('errors')
+            return default
+        self.record('misses' if value is _missing else 'hits')
+        return default if value is _missing else value
+
+    def set(self, key, value, timeout=_missing):
+        """Store value; timeout defaults to the namespace's (None: no expiry)"""
+        try:
+            cache.set(self.key(key), value, self.timeout if timeout is _missing else timeout)
+        except Exception:
+            logger.warning(f"Cache set failed in namespace {self.name}", exc_info=True)
+            self.record('errors')
+
+    def delete(self, key):
+        try:
+            cache.delete(self.key(key))
+        except Exception:
+            logger.warning(f"Cache delete failed in namespace {self.name}", exc_info=True)
+            self.record('errors')
+
+    def get_many(self, keys):
+        """{key: value} for the keys that are cached, in one round trip"""
+        keys = list(keys)
+        try:
+            found = cache.get_many([self.key(key) for key in keys])
+        except Exception:
+            logger.warning(f"Cache get_many failed in namespace {self.name}", exc_info=True)
+            self.record('errors')
+            return {}
+        values = {key: found[self.key(key)] for key in keys if self.key(key) in found}
+        self.record('hits', len(values))
+        self.record('misses', len(keys) - len(values))
+        return values
+
+    def set_many(self, values, timeout=_missing):
+        """Store several {key: value} pairs in one round trip"""
+        try:
+            cache.set_many(
+                {self.key(key): value for key, value in values.items()},
+                self.timeout if timeout is _missing else timeout
+            )
+        except Exception:
+            logger.warning(f"Cache set_many failed in namespace {self.name}", exc_info=True)
+            self.record('errors')
+
+    def get_or_set(self, key, compute, timeout=_missing):
+        """The cached value for key, computing and storing it on a miss"""
+        value = self.get(key, _missing)
+        if value is _missing:
+            value = compute()
+            self.set(key, value, timeout)
+        return value
+
+    def record(self, outcome, count=1):
+        """Count a hit, miss or error; flushes to the shared counters periodically"""
+        with self._lock:
+            self._counts[outcome] += count
+            if time.monotonic() - self._flushed_at < self.METRICS_FLUSH_INTERVAL:
+                return
+            counts = self._counts
+            self._counts = {'hits': 0, 'misses': 0, 'errors': 0}
+            self._flushed_at = time.monotonic()
+        self._flush(counts)
+
+    def _flush(self, counts):
+        for outcome, count in counts.items():
+            if not count:
+                continue
+            key = f'{self.METRICS_KEY}:{self.name}:{outcome}'
+            try:
+                cache.add(key, 0, None)
+                cache.incr(key, count)
+            except Exception:
+                # Metrics are best effort; the counts are dropped
+                logger.debug(f"Could not flush cache metrics for {self.name}", exc_info=True)
+
+    def flush_metrics(self):
+        """Push this process's unflushed counts to the shared counters now"""
+        with self._lock:
+            counts = self._counts
+            self._counts = {'hits': 0, 'misses': 0, 'errors': 0}
+            self._flushed_at = time.monotonic()
+        self._flush(counts)
+
+    def metrics(self):
+        """Shared {hits, misses, errors} for this namespace, across processes"""
+        keys = {outcome: f'{self.METRICS_KEY}:{self.name}:{outcome}' for outcome in ('hits', 'misses', 'errors')}
+        values = cache.get_many(list(keys.values()))
+        return {outcome: values.get(key, 0) for outcome, key in keys.items()}
+
+    def reset_metrics(self):
+        cache.delete_many([f'{self.METRICS_KEY}:{self.name}:{outcome}' for outcome in ('hits', 'misses', 'errors')])
+
+
+# Subsystem namespaces. Bump a version when the shape of what it stores changes.
+template_cache = CacheNamespace('templates')
+court_lookup_cache = CacheNamespace('court_lookup')
+transcript_cache = CacheNamespace('transcripts', timeout=60 * 60 * 24)
+stats_cache = CacheNamespace('stats', timeout=60 * 5)
+# Keyed by evidence_revision, so never stale; the timeout only bounds how
+# long superseded revisions linger
+facts_cache = CacheNamespace('evidence_facts', timeout=60 * 60)
+discount_cache = CacheNamespace('discount_codes', timeout=60)
+pdf_fragment_cache = CacheNamespace('pdf_fragments', timeout=60 * 60 * 24 * 7)
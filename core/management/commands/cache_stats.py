@@ -0,0 +1,31 @@
+# core/management/commands/cache_stats.py
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.cache import CacheNamespace
+
+
+class Command(BaseCommand):
+    help = 'Show hit/miss counts for each cache namespace, summed over every web and Celery process'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true',
+                            help='Zero the counters after printing them')
+
+    def handle(self, *args, **options):
+        backend = settings.CACHES['default']['BACKEND'].rsplit('.', 1)[-1]
+        self.stdout.write(
+            f'{backend}, version {settings.CACHES["default"].get("VERSION", 1)} '
+            f'(processes flush counts every {CacheNamespace.METRICS_FLUSH_INTERVAL}s)'
+        )
+        self.stdout.write(f'{"namespace":<16}{"hits":>10}{"misses":>10}{"errors":>8}{"hit rate":>10}')
+        for name, namespace in sorted(CacheNamespace.registry.items()):
+            namespace.flush_metrics()
+            counts = namespace.metrics()
+            lookups = counts['hits'] + counts['misses']
+            rate = f'{counts["hits"] / lookups:.1%}' if lookups else '-'
+            self.stdout.write(
+                f'{name:<16}{counts["hits"]:>10}{counts["misses"]:>10}{counts["errors"]:>8}{rate:>10}'
+            )
+            if options['reset']:
+                namespace.reset_metrics()
@@ -0,0 +1,73 @@
+# core/migration_operations.py
+"""
+Schema operations for catch-up migrations.
+
+Some models were created on existing deploys before they had migrations.
+A migration that brings the migration state up to date must create their
+tables on new databases but leave the existing ones alone. Each operation
+here checks the live schema first and only touches the database when the
+table, column or constraint is missing (or, for removals, still there).
+The migration state is updated either way.
+"""
+from django.db import migrations
+
+
+def _table_exists(schema_editor, table):
+    return table in schema_editor.connection.introspection.table_names()
+
+
+def _column_names(schema_editor, table):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        return {column.name for column in connection.introspection.get_table_description(cursor, table)}
+
+
+class CreateModelIfMissing(migrations.CreateModel):
+    """CreateModel that keeps an existing table"""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.name)
+        if _table_exists(schema_editor, model._meta.db_table):
+            return
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+
+class AddFieldIfMissing(migrations.AddField):
+    """AddField that keeps an existing column"""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if model._meta.get_field(self.name).column in _column_names(schema_editor, model._meta.db_table):
+            return
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+
+class RemoveFieldIfPresent(migrations.RemoveField):
+    """RemoveField that skips a column the database never had"""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if model._meta.get_field(self.name).column not in _column_names(schema_editor, model._meta.db_table):
+            return
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+
+class AlterUniqueTogetherIfMissing(migrations.AlterUniqueTogether):
+    """AlterUniqueTogether that keeps unique constraints already in place"""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.name)
+        connection = schema_editor.connection
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+        existing = {
+            tuple(constraint['columns']) for constraint in constraints.values()
+            if constraint['unique'] and not constraint['primary_key']
+        }
+        wanted = {
+            tuple(model._meta.get_field(field).column for field in fields)
+            for fields in self.option_value or ()
+        }
+        if wanted <= existing:
+            return
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
@@ -0,0 +1,67 @@
+# core/sessions.py
+"""
+Cached-database sessions that survive a cache outage.
+
+Django 4.2's cached_db store lets errors from cache.set escape from save()
+and load(), so with Redis down or slow every login, and every request whose
+session is not cached, would fail. This store logs those errors and carries
+on with the database copy, as Django 5.1 does. Deleting from the cache is
+left strict, so a logout whose cached session could not be dropped fails
+rather than leaving the session usable. The one exception is the key
+cycle_key() replaces at login, which holds no other user's login.
+"""
+import logging
+
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+
+logger = logging.getLogger('django.contrib.sessions')
+
+
+class _ForgivingCache:
+    """Cache reads and writes that log errors instead of raising them"""
+
+    def __init__(self, cache):
+        self._cache = cache
+
+    def get(self, key, default=None):
+        try:
+            return self._cache.get(key, default)
+        except Exception:
+            logger.warning("Session cache read failed; using the database", exc_info=True)
+            return default
+
+    def set(self, key, value, timeout):
+        try:
+            self._cache.set(key, value, timeout)
+        except Exception:
+            logger.warning("Session cache write failed; the database copy is current", exc_info=True)
+
+    def delete(self, key):
+        self._cache.delete(key)
+
+    def __contains__(self, key):
+        try:
+            return key in self._cache
+        except Exception:
+            logger.warning("Session cache lookup failed; using the database", exc_info=True)
+            return False
+
+
+class SessionStore(CachedDBStore):
+    """cached_db sessions that fall back to the database when the cache fails"""
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self._cache = _ForgivingCache(self._cache)
+
+    def cycle_key(self):
+        """Django's cycle_key, except the old key's cache entry may outlive a cache outage"""
+        data = self._session
+        key = self.session_key
+        self.create()
+        self._session_cache = data
+        if key:
+            try:
+                self.delete(key)
+            except Exception:
+                logger.warning("Could not drop the previous session from the cache", exc_info=True)
@@ -82,7 +82,7 @@ class TranscriptQuoteAdmin(admin.ModelAdmin):
             'fields': ('start_position', 'end_position', 'approximate_timestamp')
         }),
         ('Categorization', {
-            'fields': ('significance', 'violation_tags', 'notes')
+            'fields': ('significance', 'violation_tags', 'tags_edited', 'notes')
         }),
         ('Organization', {
             'fields': ('sort_order', 'include_in_document')
@@ -123,7 +123,7 @@ class VideoEvidenceAdmin(admin.ModelAdmin):
             'fields': ('raw_transcript', 'edited_transcript', 'manually_entered')
         }),
         ('Categorization', {
-            'fields': ('violation_tags', 'notes')
+            'fields': ('violation_tags', 'tags_edited', 'notes')
         }),
         ('Status', {
             'fields': ('is_reviewed', 'include_in_complaint')
@@ -2,4 +2,10 @@ from django.apps import AppConfig
 
 class DocumentsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'documents'
\ No newline at end of file
+    name = 'documents'
+
+    def ready(self):
+        # Discover state court lookups and compile the city index once per process
+        # (forked workers share the index; each opens its own dataset connection)
+        from .services.court_data.registry import court_registry
+        court_registry.load()
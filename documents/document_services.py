@@ -1,6 +1,6 @@
 # documents\document_services.py
 from django.template import Template, Context
-from .models import LawsuitDocument, DocumentSection, LegalTemplate
+from .models import LawsuitDocument, DocumentSection
 
 class LegalDocumentPopulator:
     """Service to automatically populate documents with appropriate legal templates"""
@@ -10,81 +10,14 @@ class LegalDocumentPopulator:
         
     def analyze_violation_type(self):
         """Analyze the document to determine violation type"""
-        description = self.document.description.lower()
-        
-        # Recording interference patterns
-        if any(phrase in description for phrase in [
-            'recording', 'filming', 'camera', 'video', 'stopped recording', 
-            'blocked camera', 'interfered with recording', 'cant record',
-            'no filming', 'no cameras', 'put camera away', 'stop recording',
-            'turn off camera', 'no video', 'cant film', 'photography',
-            'taking pictures', 'photos', 'picture taking'
-        ]):
-            return 'interference_recording'
-        
-        # Forced removal patterns  
-        elif any(phrase in description for phrase in [
-            'kicked out', 'escorted out', 'forced to leave', 'made me leave',
-            'told to leave', 'removed from', 'excluded from', 'banned from',
-            'not allowed', 'get out', 'you need to leave', 'asked to leave',
-            'escorted away', 'thrown out', 'pushed out', 'ordered to leave'
-        ]):
-            return 'forced_to_leave_public'
-        
-        # Retaliation patterns
-        elif any(phrase in description for phrase in [
-            'retaliation', 'retaliated', 'because I complained', 'payback',
-            'got back at me', 'targeted me', 'harassment', 'followed up',
-            'came back', 'returned later', 'next time', 'remembered me',
-            'harassed', 'singled out', 'revenge', 'got even', 'punishment'
-        ]):
-            return 'retaliation_protected_speech'
-        
-        # Threatened arrest patterns (most common, so check last)
-        elif any(phrase in description for phrase in [
-            'threatened', 'threat', 'will arrest', 'going to arrest',
-            'arrest you if', 'said he would', 'warned me', 'told me I would be arrested',
-            'threatened to arrest', 'said I would go to jail', 'going to jail',
-            'youre under arrest if', 'arrest threat', 'warned of arrest'
-        ]):
-            return 'threatened_arrest_public'
-        
-        else:
-            # Default to threatened arrest for ambiguous cases
-            return 'threatened_arrest_public'
+        # Imported here: documents.services imports this module
+        from .services.violation_analysis_service import ViolationAnalysisService
+        return ViolationAnalysisService.analyze_violation_type(self.document.description)
     
     def analyze_location_type(self):
         """Analyze the location to determine forum type"""
-        location = self.document.incident_location.lower()
-        
-        # Traditional public forums (strongest First Amendment protection)
-        if any(term in location for term in [
-            'sidewalk', 'street', 'plaza', 'park', 'courthouse steps',
-            'public square', 'town square', 'public walkway', 'street corner',
-            'parking lot', 'public parking', 'outside', 'front of building',
-            'public area', 'crosswalk', 'intersection'
-        ]):
-            return 'traditional_public_forum'
-        
-        # Designated public forums (government opens for public use)
-        elif any(term in location for term in [
-            'city hall', 'dmv', 'government building', 'public meeting',
-            'courthouse', 'municipal building', 'town hall', 'civic center',
-            'public library', 'community center', 'government office',
-            'county building', 'federal building', 'state building'
-        ]):
-            return 'designated_public_forum'
-        
-        # Limited public forums (restricted access but still public)
-        elif any(term in location for term in [
-            'lobby', 'waiting area', 'public counter', 'service window',
-            'reception area', 'public entrance', 'foyer', 'vestibule',
-            'public restroom', 'elevator', 'hallway'
-        ]):
-            return 'limited_public_forum'
-        
-        else:
-            return 'traditional_public_forum'  # default to strongest protection
+        from .services.violation_analysis_service import ViolationAnalysisService
+        return ViolationAnalysisService.analyze_location_type(self.document.incident_location)
     
     def get_template_context(self):
         """Prepare context data for template population"""
@@ -105,8 +38,7 @@ class LegalDocumentPopulator:
         populated_content = template.render(Context(context))
         
         # Always update the section content
-        section, created = DocumentSection.objects.get_or_create(
-            document=self.document,
+        section, created = self.document.sections.get_or_create(
             section_type=section_type,
             defaults={
                 'title': dict(DocumentSection.SECTION_TYPES)[section_type],
@@ -127,11 +59,9 @@ class LegalDocumentPopulator:
         location_type = self.analyze_location_type()
         context = self.get_template_context()
         
-        # Get matching templates
-        templates = LegalTemplate.objects.filter(
-            violation_type=violation_type,
-            location_type=location_type
-        )
+        # Get matching templates from the in-memory catalog
+        from .services.template_catalog import template_catalog
+        templates = template_catalog.find(violation_type, location_type)
         
         sections_created = []
         for template in templates:
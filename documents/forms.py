@@ -295,7 +295,9 @@ class LawsuitDocumentForm(forms.ModelForm):
                 print("DEBUG: Attempting to import CourtLookupService")
                 from .services.court_lookup_service import CourtLookupService
                 print("DEBUG: Import successful, calling lookup")
-                court_result = CourtLookupService.lookup_court_by_location(city, state)
+                court_result = CourtLookupService.lookup_court_by_location(
+                    city, state, zip_code=cleaned_data.get('incident_zip_code')
+                )
                 print(f"DEBUG: Court result: {court_result}")
                 
                 if court_result and court_result.get('court_name'):
@@ -392,14 +394,12 @@ class TemplateInsertForm(forms.Form):
     def get_template(self):
         """Get the matching legal template"""
         if self.is_valid():
-            try:
-                return LegalTemplate.objects.get(
-                    violation_type=self.cleaned_data['violation_type'],
-                    location_type=self.cleaned_data['location_type'],
-                    section_type=self.cleaned_data['section_type']
-                )
-            except LegalTemplate.DoesNotExist:
-                return None
+            from .services.template_catalog import template_catalog
+            return template_catalog.get(
+                self.cleaned_data['violation_type'],
+                self.cleaned_data['location_type'],
+                self.cleaned_data['section_type']
+            )
         return None
 
 
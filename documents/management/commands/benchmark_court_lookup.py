@@ -0,0 +1,86 @@
+# documents/management/commands/benchmark_court_lookup.py
+import time
+
+from django.core.management.base import BaseCommand
+
+from documents.services.court_lookup_service import CourtLookupService
+from documents.services.court_data.dataset import court_dataset
+from documents.services.court_data.registry import court_registry
+
+
+class Command(BaseCommand):
+    help = 'Microbenchmark court lookup for every listed city in every state (linear scan vs. compiled index), misspelled cities and ZIPs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rounds', type=int, default=20,
+                            help='Passes over the full city list')
+
+    def handle(self, *args, **options):
+        rounds = options['rounds']
+
+        # Every listed city for every state, plus one miss per state
+        queries = []
+        for state_code, lookup in sorted(court_registry.lookups.items()):
+            for district_info in lookup.DISTRICTS.values():
+                queries.extend((state_code, city) for city in district_info.get('cities', []))
+            queries.append((state_code, 'no such town'))
+
+        def linear_scan(state_code, city):
+            # The previous BaseStateLookup behaviour: scan every district's list
+            lookup = court_registry.lookups[state_code]
+            city = city.strip().lower()
+            for district_key, district_info in lookup.DISTRICTS.items():
+                if city in district_info.get('cities', []):
+                    return lookup.build_result(district_key, confidence='high', method='city_match')
+            return None
+
+        def indexed(state_code, city):
+            return court_registry.lookup_city(state_code, city)
+
+        def end_to_end(state_code, city):
+            return CourtLookupService.lookup_court_by_location(city, state_code)
+
+        self.stdout.write(
+            f'{len(court_registry.lookups)} states/districts, {len(queries)} queries x {rounds} rounds'
+        )
+        for label, func in (('linear scan', linear_scan), ('indexed', indexed), ('end to end', end_to_end)):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for state_code, city in queries:
+                    func(state_code, city)
+            elapsed = time.perf_counter() - start
+            per_lookup_us = elapsed / (rounds * len(queries)) * 1_000_000
+            self.stdout.write(f'{label:>12}: {per_lookup_us:8.2f} us/lookup ({elapsed * 1000:.1f} ms total)')
+
+        # Every listed city with its middle letter dropped
+        misspelled = [
+            (state_code, city, city[:len(city) // 2] + city[len(city) // 2 + 1:])
+            for state_code, city in queries if city != 'no such town'
+        ]
+        start = time.perf_counter()
+        found = 0
+        for state_code, city, typo in misspelled:
+            suggestions = court_registry.suggest_cities(state_code, typo)
+            found += bool(suggestions) and suggestions[0]['city'] == city
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f'{"fuzzy":>12}: {elapsed / len(misspelled) * 1_000_000:8.2f} us/lookup '
+            f'({found}/{len(misspelled)} ranked the intended city first)'
+        )
+
+        if not court_dataset.available:
+            self.stdout.write('court dataset not built; skipping ZIP lookups (run build_court_dataset)')
+            return
+
+        # One pass over every ZIP in the bundled dataset
+        zip_queries = court_dataset.zip_codes()
+        start = time.perf_counter()
+        resolved = sum(
+            1 for zip_code, state_code in zip_queries
+            if CourtLookupService.lookup_court_by_location(None, state_code, zip_code=zip_code)
+        )
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f'{"zip":>12}: {elapsed / len(zip_queries) * 1_000_000:8.2f} us/lookup '
+            f'({resolved}/{len(zip_queries)} ZIPs resolved, dataset {court_dataset.version})'
+        )
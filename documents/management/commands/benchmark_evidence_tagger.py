@@ -0,0 +1,66 @@
+# documents/management/commands/benchmark_evidence_tagger.py
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from documents.models import TranscriptQuote, VideoEvidence
+from documents.services.evidence_tagging_service import EvidenceTaggingService
+from documents.services.violation_analysis_service import ViolationAnalysisService
+
+
+# Transcript-like filler between the occasional tag phrase
+FILLER = (
+    'okay sir can I help you I am just standing here on the sidewalk '
+    'we got a call about someone suspicious what are you doing here today '
+    'I am not going to answer any questions have a nice day'
+).split()
+
+
+class Command(BaseCommand):
+    help = 'Benchmark batch evidence tagging (segments and quotes per second, no database writes)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--segments', type=int, default=500)
+        parser.add_argument('--quotes-per-segment', type=int, default=5)
+        parser.add_argument('--seconds', type=int, default=180,
+                            help='Segment length; Whisper produces roughly 2.5 words per second')
+
+    def handle(self, *args, **options):
+        random.seed(1983)
+        phrases = [
+            phrase for tag_phrases in ViolationAnalysisService.EVIDENCE_TAG_PATTERNS.values()
+            for phrase in tag_phrases
+        ]
+
+        segments = []
+        quotes = []
+        for segment_id in range(1, options['segments'] + 1):
+            transcript = self._transcript(int(options['seconds'] * 2.5), phrases)
+            segments.append(VideoEvidence(pk=segment_id, edited_transcript=transcript))
+            for quote_number in range(options['quotes_per_segment']):
+                start = random.randrange(max(len(transcript) - 200, 1))
+                quotes.append(TranscriptQuote(
+                    pk=segment_id * 100 + quote_number, video_evidence_id=segment_id,
+                    start_position=start, end_position=start + 200,
+                ))
+
+        start = time.perf_counter()
+        segment_tags, quote_tags = EvidenceTaggingService.propose_tags(segments, quotes)
+        elapsed = time.perf_counter() - start
+
+        characters = sum(len(segment.edited_transcript) for segment in segments)
+        tagged = sum(1 for tags in segment_tags.values() if tags)
+        self.stdout.write(
+            f'{len(segments)} segments ({characters / len(segments):.0f} chars each), '
+            f'{len(quotes)} quotes in {elapsed * 1000:.1f} ms: '
+            f'{len(segments) / elapsed:.0f} segments/s, {tagged} segments and '
+            f'{sum(1 for tags in quote_tags.values() if tags)} quotes tagged'
+        )
+
+    def _transcript(self, word_count, phrases):
+        """Filler speech with a tag phrase every ~50 words"""
+        return ' '.join(
+            random.choice(phrases) if random.random() < 0.02 else random.choice(FILLER)
+            for _ in range(word_count)
+        )
@@ -0,0 +1,146 @@
+# documents/management/commands/benchmark_pdf_render.py
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import render_to_string
+
+from documents.models import LawsuitDocument, DocumentSection
+from documents.services.pdf_render_service import PDFRenderService
+
+
+# Roughly one letter-size page of 12pt body text in document_pdf.html
+CHARS_PER_PAGE = 2800
+
+PARAGRAPH = (
+    'Defendant officers approached Plaintiff while Plaintiff was lawfully recording '
+    'on a public sidewalk, demanded identification without reasonable suspicion, and '
+    'threatened arrest if Plaintiff continued to record. See Exhibit A at 02:15. '
+)
+
+
+class Command(BaseCommand):
+    help = ('Benchmark complaint PDF rendering (p50/p95): HTML assembly with and without cached '
+            'section fragments, and cold vs. warm WeasyPrint state')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages', type=int, nargs='+', default=[5, 20, 80],
+                            help='Target complaint lengths in pages')
+        parser.add_argument('--iterations', type=int, default=10,
+                            help='Renders per length and mode')
+        parser.add_argument('--html-only', action='store_true',
+                            help='Only time HTML assembly (no WeasyPrint needed)')
+
+    def handle(self, *args, **options):
+        iterations = max(2, options['iterations'])
+        self.stdout.write(f'{"pages":>6} {"actual":>6} {"mode":>10} {"p50 ms":>9} {"p95 ms":>9}')
+        for target_pages in options['pages']:
+            document, sections = self._build_complaint(target_pages)
+            self._time_html(target_pages, document, sections, iterations)
+        if options['html_only']:
+            return
+
+        try:
+            from weasyprint import HTML, CSS
+            from weasyprint.text.fonts import FontConfiguration
+        except OSError as exc:
+            # WeasyPrint needs Pango at import time; the Docker image has it
+            raise CommandError(
+                f'WeasyPrint could not load its native libraries ({exc}). Run the benchmark in '
+                f'the app image: docker compose run --rm pdf-worker python manage.py benchmark_pdf_render'
+            )
+
+        css_text = render_to_string(PDFRenderService.STYLESHEET_NAME)
+        PDFRenderService.warm()
+
+        def render_cold(html):
+            # What every request paid before: fresh fonts and a freshly parsed stylesheet
+            font_config = FontConfiguration()
+            stylesheet = CSS(string=css_text, font_config=font_config)
+            return HTML(string=html).render(stylesheets=[stylesheet], font_config=font_config)
+
+        def render_warm(html):
+            return HTML(string=html).render(
+                stylesheets=PDFRenderService._stylesheets,
+                font_config=PDFRenderService._font_config
+            )
+
+        for target_pages in options['pages']:
+            document, sections = self._build_complaint(target_pages)
+            html = PDFRenderService.render_html(document, sections)
+
+            for mode, render in (('cold', render_cold), ('warm', render_warm)):
+                timings = []
+                actual_pages = 0
+                for _ in range(iterations):
+                    start = time.perf_counter()
+                    rendered = render(html)
+                    rendered.write_pdf()
+                    timings.append((time.perf_counter() - start) * 1000)
+                    actual_pages = len(rendered.pages)
+                self._report(target_pages, actual_pages, mode, timings)
+
+    def _time_html(self, target_pages, document, sections, iterations):
+        """HTML assembly with every section fragment new, then with one section edited"""
+        edited = sections[len(sections) // 2]
+        originals = {id(section): section.content for section in sections}
+        for mode, changed in (('html full', sections), ('html edit', [edited])):
+            PDFRenderService.render_html(document, sections)
+            timings = []
+            for iteration in range(iterations):
+                # A new marker per run makes the changed sections miss the fragment cache
+                for section in changed:
+                    section.content = f'{originals[id(section)]} [{mode} {iteration}]'
+                start = time.perf_counter()
+                PDFRenderService.render_html(document, sections)
+                timings.append((time.perf_counter() - start) * 1000)
+            self._report(target_pages, '-', mode, timings)
+        for section in sections:
+            section.content = originals[id(section)]
+
+    def _report(self, target_pages, actual_pages, mode, timings):
+        p50 = statistics.median(timings)
+        p95 = statistics.quantiles(timings, n=20)[18]
+        self.stdout.write(
+            f'{target_pages:>6} {actual_pages:>6} {mode:>10} {p50:>9.1f} {p95:>9.1f}'
+        )
+
+    def _build_complaint(self, target_pages):
+        """Unsaved, synthetic exhibit-heavy complaint of roughly target_pages pages"""
+        user = User(username='benchmark', first_name='Jane', last_name='Doe', email='jane@example.com')
+        document = LawsuitDocument(
+            user=user,
+            title='Benchmark Complaint',
+            description='Synthetic complaint for render benchmarking',
+            defendants='Officer John Smith\nOfficer Jane Roe\nCity of Springfield',
+        )
+
+        # Spread the body text across the standard sections, then add one
+        # exhibit entry per two pages so longer complaints are exhibit-heavy.
+        section_types = [code for code, _ in DocumentSection.SECTION_TYPES if code != 'exhibits']
+        chars_per_section = (target_pages * CHARS_PER_PAGE) // len(section_types)
+        repeats = max(1, chars_per_section // len(PARAGRAPH))
+
+        sections = []
+        for order, section_type in enumerate(section_types, start=1):
+            body = '\n\n'.join(f'{n}. {PARAGRAPH}' for n in range(1, repeats + 1))
+            sections.append(DocumentSection(
+                document=document, section_type=section_type,
+                title=dict(DocumentSection.SECTION_TYPES)[section_type],
+                content=body, order=order,
+            ))
+
+        exhibits = '\n\n---\n\n'.join(
+            f'EXHIBIT {n}: Body Camera Footage\n\n'
+            f'Description: Video documentation of First Amendment, Fourth Amendment\n\n'
+            f'Source: https://www.youtube.com/watch?v=benchmark{n}\n\n'
+            f'Relevant Timestamps: 00:00-03:00, 04:10-05:45'
+            for n in range(1, max(1, target_pages // 2) + 1)
+        )
+        sections.append(DocumentSection(
+            document=document, section_type='exhibits', title='List of Exhibits',
+            content=exhibits, order=len(sections) + 1,
+        ))
+
+        return document, sections
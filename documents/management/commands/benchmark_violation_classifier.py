@@ -0,0 +1,97 @@
+# documents/management/commands/benchmark_violation_classifier.py
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from documents.services.pattern_classifier import PatternClassifier
+from documents.services.violation_analysis_service import ViolationAnalysisService
+
+
+# Transcript-like filler between the occasional pattern phrase
+FILLER = (
+    'okay sir can I see some identification I am not required to show you anything '
+    'I am standing here on public property and I am not committing any crime '
+    'what is your name and badge number you are being detained for investigation '
+).split()
+
+
+class Command(BaseCommand):
+    help = ('Benchmark violation/forum/evidence classification on long transcripts: pattern loops, '
+            'and the classifier counting phrase by phrase vs. its compiled regex pass')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[3_000, 30_000, 300_000],
+                            help='Transcript lengths in characters')
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--extra-patterns', type=int, nargs='+', default=[1000],
+                            help='Random phrases added to the violation patterns, to show scaling')
+
+    def handle(self, *args, **options):
+        random.seed(1983)
+        pattern_sets = [
+            ('violation', ViolationAnalysisService.VIOLATION_PATTERNS),
+            ('forum', ViolationAnalysisService.FORUM_PATTERNS),
+            ('evidence', ViolationAnalysisService.EVIDENCE_TAG_PATTERNS),
+        ]
+        for extra in options['extra_patterns']:
+            pattern_sets.append((f'+{extra}', {
+                **ViolationAnalysisService.VIOLATION_PATTERNS,
+                'benchmark_extra': [self._random_phrase() for _ in range(extra)],
+            }))
+        phrases = [
+            phrase for _, patterns in pattern_sets[:3]
+            for label_phrases in patterns.values() for phrase in label_phrases
+        ]
+
+        self.stdout.write(
+            f'{"set":<10} {"patterns":>8} {"chars":>8} {"first match":>12} {"counted":>12} '
+            f'{"compiled":>12} {"uses":>9}  (ms/call)'
+        )
+        for name, pattern_set in pattern_sets:
+            phrase_count = len({phrase.lower() for label_phrases in pattern_set.values() for phrase in label_phrases})
+            counted = PatternClassifier(pattern_set, max_counted_phrases=phrase_count)
+            compiled = PatternClassifier(pattern_set, max_counted_phrases=0)
+            uses = 'counted' if phrase_count <= PatternClassifier.MAX_COUNTED_PHRASES else 'compiled'
+
+            for size in options['sizes']:
+                text = self._transcript(size, phrases)
+
+                def first_match():
+                    # What analyze_violation_type/analyze_location_type used to do
+                    lowered = text.lower()
+                    for label_phrases in pattern_set.values():
+                        if any(phrase in lowered for phrase in label_phrases):
+                            return True
+                    return False
+
+                timings = [
+                    self._time(func, options['iterations'])
+                    for func in (first_match, lambda: counted.scores(text), lambda: compiled.scores(text))
+                ]
+                self.stdout.write(
+                    f'{name:<10} {phrase_count:>8} {size:>8} '
+                    + ' '.join(f'{timing:>12.3f}' for timing in timings) + f' {uses:>9}'
+                )
+
+    def _time(self, func, iterations):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - start) / iterations * 1000
+
+    def _transcript(self, size, phrases):
+        """Filler speech with a pattern phrase every ~40 words"""
+        words = []
+        length = 0
+        while length < size:
+            word = random.choice(phrases) if random.random() < 0.025 else random.choice(FILLER)
+            words.append(word)
+            length += len(word) + 1
+        return ' '.join(words)[:size]
+
+    def _random_phrase(self):
+        return ' '.join(
+            ''.join(random.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(random.randint(3, 9)))
+            for _ in range(random.randint(1, 3))
+        )
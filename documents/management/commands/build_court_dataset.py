@@ -0,0 +1,233 @@
+# documents/management/commands/build_court_dataset.py
+import collections
+import os
+import sqlite3
+import tempfile
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from documents.services.court_data.dataset import DATASET_PATH, SCHEMA_VERSION, normalize_county
+from documents.services.court_data.district_counties import COUNTY_DISTRICTS
+from documents.services.court_data.registry import CourtRegistry, normalize_city, source_fingerprint
+
+
+class Command(BaseCommand):
+    help = ('Compile the bundled court dataset (court_data/data/court_districts.sqlite3): '
+            'ZIP -> county -> federal district, plus every state\'s district lists and city index')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=str(DATASET_PATH),
+                            help='Where to write the SQLite file')
+        parser.add_argument('--allow-conflicts', action='store_true',
+                            help='Write the dataset even if a city is listed under two districts '
+                                 '(the first listing wins)')
+
+    def handle(self, *args, **options):
+        try:
+            # Build-time only: the generated file is committed, so the app
+            # itself never needs this package
+            import zipcodes
+        except ImportError:
+            raise CommandError('Building the court dataset requires the "zipcodes" package (pip install zipcodes)')
+
+        # Always compile from the state modules, never from a previous build
+        registry = CourtRegistry()
+        registry.load(use_dataset=False)
+        city_index = registry._compile_index(registry.lookups)
+
+        conflicts = self._find_conflicts(registry.lookups)
+        for state_code, city, district_keys in conflicts:
+            self.stderr.write(f"Conflict: {state_code} '{city}' is listed under {', '.join(district_keys)}")
+        if conflicts and not options['allow_conflicts']:
+            raise CommandError(f'{len(conflicts)} city listing conflict(s); fix the state lookup modules '
+                               'or pass --allow-conflicts')
+
+        zip_rows = [row for row in zipcodes.list_all() if row['county'] and row['state'] in registry.lookups]
+        counties = self._resolve_counties(registry, zip_rows)
+        self._report_county_disagreements(city_index, zip_rows, counties)
+        self._write(options['output'], zipcodes.__version__, registry, city_index, zip_rows, counties)
+
+        resolved = collections.Counter(confidence for _, confidence in counties.values())
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {options['output']}: {len(registry.lookups)} states, {len(city_index)} cities, "
+            f"{len(zip_rows)} ZIPs, {len(counties)} counties ({resolved['high']} high, "
+            f"{resolved['medium']} medium, {resolved[None]} unresolved)"
+        ))
+
+    def _find_conflicts(self, lookups):
+        """[(state, city, [district_key, ...])] for cities listed under more than one district"""
+        conflicts = []
+        for state_code, lookup in sorted(lookups.items()):
+            listed = collections.defaultdict(list)
+            for district_key, district_info in lookup.DISTRICTS.items():
+                for city in district_info.get('cities', []):
+                    if district_key not in listed[normalize_city(city)]:
+                        listed[normalize_city(city)].append(district_key)
+            conflicts.extend(
+                (state_code, city, district_keys)
+                for city, district_keys in listed.items() if len(district_keys) > 1
+            )
+        return conflicts
+
+    def _report_county_disagreements(self, city_index, zip_rows, counties):
+        """
+        Warn about listed cities whose counties all lie in another district.
+
+        These are not fatal: ZIP, county and place lookups answer from the
+        county data before the city lists are consulted.
+        """
+        city_districts = collections.defaultdict(set)
+        for row in zip_rows:
+            district_key, confidence = counties[(row['state'], normalize_county(row['county']))]
+            if confidence == 'high':
+                city_districts[(row['state'], normalize_city(row['city']))].add(district_key)
+
+        for (state_code, city), (_, district_key) in sorted(city_index.items(), key=lambda item: item[0]):
+            districts = city_districts.get((state_code, city), set())
+            if len(districts) == 1 and district_key not in districts:
+                self.stderr.write(
+                    f"Warning: {state_code} '{city}' is listed under {district_key}, "
+                    f"but its county is in {next(iter(districts))}"
+                )
+
+    def _resolve_counties(self, registry, zip_rows):
+        """
+        {(state, county): (district_key, confidence)} for every county in zip_rows.
+
+        1. Single-district states: the only district (high).
+        2. States in COUNTY_DISTRICTS: the statutory county lists (high).
+        3. Other states: the district every listed city in the county agrees
+           on (medium); counties with no or conflicting matches stay unresolved.
+        """
+        votes = collections.defaultdict(collections.Counter)
+        for row in zip_rows:
+            key = (row['state'], normalize_county(row['county']))
+            votes[key][registry.district_for_city(row['state'], row['city'])] += 1
+
+        statutory = {}
+        for state_code, districts in COUNTY_DISTRICTS.items():
+            for district_key, county_names in districts.items():
+                if district_key == 'DEFAULT':
+                    continue
+                for county in county_names:
+                    statutory[(state_code, normalize_county(county))] = district_key
+
+        counties = {}
+        for (state_code, county), counter in votes.items():
+            lookup = registry.lookups[state_code]
+            if len(lookup.DISTRICTS) == 1:
+                counties[(state_code, county)] = (next(iter(lookup.DISTRICTS)), 'high')
+            elif state_code in COUNTY_DISTRICTS:
+                district_key = statutory.get((state_code, county), COUNTY_DISTRICTS[state_code]['DEFAULT'])
+                counties[(state_code, county)] = (district_key, 'high')
+            else:
+                matched = [district_key for district_key in counter if district_key is not None]
+                if len(matched) == 1:
+                    counties[(state_code, county)] = (matched[0], 'medium')
+                else:
+                    counties[(state_code, county)] = (None, None)
+        return counties
+
+    def _write(self, output, source_version, registry, city_index, zip_rows, counties):
+        directory = os.path.dirname(output)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        os.close(fd)
+
+        connection = sqlite3.connect(tmp_path)
+        try:
+            connection.executescript("""
+                CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+                CREATE TABLE counties (
+                    id INTEGER PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    county TEXT NOT NULL,
+                    district TEXT,
+                    confidence TEXT,
+                    UNIQUE (state, county)
+                );
+                CREATE TABLE zips (zip INTEGER PRIMARY KEY, county_id INTEGER NOT NULL);
+                CREATE TABLE places (
+                    state TEXT NOT NULL,
+                    city TEXT NOT NULL,
+                    county_id INTEGER NOT NULL,
+                    PRIMARY KEY (state, city, county_id)
+                ) WITHOUT ROWID;
+                CREATE TABLE districts (
+                    state TEXT NOT NULL,
+                    state_name TEXT NOT NULL,
+                    district TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    PRIMARY KEY (state, district)
+                ) WITHOUT ROWID;
+                CREATE TABLE city_listings (
+                    state TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    district TEXT NOT NULL,
+                    city TEXT NOT NULL,
+                    PRIMARY KEY (state, position)
+                ) WITHOUT ROWID;
+                CREATE TABLE cities (
+                    state TEXT NOT NULL,
+                    city TEXT NOT NULL,
+                    district TEXT NOT NULL,
+                    PRIMARY KEY (state, city)
+                ) WITHOUT ROWID;
+            """)
+
+            self._write_districts(connection, registry, city_index)
+
+            county_ids = {}
+            for county_id, (key, (district_key, confidence)) in enumerate(sorted(counties.items()), start=1):
+                county_ids[key] = county_id
+                connection.execute(
+                    'INSERT INTO counties VALUES (?, ?, ?, ?, ?)',
+                    (county_id, key[0], key[1], district_key, confidence)
+                )
+
+            places = set()
+            for row in zip_rows:
+                county_id = county_ids[(row['state'], normalize_county(row['county']))]
+                # ZIPs that cross county lines are filed under their primary county
+                connection.execute('INSERT OR IGNORE INTO zips VALUES (?, ?)', (int(row['zip_code']), county_id))
+                for city in [row['city']] + row.get('acceptable_cities', []):
+                    places.add((row['state'], normalize_city(city), county_id))
+            connection.executemany('INSERT INTO places VALUES (?, ?, ?)', sorted(places))
+
+            connection.executemany('INSERT INTO meta VALUES (?, ?)', [
+                ('schema_version', str(SCHEMA_VERSION)),
+                ('dataset_version', f'{date.today():%Y.%m.%d}'),
+                ('zip_source', f'zipcodes {source_version}'),
+                ('source_fingerprint', source_fingerprint()),
+            ])
+            connection.commit()
+            connection.execute('VACUUM')
+        finally:
+            connection.close()
+
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output)
+
+    def _write_districts(self, connection, registry, city_index):
+        """State district names, city lists in order, and the compiled city index"""
+        for state_code, lookup in sorted(registry.lookups.items()):
+            position = 0
+            for district_position, (district_key, district_info) in enumerate(lookup.DISTRICTS.items()):
+                connection.execute(
+                    'INSERT INTO districts VALUES (?, ?, ?, ?, ?)',
+                    (state_code, lookup.STATE_NAME or state_code, district_key,
+                     district_info['name'], district_position)
+                )
+                for city in district_info.get('cities', []):
+                    connection.execute(
+                        'INSERT INTO city_listings VALUES (?, ?, ?, ?)',
+                        (state_code, position, district_key, city)
+                    )
+                    position += 1
+
+        connection.executemany('INSERT INTO cities VALUES (?, ?, ?)', [
+            (state_code, city, district_key)
+            for (state_code, city), (_, district_key) in city_index.items()
+        ])
@@ -0,0 +1,18 @@
+# Generated migration for evidence revision tracking
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0011_documentsection_ai_tracking'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lawsuitdocument',
+            name='evidence_revision',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Incremented whenever evidence, quotes or people change'),
+        ),
+    ]
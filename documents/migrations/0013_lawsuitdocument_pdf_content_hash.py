@@ -0,0 +1,18 @@
+# Generated migration for stored PDF content hash
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0012_lawsuitdocument_evidence_revision'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lawsuitdocument',
+            name='pdf_content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='Content hash of the sections pdf_file was rendered from', max_length=64),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0014_evidence_people_quotes_and_addons'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ViolationTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tag', models.CharField(help_text='Violation type, e.g. fourth_amendment', max_length=50)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='violation_tag_rows', to='documents.lawsuitdocument')),
+                ('quote', models.ForeignKey(blank=True, help_text='Empty for segment-level tags', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='tag_rows', to='documents.transcriptquote')),
+                ('video_evidence', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tag_rows', to='documents.videoevidence')),
+            ],
+            options={
+                'verbose_name': 'Violation Tag',
+                'verbose_name_plural': 'Violation Tags',
+                'indexes': [models.Index(fields=['document', 'tag'], name='documents_v_documen_e1db09_idx'), models.Index(fields=['tag', 'quote'], name='documents_v_tag_2d5e14_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='violationtag',
+            constraint=models.UniqueConstraint(condition=models.Q(('quote__isnull', True)), fields=('video_evidence', 'tag'), name='unique_segment_violation_tag'),
+        ),
+        migrations.AddConstraint(
+            model_name='violationtag',
+            constraint=models.UniqueConstraint(condition=models.Q(('quote__isnull', False)), fields=('quote', 'tag'), name='unique_quote_violation_tag'),
+        ),
+    ]
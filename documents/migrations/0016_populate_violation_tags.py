@@ -0,0 +1,48 @@
+# Backfill ViolationTag rows from the comma-separated violation_tags fields
+
+from django.db import migrations
+
+
+def parse_tags(value):
+    # Same as ViolationTag.parse (historical models have no custom methods)
+    return list(dict.fromkeys(tag.strip() for tag in (value or '').split(',') if tag.strip()))
+
+
+def populate_violation_tags(apps, schema_editor):
+    VideoEvidence = apps.get_model('documents', 'VideoEvidence')
+    TranscriptQuote = apps.get_model('documents', 'TranscriptQuote')
+    ViolationTag = apps.get_model('documents', 'ViolationTag')
+
+    rows = []
+    segments = VideoEvidence.objects.exclude(violation_tags='').values_list('pk', 'document_id', 'violation_tags')
+    for segment_id, document_id, value in segments.iterator():
+        rows.extend(
+            ViolationTag(document_id=document_id, video_evidence_id=segment_id, tag=tag)
+            for tag in parse_tags(value)
+        )
+
+    quotes = TranscriptQuote.objects.exclude(violation_tags='').values_list(
+        'pk', 'video_evidence_id', 'video_evidence__document_id', 'violation_tags'
+    )
+    for quote_id, segment_id, document_id, value in quotes.iterator():
+        rows.extend(
+            ViolationTag(document_id=document_id, video_evidence_id=segment_id, quote_id=quote_id, tag=tag)
+            for tag in parse_tags(value)
+        )
+
+    ViolationTag.objects.bulk_create(rows, batch_size=1000)
+
+
+def clear_violation_tags(apps, schema_editor):
+    apps.get_model('documents', 'ViolationTag').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0015_violationtag'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_violation_tags, clear_violation_tags),
+    ]
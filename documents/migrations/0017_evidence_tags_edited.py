@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-18 18:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0016_populate_violation_tags'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transcriptquote',
+            name='tags_edited',
+            field=models.BooleanField(default=False, help_text='User has set or cleared violation_tags; automatic tagging leaves them alone'),
+        ),
+        migrations.AddField(
+            model_name='videoevidence',
+            name='tags_edited',
+            field=models.BooleanField(default=False, help_text='User has set or cleared violation_tags; automatic tagging leaves them alone'),
+        ),
+    ]
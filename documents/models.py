@@ -1,5 +1,8 @@
 # documents/models.py
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.urls import reverse
 
@@ -74,6 +77,20 @@ class LawsuitDocument(models.Model):
     
     # Generated Files
     pdf_file = models.FileField(upload_to='documents/pdfs/', blank=True, null=True)
+    pdf_content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text="Content hash of the sections pdf_file was rendered from"
+    )
+
+    # Bumped on every VideoEvidence/TranscriptQuote/Person write (see signals below).
+    # Generated facts are cached against this value.
+    evidence_revision = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Incremented whenever evidence, quotes or people change"
+    )
 
     # Usage Tracking (New Pricing Model)
     # Base limits: Basic (2 AI, 5 min) | Standard (10 AI, 30 min)
@@ -117,6 +134,16 @@ class LawsuitDocument(models.Model):
     
     def get_absolute_url(self):
         return reverse('document_detail', kwargs={'pk': self.pk})
+
+    def save(self, *args, **kwargs):
+        # evidence_revision is only ever bumped atomically by the evidence signals.
+        # Never write it back from an in-memory copy that may be stale.
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'evidence_revision'
+            ]
+        super().save(*args, **kwargs)
     
     @property
     def full_incident_address(self):
@@ -360,6 +387,10 @@ class VideoEvidence(models.Model):
         blank=True,
         help_text="Comma-separated violation types: first_amendment,fourth_amendment,etc"
     )
+    tags_edited = models.BooleanField(
+        default=False,
+        help_text="User has set or cleared violation_tags; automatic tagging leaves them alone"
+    )
     notes = models.TextField(blank=True, help_text="User notes about this segment")
     
     # Status
@@ -552,6 +583,10 @@ class TranscriptQuote(models.Model):
         blank=True,
         help_text="Comma-separated violation types: fourth_amendment,first_amendment,excessive_force,etc"
     )
+    tags_edited = models.BooleanField(
+        default=False,
+        help_text="User has set or cleared violation_tags; automatic tagging leaves them alone"
+    )
 
     # User notes
     notes = models.TextField(blank=True, help_text="Additional context or notes about this quote")
@@ -587,4 +622,146 @@ class TranscriptQuote(models.Model):
     @property
     def formatted_citation(self):
         """Generate formatted citation for legal document"""
-        return f'At {self.full_timestamp}, {self.speaker.display_name} stated: "{self.text}"'
\ No newline at end of file
+        return f'At {self.full_timestamp}, {self.speaker.display_name} stated: "{self.text}"'
+
+
+class ViolationTag(models.Model):
+    """
+    One violation tag on a segment or quote.
+
+    Mirrors the comma-separated violation_tags fields (kept in sync by the
+    signals below), so tag filters and per-document rollups are indexed
+    queries instead of LIKE scans and string splitting.
+    """
+    document = models.ForeignKey(
+        LawsuitDocument,
+        on_delete=models.CASCADE,
+        related_name='violation_tag_rows'
+    )
+    video_evidence = models.ForeignKey(
+        VideoEvidence,
+        on_delete=models.CASCADE,
+        related_name='tag_rows'
+    )
+    quote = models.ForeignKey(
+        TranscriptQuote,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='tag_rows',
+        help_text="Empty for segment-level tags"
+    )
+    tag = models.CharField(max_length=50, help_text="Violation type, e.g. fourth_amendment")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['document', 'tag']),
+            models.Index(fields=['tag', 'quote']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['video_evidence', 'tag'],
+                condition=models.Q(quote__isnull=True),
+                name='unique_segment_violation_tag'
+            ),
+            models.UniqueConstraint(
+                fields=['quote', 'tag'],
+                condition=models.Q(quote__isnull=False),
+                name='unique_quote_violation_tag'
+            ),
+        ]
+        verbose_name = "Violation Tag"
+        verbose_name_plural = "Violation Tags"
+
+    def __str__(self):
+        return self.tag
+
+    @staticmethod
+    def parse(value):
+        """Unique, non-empty tags from a comma-separated string, in order"""
+        return list(dict.fromkeys(tag.strip() for tag in (value or '').split(',') if tag.strip()))
+
+
+# Signals to keep LawsuitDocument.evidence_revision current
+def bump_evidence_revision(document_filter):
+    """Atomically increment evidence_revision for the matching document."""
+    LawsuitDocument.objects.filter(**document_filter).update(
+        evidence_revision=F('evidence_revision') + 1
+    )
+
+
+@receiver(post_save, sender=VideoEvidence)
+@receiver(post_delete, sender=VideoEvidence)
+@receiver(post_save, sender=Person)
+@receiver(post_delete, sender=Person)
+def bump_revision_for_document_evidence(sender, instance, **kwargs):
+    """Invalidate cached facts when a segment or person changes"""
+    bump_evidence_revision({'pk': instance.document_id})
+
+
+@receiver(post_save, sender=TranscriptQuote)
+@receiver(post_delete, sender=TranscriptQuote)
+def bump_revision_for_quote(sender, instance, **kwargs):
+    """Invalidate cached facts when a quote changes"""
+    bump_evidence_revision({'video_evidence__id': instance.video_evidence_id})
+
+
+# Signals to keep ViolationTag rows in step with the violation_tags fields;
+# rows of deleted segments and quotes go with them via CASCADE
+@receiver(post_save, sender=VideoEvidence)
+def sync_segment_violation_tags(sender, instance, update_fields=None, **kwargs):
+    """Rewrite a segment's tag rows when its violation_tags may have changed"""
+    if update_fields is not None and 'violation_tags' not in update_fields:
+        return
+    from documents.services.violation_tag_service import ViolationTagService
+    ViolationTagService.sync_segments([instance])
+
+
+@receiver(post_save, sender=TranscriptQuote)
+def sync_quote_violation_tags(sender, instance, update_fields=None, **kwargs):
+    """Rewrite a quote's tag rows when its violation_tags may have changed"""
+    if update_fields is not None and 'violation_tags' not in update_fields:
+        return
+    from documents.services.violation_tag_service import ViolationTagService
+    ViolationTagService.sync_quotes([instance])
+
+
+@receiver(post_save, sender=LegalTemplate)
+@receiver(post_delete, sender=LegalTemplate)
+def invalidate_template_catalog(sender, instance, **kwargs):
+    """Make every process reload its template catalog once the change is committed"""
+    from documents.services.template_catalog import TemplateCatalog
+    transaction.on_commit(TemplateCatalog.bump_version)
+
+
+@receiver(post_save, sender=DocumentSection)
+@receiver(post_delete, sender=DocumentSection)
+def schedule_pdf_rerender(sender, instance, **kwargs):
+    """Queue a background re-render once a section edit is committed"""
+    from documents.services.pdf_render_service import PDFRenderService
+    document_id = instance.document_id
+    transaction.on_commit(lambda: PDFRenderService.schedule_render(document_id))
+
+
+@receiver(post_save, sender=LawsuitDocument)
+@receiver(post_delete, sender=LawsuitDocument)
+def invalidate_document_stats(sender, instance, **kwargs):
+    """Drop the owner's cached dashboard counts once the change is committed"""
+    from documents.services.document_stats_service import DocumentStatsService
+    user_id = instance.user_id
+    transaction.on_commit(lambda: DocumentStatsService.invalidate(user_id))
+
+
+@receiver(post_save, sender=DocumentSection)
+@receiver(post_delete, sender=DocumentSection)
+def invalidate_section_stats(sender, instance, **kwargs):
+    """AI-enhanced section counts are part of the owner's cached stats"""
+    from documents.services.document_stats_service import DocumentStatsService
+    if DocumentSection.document.is_cached(instance):
+        user_id = instance.document.user_id
+    else:
+        # Sections saved through document.sections (section generation, the
+        # populator) carry their document; only one-off edits get here
+        user_id = LawsuitDocument.objects.filter(pk=instance.document_id).values_list('user_id', flat=True).first()
+    if user_id is not None:
+        transaction.on_commit(lambda: DocumentStatsService.invalidate(user_id))
@@ -102,26 +102,7 @@ class AIEnhancementService:
                 'fallback_to_template': True
             }
 
-        # UNLIMITED PLAN - Check api_credit_balance
-        if subscription.plan_type == 'unlimited' and subscription.is_active:
-            if subscription.api_credit_balance >= Decimal(str(estimated_cost)):
-                return {
-                    'allowed': True,
-                    'remaining_budget': float(subscription.api_credit_balance),
-                    'estimated_cost': estimated_cost,
-                    'plan_type': 'unlimited'
-                }
-            else:
-                return {
-                    'allowed': False,
-                    'reason': 'Monthly API credit exhausted',
-                    'remaining_budget': float(subscription.api_credit_balance),
-                    'estimated_cost': estimated_cost,
-                    'upgrade_prompt': f"You've used your ${subscription.monthly_credit_amount}/month AI credit. More credit will be added next month.",
-                    'fallback_to_template': True
-                }
-
-        # FREE or PAY_PER_DOC PLAN - Check api_cost_limit
+        # Check api_cost_limit
         remaining = profile.remaining_api_budget
 
         if remaining >= estimated_cost:
@@ -527,25 +508,14 @@ Output only the parties section content."""
     @transaction.atomic
     def _track_api_cost(user, cost, plan_type):
         """
-        Track API cost in user's profile and subscription.
-        Uses atomic transaction to ensure consistency.
+        Track API cost in user's profile.
         """
-        from accounts.models import Subscription
-
         cost_decimal = Decimal(str(cost))
 
         # Always track in UserProfile.total_api_cost
         profile = user.profile
         profile.add_api_cost(cost_decimal)
 
-        # For unlimited users, also deduct from api_credit_balance
-        if plan_type == 'unlimited':
-            try:
-                subscription = user.subscription
-                subscription.deduct_api_cost(cost_decimal)
-            except Subscription.DoesNotExist:
-                pass
-
     @classmethod
     def get_estimated_document_cost(cls, section_types=None):
         """
@@ -0,0 +1,178 @@
+# documents/services/court_data/dataset.py
+"""
+Bundled court dataset: ZIP -> county -> federal district, plus the state
+district lists compiled from court_data/states.
+
+data/court_districts.sqlite3 is generated by the build_court_dataset
+management command and committed to the repo. It is opened read-only and
+memory-mapped, so lookups need no network and no Django database, and the
+pages are shared between worker processes. Each process and thread opens
+its own connection on first use.
+
+Tables:
+    meta(key, value)                      dataset/schema version, sources, source fingerprint
+    counties(id, state, county, district, confidence)
+    zips(zip, county_id)                  5-digit ZIP as INTEGER primary key
+    places(state, city, county_id)        city names seen in each county
+    districts(state, state_name, district, name, position)
+    city_listings(state, district, city, position)   the DISTRICTS city lists, in order
+    cities(state, city, district)         compiled city index (one district per city)
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+
+SCHEMA_VERSION = 2
+
+DATASET_PATH = Path(__file__).resolve().parent / 'data' / 'court_districts.sqlite3'
+
+# County-equivalent suffixes dropped when normalizing county names
+COUNTY_SUFFIX_RE = re.compile(
+    r'\s+(county|parish|borough|census area|city and borough|municipality|municipio)$'
+)
+
+
+def normalize_county(county):
+    """Lowercase, no periods, no "County"/"Parish" suffix, collapsed whitespace"""
+    county = ' '.join(county.lower().replace('.', '').split())
+    return COUNTY_SUFFIX_RE.sub('', county)
+
+
+class CourtDataset:
+    """Read-only access to the bundled court dataset"""
+
+    # Map the whole file; it is a few MB
+    MMAP_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, path=DATASET_PATH):
+        self.path = Path(path)
+        self._local = threading.local()
+
+    @property
+    def available(self):
+        """Whether the dataset file has been built"""
+        return self.path.exists()
+
+    def _connection(self):
+        # Keyed on the pid too: the registry loads in AppConfig.ready() in the
+        # gunicorn master, and a forked worker inherits that thread's locals,
+        # but a SQLite connection must not be used across a fork
+        pid = os.getpid()
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != pid:
+            connection = sqlite3.connect(
+                f'file:{self.path}?mode=ro&immutable=1', uri=True, check_same_thread=False
+            )
+            connection.execute(f'PRAGMA mmap_size = {self.MMAP_SIZE}')
+            self._local.connection = connection
+            self._local.pid = pid
+        return connection
+
+    def _fetchone(self, sql, params):
+        if not self.available:
+            return None
+        return self._connection().execute(sql, params).fetchone()
+
+    def _fetchall(self, sql, params=()):
+        if not self.available:
+            return []
+        return self._connection().execute(sql, params).fetchall()
+
+    def meta(self, key):
+        """A value from the meta table, or None"""
+        row = self._fetchone("SELECT value FROM meta WHERE key = ?", (key,))
+        return row[0] if row else None
+
+    @property
+    def version(self):
+        """Dataset version string from the meta table, or None if not built"""
+        return self.meta('dataset_version')
+
+    def district_rows(self):
+        """[(state, state_name, district, name)] in DISTRICTS order"""
+        return self._fetchall(
+            "SELECT state, state_name, district, name FROM districts ORDER BY state, position"
+        )
+
+    def city_listing_rows(self):
+        """[(state, district, city)] in DISTRICTS list order"""
+        return self._fetchall(
+            "SELECT state, district, city FROM city_listings ORDER BY state, position"
+        )
+
+    def city_index_rows(self):
+        """[(state, city, district)] from the compiled city index"""
+        return self._fetchall("SELECT state, city, district FROM cities")
+
+    def zip_codes(self):
+        """[(zip, state)] for every ZIP in the dataset, as 5-digit strings"""
+        return [
+            (f'{zip_code:05d}', state)
+            for zip_code, state in self._fetchall(
+                'SELECT z.zip, c.state FROM zips z JOIN counties c ON c.id = z.county_id'
+            )
+        ]
+
+    def lookup_zip(self, zip_code):
+        """
+        Resolve a ZIP (5 or 9 digits, any punctuation) to its primary county.
+
+        Returns:
+            (state, county, district, confidence) or None. district is None
+            when the county's district could not be determined at build time.
+        """
+        digits = re.sub(r'\D', '', str(zip_code or ''))[:5]
+        if len(digits) != 5:
+            return None
+        return self._fetchone(
+            "SELECT c.state, c.county, c.district, c.confidence "
+            "FROM zips z JOIN counties c ON c.id = z.county_id WHERE z.zip = ?",
+            (int(digits),)
+        )
+
+    def lookup_county(self, state, county):
+        """
+        Returns:
+            (state, county, district, confidence) or None
+        """
+        if not state or not county:
+            return None
+        return self._fetchone(
+            "SELECT state, county, district, confidence FROM counties "
+            "WHERE state = ? AND county = ?",
+            (state.strip().upper(), normalize_county(county))
+        )
+
+    def lookup_place(self, state, city):
+        """
+        Resolve a city name through the counties it appears in.
+
+        Only answers when every county the name appears in lies in the same
+        district, so a town name shared across districts is never guessed.
+
+        Returns:
+            (state, county, district, confidence) or None. county is None
+            when the name spans several counties.
+        """
+        if not self.available or not state or not city:
+            return None
+        rows = self._connection().execute(
+            "SELECT c.state, c.county, c.district, c.confidence "
+            "FROM places p JOIN counties c ON c.id = p.county_id "
+            "WHERE p.state = ? AND p.city = ?",
+            (state.strip().upper(), ' '.join(city.lower().split()))
+        ).fetchall()
+        districts = {row[2] for row in rows}
+        if len(districts) != 1 or None in districts:
+            return None
+
+        state, county, district, _ = rows[0]
+        confidence = 'high' if all(row[3] == 'high' for row in rows) else 'medium'
+        return state, county if len(rows) == 1 else None, district, confidence
+
+
+court_dataset = CourtDataset()
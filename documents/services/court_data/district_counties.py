@@ -0,0 +1,432 @@
+# documents/services/court_data/district_counties.py
+"""
+County composition of federal judicial districts (28 U.S.C. §§ 81-131).
+
+Every multi-district state is listed. For each state, the counties of
+every district except the DEFAULT one are listed; any other county in the
+state belongs to DEFAULT. County names are lowercase without the "County"
+suffix; Virginia's independent cities carry a " city" suffix, as in the ZIP
+data.
+
+A state that is split into districts later and not yet listed here falls
+back to city-list agreement when the court dataset is built (see the
+build_court_dataset command).
+"""
+
+COUNTY_DISTRICTS = {
+    # 28 U.S.C. § 81
+    'AL': {
+        'DEFAULT': 'northern',
+        'middle': [
+            'autauga', 'barbour', 'bullock', 'butler', 'chambers', 'chilton',
+            'coffee', 'coosa', 'covington', 'crenshaw', 'dale', 'elmore',
+            'geneva', 'henry', 'houston', 'lee', 'lowndes', 'macon',
+            'montgomery', 'pike', 'randolph', 'russell', 'tallapoosa',
+        ],
+        'southern': [
+            'baldwin', 'choctaw', 'clarke', 'conecuh', 'dallas', 'escambia',
+            'hale', 'marengo', 'mobile', 'monroe', 'perry', 'washington',
+            'wilcox',
+        ],
+    },
+
+    # 28 U.S.C. § 83
+    'AR': {
+        'DEFAULT': 'eastern',
+        'western': [
+            'ashley', 'baxter', 'benton', 'boone', 'bradley', 'calhoun',
+            'carroll', 'clark', 'columbia', 'crawford', 'franklin', 'garland',
+            'hempstead', 'hot spring', 'howard', 'johnson', 'lafayette',
+            'little river', 'logan', 'madison', 'marion', 'miller',
+            'montgomery', 'nevada', 'newton', 'ouachita', 'pike', 'polk',
+            'scott', 'searcy', 'sebastian', 'sevier', 'union', 'washington',
+        ],
+    },
+
+    # 28 U.S.C. § 84
+    'CA': {
+        'DEFAULT': 'northern',
+        'central': [
+            'los angeles', 'orange', 'riverside', 'san bernardino',
+            'san luis obispo', 'santa barbara', 'ventura',
+        ],
+        'eastern': [
+            'alpine', 'amador', 'butte', 'calaveras', 'colusa', 'el dorado',
+            'fresno', 'glenn', 'inyo', 'kern', 'kings', 'lassen', 'madera',
+            'mariposa', 'merced', 'modoc', 'mono', 'nevada', 'placer', 'plumas',
+            'sacramento', 'san joaquin', 'shasta', 'sierra', 'siskiyou',
+            'solano', 'stanislaus', 'sutter', 'tehama', 'trinity', 'tulare',
+            'tuolumne', 'yolo', 'yuba',
+        ],
+        'southern': ['imperial', 'san diego'],
+    },
+
+    # 28 U.S.C. § 89
+    'FL': {
+        'DEFAULT': 'middle',
+        'northern': [
+            'alachua', 'bay', 'calhoun', 'dixie', 'escambia', 'franklin',
+            'gadsden', 'gilchrist', 'gulf', 'holmes', 'jackson', 'jefferson',
+            'lafayette', 'leon', 'levy', 'liberty', 'madison', 'okaloosa',
+            'santa rosa', 'taylor', 'wakulla', 'walton', 'washington',
+        ],
+        'southern': [
+            'broward', 'miami-dade', 'highlands', 'indian river', 'martin',
+            'monroe', 'okeechobee', 'palm beach', 'st. lucie',
+        ],
+    },
+
+    # 28 U.S.C. § 90
+    'GA': {
+        'DEFAULT': 'middle',
+        'northern': [
+            'banks', 'barrow', 'bartow', 'carroll', 'catoosa', 'chattooga',
+            'cherokee', 'clayton', 'cobb', 'coweta', 'dade', 'dawson', 'dekalb',
+            'douglas', 'fannin', 'fayette', 'floyd', 'forsyth', 'fulton',
+            'gilmer', 'gordon', 'gwinnett', 'habersham', 'hall', 'haralson',
+            'heard', 'henry', 'jackson', 'lumpkin', 'meriwether', 'murray',
+            'newton', 'paulding', 'pickens', 'pike', 'polk', 'rabun',
+            'rockdale', 'spalding', 'stephens', 'towns', 'troup', 'union',
+            'walker', 'white', 'whitfield',
+        ],
+        'southern': [
+            'appling', 'atkinson', 'bacon', 'brantley', 'bryan', 'bulloch',
+            'burke', 'camden', 'candler', 'charlton', 'chatham', 'coffee',
+            'columbia', 'dodge', 'effingham', 'emanuel', 'evans', 'glascock',
+            'glynn', 'jeff davis', 'jefferson', 'jenkins', 'johnson', 'laurens',
+            'liberty', 'lincoln', 'long', 'mcduffie', 'mcintosh', 'montgomery',
+            'pierce', 'richmond', 'screven', 'taliaferro', 'tattnall',
+            'telfair', 'toombs', 'treutlen', 'ware', 'warren', 'wayne',
+            'wheeler', 'wilkes',
+        ],
+    },
+
+    # 28 U.S.C. § 95
+    'IA': {
+        'DEFAULT': 'southern',
+        'northern': [
+            'allamakee', 'benton', 'black hawk', 'bremer', 'buchanan',
+            'buena vista', 'butler', 'calhoun', 'carroll', 'cedar',
+            'cerro gordo', 'cherokee', 'chickasaw', 'clay', 'clayton',
+            'crawford', 'delaware', 'dickinson', 'dubuque', 'emmet', 'fayette',
+            'floyd', 'franklin', 'grundy', 'hamilton', 'hancock', 'hardin',
+            'howard', 'humboldt', 'ida', 'iowa', 'jackson', 'jones', 'kossuth',
+            'linn', 'lyon', 'mitchell', 'monona', "o'brien", 'osceola',
+            'palo alto', 'plymouth', 'pocahontas', 'sac', 'sioux', 'tama',
+            'webster', 'winnebago', 'winneshiek', 'woodbury', 'worth', 'wright',
+        ],
+    },
+
+    # 28 U.S.C. § 93
+    'IL': {
+        'DEFAULT': 'central',
+        'northern': [
+            'boone', 'carroll', 'cook', 'dekalb', 'dupage', 'grundy',
+            'jo daviess', 'kane', 'kendall', 'lake', 'lasalle', 'lee',
+            'mchenry', 'ogle', 'stephenson', 'whiteside', 'will', 'winnebago',
+        ],
+        'southern': [
+            'alexander', 'bond', 'calhoun', 'clark', 'clay', 'clinton',
+            'crawford', 'cumberland', 'edwards', 'effingham', 'fayette',
+            'franklin', 'gallatin', 'hamilton', 'hardin', 'jackson', 'jasper',
+            'jefferson', 'jersey', 'johnson', 'lawrence', 'madison', 'marion',
+            'massac', 'monroe', 'perry', 'pope', 'pulaski', 'randolph',
+            'richland', 'st. clair', 'saline', 'union', 'wabash', 'washington',
+            'wayne', 'white', 'williamson',
+        ],
+    },
+
+    # 28 U.S.C. § 94
+    'IN': {
+        'DEFAULT': 'southern',
+        'northern': [
+            'adams', 'allen', 'benton', 'blackford', 'carroll', 'cass',
+            'dekalb', 'elkhart', 'fulton', 'grant', 'huntington', 'jasper',
+            'jay', 'kosciusko', 'la porte', 'lagrange', 'lake', 'marshall',
+            'miami', 'newton', 'noble', 'porter', 'pulaski', 'st. joseph',
+            'starke', 'steuben', 'tippecanoe', 'wabash', 'warren', 'wells',
+            'white', 'whitley',
+            # Spellings that also occur in the ZIP data
+            'laporte',
+        ],
+    },
+
+    # 28 U.S.C. § 97
+    'KY': {
+        'DEFAULT': 'eastern',
+        'western': [
+            'adair', 'allen', 'ballard', 'barren', 'breckinridge', 'bullitt',
+            'butler', 'caldwell', 'calloway', 'carlisle', 'casey', 'christian',
+            'clinton', 'crittenden', 'cumberland', 'daviess', 'edmonson',
+            'fulton', 'graves', 'grayson', 'green', 'hancock', 'hardin', 'hart',
+            'henderson', 'hickman', 'hopkins', 'jefferson', 'larue',
+            'livingston', 'logan', 'lyon', 'marion', 'marshall', 'mccracken',
+            'mclean', 'meade', 'metcalfe', 'monroe', 'muhlenberg', 'nelson',
+            'ohio', 'oldham', 'russell', 'simpson', 'spencer', 'taylor', 'todd',
+            'trigg', 'union', 'warren', 'washington', 'webster',
+        ],
+    },
+
+    # 28 U.S.C. § 98
+    'LA': {
+        'DEFAULT': 'western',
+        'eastern': [
+            'assumption', 'jefferson', 'lafourche', 'orleans', 'plaquemines',
+            'st. bernard', 'st. charles', 'st. james', 'st. john the baptist',
+            'st. tammany', 'tangipahoa', 'terrebonne', 'washington',
+        ],
+        'middle': [
+            'ascension', 'east baton rouge', 'east feliciana', 'iberville',
+            'livingston', 'pointe coupee', 'st. helena', 'west baton rouge',
+            'west feliciana',
+        ],
+    },
+
+    # 28 U.S.C. § 102
+    'MI': {
+        'DEFAULT': 'eastern',
+        'western': [
+            'alger', 'allegan', 'antrim', 'baraga', 'barry', 'benzie',
+            'berrien', 'branch', 'calhoun', 'cass', 'charlevoix', 'chippewa',
+            'clinton', 'delta', 'dickinson', 'eaton', 'emmet', 'gogebic',
+            'grand traverse', 'hillsdale', 'houghton', 'ingham', 'ionia', 'iron',
+            'kalamazoo', 'kalkaska', 'kent', 'keweenaw', 'lake', 'leelanau',
+            'luce', 'mackinac', 'manistee', 'marquette', 'mason', 'mecosta',
+            'menominee', 'missaukee', 'montcalm', 'muskegon', 'newaygo',
+            'oceana', 'ontonagon', 'osceola', 'ottawa', 'st. joseph',
+            'schoolcraft', 'van buren', 'wexford',
+        ],
+    },
+
+    # 28 U.S.C. § 105
+    'MO': {
+        'DEFAULT': 'western',
+        'eastern': [
+            'adair', 'audrain', 'bollinger', 'butler', 'cape girardeau',
+            'carter', 'chariton', 'clark', 'crawford', 'dent', 'dunklin',
+            'franklin', 'gasconade', 'iron', 'jefferson', 'knox', 'lewis',
+            'lincoln', 'linn', 'macon', 'madison', 'maries', 'marion',
+            'mississippi', 'monroe', 'montgomery', 'new madrid', 'pemiscot',
+            'perry', 'phelps', 'pike', 'ralls', 'randolph', 'reynolds',
+            'ripley', 'st. charles', 'st. francois', 'st. louis',
+            'st. louis city', 'ste. genevieve', 'schuyler', 'scotland', 'scott',
+            'shannon', 'shelby', 'stoddard', 'warren', 'washington', 'wayne',
+        ],
+    },
+
+    # 28 U.S.C. § 104
+    'MS': {
+        'DEFAULT': 'southern',
+        'northern': [
+            'alcorn', 'attala', 'benton', 'bolivar', 'calhoun', 'carroll',
+            'chickasaw', 'choctaw', 'clay', 'coahoma', 'desoto', 'grenada',
+            'humphreys', 'itawamba', 'lafayette', 'lee', 'leflore', 'lowndes',
+            'marshall', 'monroe', 'montgomery', 'noxubee', 'oktibbeha',
+            'panola', 'pontotoc', 'prentiss', 'quitman', 'sunflower',
+            'tallahatchie', 'tate', 'tippah', 'tishomingo', 'tunica', 'union',
+            'washington', 'webster', 'winston', 'yalobusha',
+        ],
+    },
+
+    # 28 U.S.C. § 113
+    'NC': {
+        'DEFAULT': 'eastern',
+        'middle': [
+            'alamance', 'cabarrus', 'caswell', 'chatham', 'davidson', 'davie',
+            'durham', 'forsyth', 'guilford', 'hoke', 'lee', 'montgomery',
+            'moore', 'orange', 'person', 'randolph', 'richmond', 'rockingham',
+            'rowan', 'scotland', 'stanly', 'stokes', 'surry', 'yadkin',
+        ],
+        'western': [
+            'alexander', 'alleghany', 'anson', 'ashe', 'avery', 'buncombe',
+            'burke', 'caldwell', 'catawba', 'cherokee', 'clay', 'cleveland',
+            'gaston', 'graham', 'haywood', 'henderson', 'iredell', 'jackson',
+            'lincoln', 'macon', 'madison', 'mcdowell', 'mecklenburg',
+            'mitchell', 'polk', 'rutherford', 'swain', 'transylvania', 'union',
+            'watauga', 'wilkes', 'yancey',
+        ],
+    },
+
+    # 28 U.S.C. § 112
+    'NY': {
+        'DEFAULT': 'northern',
+        'eastern': ['kings', 'nassau', 'queens', 'richmond', 'suffolk'],
+        'southern': [
+            'bronx', 'dutchess', 'new york', 'orange', 'putnam', 'rockland',
+            'sullivan', 'westchester',
+        ],
+        'western': [
+            'allegany', 'cattaraugus', 'chautauqua', 'chemung', 'erie',
+            'genesee', 'livingston', 'monroe', 'niagara', 'ontario', 'orleans',
+            'schuyler', 'seneca', 'steuben', 'wayne', 'wyoming', 'yates',
+        ],
+    },
+
+    # 28 U.S.C. § 115
+    'OH': {
+        'DEFAULT': 'northern',
+        'southern': [
+            'adams', 'athens', 'belmont', 'brown', 'butler', 'champaign',
+            'clark', 'clermont', 'clinton', 'coshocton', 'darke', 'delaware',
+            'fairfield', 'fayette', 'franklin', 'gallia', 'greene', 'guernsey',
+            'hamilton', 'harrison', 'highland', 'hocking', 'jackson',
+            'jefferson', 'knox', 'lawrence', 'licking', 'logan', 'madison',
+            'meigs', 'miami', 'monroe', 'montgomery', 'morgan', 'morrow',
+            'muskingum', 'noble', 'perry', 'pickaway', 'pike', 'preble', 'ross',
+            'scioto', 'shelby', 'union', 'vinton', 'warren', 'washington',
+        ],
+    },
+
+    # 28 U.S.C. § 116
+    'OK': {
+        'DEFAULT': 'western',
+        'eastern': [
+            'adair', 'atoka', 'bryan', 'carter', 'cherokee', 'choctaw', 'coal',
+            'haskell', 'hughes', 'johnston', 'latimer', 'le flore', 'love',
+            'marshall', 'mccurtain', 'mcintosh', 'murray', 'muskogee',
+            'okfuskee', 'okmulgee', 'pittsburg', 'pontotoc', 'pushmataha',
+            'seminole', 'sequoyah', 'wagoner',
+        ],
+        'northern': [
+            'craig', 'creek', 'delaware', 'mayes', 'nowata', 'osage', 'ottawa',
+            'pawnee', 'rogers', 'tulsa', 'washington',
+        ],
+    },
+
+    # 28 U.S.C. § 118
+    'PA': {
+        'DEFAULT': 'western',
+        'eastern': [
+            'berks', 'bucks', 'chester', 'delaware', 'lancaster', 'lehigh',
+            'montgomery', 'northampton', 'philadelphia',
+        ],
+        'middle': [
+            'adams', 'bradford', 'cameron', 'carbon', 'centre', 'clinton',
+            'columbia', 'cumberland', 'dauphin', 'franklin', 'fulton',
+            'huntingdon', 'juniata', 'lackawanna', 'lebanon', 'luzerne',
+            'lycoming', 'mifflin', 'monroe', 'montour', 'northumberland',
+            'perry', 'pike', 'potter', 'schuylkill', 'snyder', 'sullivan',
+            'susquehanna', 'tioga', 'union', 'wayne', 'wyoming', 'york',
+        ],
+    },
+
+    # 28 U.S.C. § 123
+    'TN': {
+        'DEFAULT': 'middle',
+        'eastern': [
+            'anderson', 'bedford', 'bledsoe', 'blount', 'bradley', 'campbell',
+            'carter', 'claiborne', 'cocke', 'coffee', 'franklin', 'grainger',
+            'greene', 'grundy', 'hamblen', 'hamilton', 'hancock', 'hawkins',
+            'jefferson', 'johnson', 'knox', 'lincoln', 'loudon', 'marion',
+            'mcminn', 'meigs', 'monroe', 'moore', 'morgan', 'polk', 'rhea',
+            'roane', 'scott', 'sequatchie', 'sevier', 'sullivan', 'unicoi',
+            'union', 'van buren', 'warren', 'washington',
+        ],
+        'western': [
+            'benton', 'carroll', 'chester', 'crockett', 'decatur', 'dyer',
+            'fayette', 'gibson', 'hardeman', 'hardin', 'haywood', 'henderson',
+            'henry', 'lake', 'lauderdale', 'madison', 'mcnairy', 'obion',
+            'perry', 'shelby', 'tipton', 'weakley',
+        ],
+    },
+
+    # 28 U.S.C. § 124
+    'TX': {
+        'DEFAULT': 'northern',
+        'eastern': [
+            'anderson', 'angelina', 'bowie', 'camp', 'cass', 'cherokee',
+            'collin', 'cooke', 'delta', 'denton', 'fannin', 'franklin',
+            'grayson', 'gregg', 'hardin', 'harrison', 'henderson', 'hopkins',
+            'houston', 'jasper', 'jefferson', 'lamar', 'liberty', 'marion',
+            'morris', 'nacogdoches', 'newton', 'orange', 'panola', 'polk',
+            'rains', 'red river', 'rusk', 'sabine', 'san augustine', 'shelby',
+            'smith', 'titus', 'trinity', 'tyler', 'upshur', 'van zandt', 'wood',
+        ],
+        'southern': [
+            'aransas', 'austin', 'bee', 'brazoria', 'brazos', 'brooks',
+            'calhoun', 'cameron', 'chambers', 'colorado', 'dewitt', 'duval',
+            'fayette', 'fort bend', 'galveston', 'goliad', 'grimes', 'harris',
+            'hidalgo', 'jackson', 'jim hogg', 'jim wells', 'kenedy', 'kleberg',
+            'la salle', 'lavaca', 'live oak', 'madison', 'matagorda',
+            'mcmullen', 'montgomery', 'nueces', 'refugio', 'san jacinto',
+            'san patricio', 'starr', 'victoria', 'walker', 'waller', 'webb',
+            'wharton', 'willacy', 'zapata',
+            # Spellings that also occur in the ZIP data
+            'de witt',
+        ],
+        'western': [
+            'andrews', 'atascosa', 'bandera', 'bastrop', 'bell', 'bexar',
+            'blanco', 'bosque', 'brewster', 'burleson', 'burnet', 'caldwell',
+            'comal', 'coryell', 'crane', 'culberson', 'dimmit', 'ector',
+            'edwards', 'el paso', 'falls', 'freestone', 'frio', 'gillespie',
+            'gonzales', 'guadalupe', 'hamilton', 'hays', 'hill', 'hudspeth',
+            'jeff davis', 'karnes', 'kendall', 'kerr', 'kimble', 'kinney',
+            'lampasas', 'lee', 'leon', 'limestone', 'llano', 'loving', 'martin',
+            'mason', 'maverick', 'mcculloch', 'mclennan', 'medina', 'midland',
+            'milam', 'pecos', 'presidio', 'real', 'reeves', 'robertson',
+            'san saba', 'somervell', 'terrell', 'travis', 'upton', 'uvalde',
+            'val verde', 'ward', 'washington', 'williamson', 'wilson',
+            'winkler', 'zavala',
+        ],
+    },
+
+    # 28 U.S.C. § 127
+    'VA': {
+        'DEFAULT': 'western',
+        'eastern': [
+            'accomack', 'alexandria city', 'amelia', 'arlington', 'brunswick',
+            'caroline', 'charles city', 'chesapeake city', 'chesterfield',
+            'colonial heights city', 'dinwiddie', 'emporia city', 'essex',
+            'fairfax', 'fairfax city', 'falls church city', 'fauquier',
+            'franklin city', 'fredericksburg city', 'gloucester', 'goochland',
+            'greensville', 'hampton city', 'hanover', 'henrico',
+            'hopewell city', 'isle of wight', 'james city', 'king and queen',
+            'king george', 'king william', 'lancaster', 'loudoun', 'lunenburg',
+            'manassas city', 'manassas park city', 'mathews', 'mecklenburg',
+            'middlesex', 'new kent', 'newport news city', 'norfolk city',
+            'northampton', 'northumberland', 'nottoway', 'petersburg city',
+            'poquoson city', 'portsmouth city', 'powhatan', 'prince edward',
+            'prince george', 'prince william', 'richmond', 'richmond city',
+            'southampton', 'spotsylvania', 'stafford', 'suffolk city', 'surry',
+            'sussex', 'virginia beach city', 'westmoreland',
+            'williamsburg city', 'york',
+        ],
+    },
+
+    # 28 U.S.C. § 128
+    'WA': {
+        'DEFAULT': 'western',
+        'eastern': [
+            'adams', 'asotin', 'benton', 'chelan', 'columbia', 'douglas',
+            'ferry', 'franklin', 'garfield', 'grant', 'kittitas', 'klickitat',
+            'lincoln', 'okanogan', 'pend oreille', 'spokane', 'stevens',
+            'walla walla', 'whitman', 'yakima',
+        ],
+    },
+
+    # 28 U.S.C. § 130
+    'WI': {
+        'DEFAULT': 'eastern',
+        'western': [
+            'adams', 'ashland', 'barron', 'bayfield', 'buffalo', 'burnett',
+            'chippewa', 'clark', 'columbia', 'crawford', 'dane', 'douglas',
+            'dunn', 'eau claire', 'grant', 'green', 'iowa', 'iron', 'jackson',
+            'jefferson', 'juneau', 'la crosse', 'lafayette', 'lincoln',
+            'marathon', 'monroe', 'oneida', 'pepin', 'pierce', 'polk', 'portage',
+            'price', 'richland', 'rock',
+            'rusk', 'st. croix', 'sauk', 'sawyer', 'taylor', 'trempealeau',
+            'vernon', 'vilas', 'washburn', 'wood',
+        ],
+    },
+
+    # 28 U.S.C. § 129
+    'WV': {
+        'DEFAULT': 'northern',
+        'southern': [
+            'boone', 'cabell', 'clay', 'fayette', 'greenbrier', 'jackson',
+            'kanawha', 'lincoln', 'logan', 'mason', 'mcdowell', 'mercer',
+            'mingo', 'monroe', 'nicholas', 'putnam', 'raleigh', 'roane',
+            'summers', 'wayne', 'wirt', 'wood', 'wyoming',
+        ],
+    },
+}
@@ -0,0 +1,150 @@
+# documents/services/court_data/fuzzy_index.py
+"""
+Fuzzy city matching for court lookup.
+
+Every city in the state DISTRICTS lists is reduced to a canonical form
+(punctuation stripped, "St."/"Ft."/"Mt." style abbreviations expanded) and
+indexed by character trigram. A query is canonicalized the same way, the
+trigram postings pick a handful of candidates in the same state, and those
+are ranked by edit distance. Built once per process by the court registry.
+"""
+
+import re
+from collections import Counter
+
+
+# Abbreviations expanded token by token, on both sides of the match
+ABBREVIATIONS = {
+    'st': 'saint',
+    'ste': 'sainte',
+    'ft': 'fort',
+    'mt': 'mount',
+    'mtn': 'mountain',
+    'pt': 'point',
+    'hts': 'heights',
+    'spgs': 'springs',
+    'spg': 'springs',
+    'jct': 'junction',
+    'twp': 'township',
+    'vlg': 'village',
+    'n': 'north',
+    's': 'south',
+    'e': 'east',
+    'w': 'west',
+}
+
+PUNCTUATION_RE = re.compile(r"[.,'`]")
+SEPARATOR_RE = re.compile(r'[-/]')
+
+
+def canonical_city(city):
+    """Lowercase, punctuation-free form with abbreviations expanded"""
+    city = SEPARATOR_RE.sub(' ', PUNCTUATION_RE.sub('', city.lower()))
+    return ' '.join(ABBREVIATIONS.get(token, token) for token in city.split())
+
+
+def trigrams(text):
+    """Character trigrams of text padded with spaces, so word edges count"""
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance between a and b, or limit + 1 once it exceeds limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        left = i
+        for j, char_b in enumerate(b):
+            left = min(previous[j + 1] + 1, left + 1, previous[j] + (char_a != char_b))
+            current.append(left)
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class FuzzyCityIndex:
+    """Trigram index over (state, canonical city) -> district"""
+
+    # Candidates (by shared trigrams) re-ranked by edit distance per query
+    CANDIDATES = 12
+
+    # Similarity (1 - distance / longer length) thresholds
+    MIN_SIMILARITY = 0.7
+    MEDIUM_SIMILARITY = 0.85
+
+    def __init__(self, lookups):
+        # entries[state] = [(canonical, listed_city, district_key, trigram count), ...]
+        self._entries = {}
+        # postings[state][trigram] = [entry index, ...]
+        self._postings = {}
+        self._exact = {}
+
+        for state_code, lookup in lookups.items():
+            entries = []
+            seen = set()
+            for district_key, district_info in lookup.DISTRICTS.items():
+                for city in district_info.get('cities', []):
+                    canonical = canonical_city(city)
+                    # First district listing a city wins, as in the exact index
+                    if canonical in seen:
+                        continue
+                    seen.add(canonical)
+                    self._exact[(state_code, canonical)] = len(entries)
+                    entries.append((canonical, city, district_key, len(trigrams(canonical))))
+
+            postings = {}
+            for position, (canonical, _, _, _) in enumerate(entries):
+                for gram in trigrams(canonical):
+                    postings.setdefault(gram, []).append(position)
+
+            self._entries[state_code] = entries
+            self._postings[state_code] = postings
+
+    def search(self, state, city, limit=5):
+        """
+        Ranked candidate cities for a possibly misspelled name.
+
+        Returns:
+            list of (listed_city, district_key, similarity, confidence), best
+            first. A match after canonicalization ("St. Petersburg" for
+            "saint petersburg") has similarity 1.0 and confidence 'high';
+            otherwise confidence is 'medium' or 'low' by similarity.
+        """
+        entries = self._entries.get(state)
+        if not entries or not city:
+            return []
+
+        query = canonical_city(city)
+        position = self._exact.get((state, query))
+        if position is not None:
+            _, listed_city, district_key, _ = entries[position]
+            return [(listed_city, district_key, 1.0, 'high')]
+
+        postings = self._postings[state]
+        query_grams = trigrams(query)
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(postings.get(gram, ()))
+
+        results = []
+        for position, shared_count in shared.most_common(self.CANDIDATES):
+            canonical, listed_city, district_key, gram_count = entries[position]
+            longest = max(len(query), len(canonical))
+            limit_distance = int(longest * (1 - self.MIN_SIMILARITY))
+            # Each edit destroys at most three trigrams, so candidates sharing
+            # too few cannot be within limit_distance; skip the DP for them
+            if shared_count < max(len(query_grams), gram_count) - 3 * limit_distance:
+                continue
+            distance = edit_distance(query, canonical, limit_distance)
+            if distance > limit_distance:
+                continue
+            similarity = 1 - distance / longest
+            confidence = 'medium' if similarity >= self.MEDIUM_SIMILARITY else 'low'
+            results.append((listed_city, district_key, round(similarity, 3), confidence))
+
+        results.sort(key=lambda result: -result[2])
+        return results[:limit]
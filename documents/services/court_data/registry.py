@@ -0,0 +1,218 @@
+# documents/services/court_data/registry.py
+"""
+Registry of state federal district court lookups.
+
+Loads every state's districts once per process and compiles a single
+{(state, normalized_city): district} hash index, so a lookup is one dict
+access instead of an import plus a scan of every district's city list.
+Misspelled names go through the fuzzy index built alongside it (see
+fuzzy_index.py).
+
+The state data comes from the compiled tables in the bundled dataset (see
+the build_court_dataset command) when they were built from the current
+court_data/states sources, and from importing the *_lookup.py modules
+otherwise. Load before forking workers so the index is shared.
+"""
+
+import hashlib
+import importlib
+import logging
+import pkgutil
+import threading
+from pathlib import Path
+
+from .dataset import court_dataset
+from .fuzzy_index import FuzzyCityIndex
+
+logger = logging.getLogger(__name__)
+
+STATES_DIR = Path(__file__).resolve().parent / 'states'
+
+
+def normalize_city(city):
+    """Lowercase and collapse whitespace, matching the DISTRICTS city lists"""
+    return ' '.join(city.lower().split())
+
+
+def normalize_state(state):
+    """Two-letter uppercase state code"""
+    return state.strip().upper()
+
+
+def source_fingerprint():
+    """SHA-256 over the court_data/states sources, stored with the compiled tables"""
+    digest = hashlib.sha256()
+    for path in sorted(STATES_DIR.glob('*.py')):
+        digest.update(path.name.encode('utf-8'))
+        digest.update(b'\x00')
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class CourtRegistry:
+    """All state lookups and the compiled city index"""
+
+    def __init__(self):
+        self._lookups = None
+        self._city_index = None
+        self._fuzzy_index = None
+        self._lock = threading.Lock()
+        # 'dataset' or 'modules', whichever load() used
+        self.source = None
+
+    def _discover(self):
+        """Import every *_lookup module and collect its BaseStateLookup subclasses"""
+        from . import states
+        from .states.base_state_lookup import BaseStateLookup
+
+        lookups = {}
+        for module_info in pkgutil.iter_modules(states.__path__):
+            if not module_info.name.endswith('_lookup'):
+                continue
+            module = importlib.import_module(f'{states.__name__}.{module_info.name}')
+            for value in vars(module).values():
+                if (isinstance(value, type) and issubclass(value, BaseStateLookup)
+                        and value is not BaseStateLookup and value.STATE_CODE):
+                    lookups[value.STATE_CODE] = value
+        return lookups
+
+    def _load_compiled(self):
+        """
+        Rebuild lookups and the city index from the bundled dataset.
+
+        Returns:
+            (lookups, city_index), or None if the dataset is missing or was
+            compiled from different state sources
+        """
+        compiled_from = court_dataset.meta('source_fingerprint')
+        if compiled_from is None:
+            return None
+        if compiled_from != source_fingerprint():
+            logger.warning("Court dataset is stale (state sources changed); "
+                           "run build_court_dataset. Importing state modules instead.")
+            return None
+
+        from .states.base_state_lookup import BaseStateLookup
+
+        state_names = {}
+        districts = {}
+        for state_code, state_name, district_key, name in court_dataset.district_rows():
+            state_names[state_code] = state_name
+            districts.setdefault(state_code, {})[district_key] = {'name': name, 'cities': []}
+        for state_code, district_key, city in court_dataset.city_listing_rows():
+            districts[state_code][district_key]['cities'].append(city)
+
+        lookups = {
+            state_code: type(f'Compiled{state_code}Lookup', (BaseStateLookup,), {
+                '__module__': __name__,
+                'STATE_CODE': state_code,
+                'STATE_NAME': state_names[state_code],
+                'DISTRICTS': state_districts,
+            })
+            for state_code, state_districts in districts.items()
+        }
+        city_index = {
+            (state_code, city): (lookups[state_code], district_key)
+            for state_code, city, district_key in court_dataset.city_index_rows()
+        }
+        return lookups, city_index
+
+    @staticmethod
+    def _compile_index(lookups):
+        """
+        Build {(state, city): (lookup_class, district_key)}.
+
+        The first district listing a city wins, matching the previous
+        linear scan over DISTRICTS in definition order.
+        """
+        index = {}
+        for state_code, lookup in lookups.items():
+            for district_key, district_info in lookup.DISTRICTS.items():
+                for city in district_info.get('cities', []):
+                    index.setdefault((state_code, normalize_city(city)), (lookup, district_key))
+        return index
+
+    def load(self, use_dataset=True):
+        """
+        Load lookups and the city index (idempotent, thread-safe).
+
+        use_dataset=False always imports the state modules; the dataset
+        build uses it so it never compiles from a previous build.
+        """
+        if self._city_index is not None:
+            return
+        with self._lock:
+            if self._city_index is not None:
+                return
+            compiled = self._load_compiled() if use_dataset else None
+            if compiled is not None:
+                lookups, city_index = compiled
+                self.source = 'dataset'
+            else:
+                lookups = self._discover()
+                city_index = self._compile_index(lookups)
+                self.source = 'modules'
+            self._fuzzy_index = FuzzyCityIndex(lookups)
+            self._city_index = city_index
+            self._lookups = lookups
+
+    @property
+    def lookups(self):
+        """{state_code: BaseStateLookup subclass}"""
+        if self._lookups is None:
+            self.load()
+        return self._lookups
+
+    def get_state_lookup(self, state):
+        """The lookup class for a state code, or None if unsupported"""
+        return self.lookups.get(normalize_state(state))
+
+    def district_for_city(self, state, city):
+        """District key whose city list contains city, or None"""
+        if self._city_index is None:
+            self.load()
+        match = self._city_index.get((normalize_state(state), normalize_city(city)))
+        return match[1] if match else None
+
+    def lookup_city(self, state, city):
+        """
+        O(1) city match.
+
+        Returns:
+            dict in the BaseStateLookup result format, or None if the city
+            is not listed for the state
+        """
+        if self._city_index is None:
+            self.load()
+        match = self._city_index.get((normalize_state(state), normalize_city(city)))
+        if match is None:
+            return None
+        lookup, district_key = match
+        return lookup.build_result(district_key, confidence='high', method='city_match')
+
+    def suggest_cities(self, state, city, limit=5):
+        """
+        Ranked fuzzy matches for a possibly misspelled city.
+
+        Returns:
+            list of dicts in the BaseStateLookup result format plus 'city'
+            (the listed spelling) and 'similarity' (0-1), best first
+        """
+        if self._city_index is None:
+            self.load()
+        state = normalize_state(state)
+        lookup = self._lookups.get(state)
+        if lookup is None:
+            return []
+
+        suggestions = []
+        for listed_city, district_key, similarity, confidence in self._fuzzy_index.search(state, city, limit):
+            method = 'normalized_city_match' if similarity == 1.0 else 'fuzzy_city_match'
+            result = lookup.build_result(district_key, confidence=confidence, method=method)
+            result['city'] = listed_city
+            result['similarity'] = similarity
+            suggestions.append(result)
+        return suggestions
+
+
+court_registry = CourtRegistry()
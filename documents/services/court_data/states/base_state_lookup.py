@@ -1,3 +1,6 @@
+from ..registry import court_registry
+
+
 class BaseStateLookup:
     """Base class for state-specific federal district court lookups."""
     
@@ -5,23 +8,33 @@ class BaseStateLookup:
     STATE_NAME = None
     DISTRICTS = {}
     
+    @classmethod
+    def build_result(cls, district_key, confidence, method):
+        """Standard lookup result for one of this state's districts."""
+        return {
+            'court_name': cls.DISTRICTS[district_key]['name'],
+            'confidence': confidence,
+            'method': method,
+            'district': district_key,
+            'state': cls.STATE_CODE
+        }
+    
     @classmethod
     def lookup_court_by_city(cls, city):
         """Look up federal district court by city name."""
         if not city or not cls.DISTRICTS:
             return None
-            
-        city = city.strip().lower()
         
-        # Check each district for exact city match
-        for district_key, district_info in cls.DISTRICTS.items():
-            if city in district_info.get('cities', []):
-                return {
-                    'court_name': district_info['name'],
-                    'confidence': 'high',
-                    'method': 'city_match',
-                    'district': district_key,
-                    'state': cls.STATE_CODE
-                }
+        # Exact city match via the registry's compiled (state, city) index
+        result = court_registry.lookup_city(cls.STATE_CODE, city)
+        if result:
+            return result
         
-        return None
\ No newline at end of file
+        # Misspellings and abbreviations: best fuzzy candidate, with the
+        # runners-up attached for the user to choose from
+        suggestions = court_registry.suggest_cities(cls.STATE_CODE, city)
+        if not suggestions:
+            return None
+        best = suggestions[0]
+        best['candidates'] = suggestions[1:]
+        return best
@@ -29,7 +29,7 @@ class CaliforniaLookup(BaseStateLookup):
             'cities': [
                 'los angeles', 'long beach', 'anaheim', 'santa ana', 'riverside',
                 'irvine', 'glendale', 'huntington beach', 'santa clarita', 'garden grove',
-                'oceanside', 'torrance', 'orange', 'fullerton', 'pasadena'
+                'torrance', 'orange', 'fullerton', 'pasadena'
             ]
         },
         
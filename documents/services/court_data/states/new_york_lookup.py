@@ -16,7 +16,7 @@ class NewYorkLookup(BaseStateLookup):
                 'plattsburgh', 'watertown', 'utica', 'rome', 'syracuse', 'oswego',
                 'fulton', 'oneida', 'herkimer', 'little falls', 'amsterdam',
                 'gloversville', 'johnstown', 'cooperstown', 'oneonta', 'cortland',
-                'auburn', 'geneva', 'canandaigua', 'elmira', 'corning', 'ithaca',
+                'auburn', 'elmira', 'corning', 'ithaca',
                 'binghamton', 'endicott', 'johnson city'
             ]
         },
@@ -24,8 +24,8 @@ class NewYorkLookup(BaseStateLookup):
         'southern': {
             'name': 'United States District Court for the Southern District of New York',
             'cities': [
-                'new york', 'manhattan', 'bronx', 'brooklyn', 'queens', 
-                'staten island', 'yonkers', 'mount vernon', 'new rochelle',
+                'new york', 'manhattan', 'bronx',
+                'yonkers', 'mount vernon', 'new rochelle',
                 'white plains', 'tarrytown', 'peekskill', 'ossining',
                 'poughkeepsie', 'newburgh', 'kingston', 'middletown'
             ]
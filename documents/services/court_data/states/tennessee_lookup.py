@@ -9,7 +9,7 @@ class TennesseeLookup(BaseStateLookup):
             'name': 'United States District Court for the Eastern District of Tennessee',
             'cities': [
                 'knoxville', 'chattanooga', 'johnson city', 'kingsport', 'oak ridge',
-                'cleveland', 'morristown', 'maryville', 'cookeville', 'athens'
+                'cleveland', 'morristown', 'maryville', 'athens'
             ]
         },
         
@@ -12,6 +12,6 @@ class WashingtonLookup(BaseStateLookup):
         
         'western': {
             'name': 'United States District Court for the Western District of Washington',
-            'cities': ['seattle', 'tacoma', 'spokane', 'vancouver', 'bellevue', 'kent', 'everett', 'renton']
+            'cities': ['seattle', 'tacoma', 'vancouver', 'bellevue', 'kent', 'everett', 'renton']
         }
     }
\ No newline at end of file
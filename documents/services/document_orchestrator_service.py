@@ -49,7 +49,7 @@ class DocumentOrchestratorService:
         templates = TemplateMatchingService.find_templates(violation_type, location_type)
 
         # Step 3: Prepare context data for template rendering
-        context_data = TemplateMatchingService.prepare_document_context(self.document)
+        context_data = TemplateMatchingService.get_document_context(self.document)
 
         # Step 4: Generate sections from templates (with optional AI enhancement)
         results = SectionGenerationService.bulk_generate_sections(
@@ -69,7 +69,7 @@ class DocumentOrchestratorService:
         return {
             'violation_type': violation_type,
             'location_type': location_type,
-            'templates_found': templates.count(),
+            'templates_found': len(templates),
             'sections_created': len([r for r in results if r['created']]),
             'sections_updated': len([r for r in results if not r['created']]),
             'ai_enhanced_count': ai_enhanced_count,
@@ -101,7 +101,7 @@ class DocumentOrchestratorService:
             'violation_description': ViolationAnalysisService.get_violation_description(violation_type),
             'location_type': location_type,
             'location_description': ViolationAnalysisService.get_forum_description(location_type),
-            'available_templates': templates.count(),
+            'available_templates': len(templates),
             'available_sections': available_sections,
             'current_sections': section_stats['total_sections'],
             'completion_percentage': section_stats['completion_percentage'],
@@ -154,7 +154,7 @@ class DocumentOrchestratorService:
                 'location_type': location_type
             }
 
-        context_data = TemplateMatchingService.prepare_document_context(self.document)
+        context_data = TemplateMatchingService.get_document_context(self.document)
         section, created = SectionGenerationService.create_section_from_template(
             self.document, template, context_data
         )
@@ -0,0 +1,43 @@
+# documents/services/document_stats_service.py
+"""
+Per-user document counts for the dashboard and subscription pages.
+
+The counts are cached in the 'stats' namespace and dropped by the
+LawsuitDocument and DocumentSection signals once a change commits, so the
+dashboard runs two queries only after the user has edited something.
+"""
+from django.db.models import Count, Q
+
+from core.cache import stats_cache
+
+
+class DocumentStatsService:
+    """Cached document and AI section counts"""
+
+    @staticmethod
+    def _key(user_id):
+        return f'documents:{user_id}'
+
+    @classmethod
+    def for_user(cls, user):
+        """{total_documents, draft_documents, completed_documents, ai_sections_count}"""
+        return stats_cache.get_or_set(cls._key(user.pk), lambda: cls.compute(user))
+
+    @staticmethod
+    def compute(user):
+        from ..models import LawsuitDocument, DocumentSection
+
+        counts = LawsuitDocument.objects.filter(user=user).aggregate(
+            total_documents=Count('pk'),
+            draft_documents=Count('pk', filter=Q(status='draft')),
+            completed_documents=Count('pk', filter=Q(status='completed')),
+        )
+        counts['ai_sections_count'] = DocumentSection.objects.filter(
+            document__user=user,
+            ai_enhanced=True
+        ).count()
+        return counts
+
+    @classmethod
+    def invalidate(cls, user_id):
+        stats_cache.delete(cls._key(user_id))
@@ -0,0 +1,121 @@
+# documents/services/evidence_tagging_service.py
+"""
+Proposes violation tags for a document's video evidence.
+
+Runs the compiled evidence tag classifier (see violation_analysis_service.py)
+over every segment transcript and every quote of a document in one pass,
+with one query for segments and one for quotes. Tags are only proposed where
+the user has never set or cleared tags (tags_edited), and never on reviewed
+segments, so hand tagging always wins. Runs in the background after each
+extraction and manual transcript entry.
+"""
+import logging
+
+from django.db import transaction
+
+from .violation_analysis_service import ViolationAnalysisService
+from .violation_tag_service import ViolationTagService
+
+logger = logging.getLogger(__name__)
+
+
+class EvidenceTaggingService:
+    """Batch violation tagging for transcript segments and quotes"""
+
+    @staticmethod
+    def segment_text(segment):
+        """The transcript the user sees, falling back to Whisper's original"""
+        return segment.edited_transcript or segment.raw_transcript
+
+    @staticmethod
+    def quote_text(quote, transcript):
+        """The quote's stored text, or its span of the segment transcript"""
+        return quote.text or transcript[quote.start_position:quote.end_position]
+
+    @classmethod
+    def propose_tags(cls, segments, quotes):
+        """
+        Tag proposals for segments and quotes, without touching the database.
+
+        Args:
+            segments: VideoEvidence instances
+            quotes: TranscriptQuote instances belonging to those segments
+
+        Returns:
+            ({segment_id: [tag, ...]}, {quote_id: [tag, ...]}), with an
+            empty list where nothing was found
+        """
+        suggest = ViolationAnalysisService.suggest_evidence_tags
+        transcripts = {segment.pk: cls.segment_text(segment) for segment in segments}
+        segment_tags = {segment_id: suggest(text) for segment_id, text in transcripts.items()}
+        quote_tags = {
+            quote.pk: suggest(cls.quote_text(quote, transcripts.get(quote.video_evidence_id, '')))
+            for quote in quotes
+        }
+        return segment_tags, quote_tags
+
+    @classmethod
+    def tag_document(cls, document_id):
+        """
+        Fill in proposed violation_tags for a document's untagged evidence.
+
+        Returns:
+            (segments tagged, quotes tagged)
+        """
+        from ..models import LawsuitDocument, TranscriptQuote, VideoEvidence, bump_evidence_revision
+
+        with transaction.atomic():
+            # Lock the document row so two tagging runs for it do not interleave
+            if not LawsuitDocument.objects.select_for_update().filter(pk=document_id).exists():
+                logger.info("Skipping evidence tagging for deleted document %s", document_id)
+                return 0, 0
+
+            segments = list(
+                VideoEvidence.objects.filter(document_id=document_id).only(
+                    'id', 'document_id', 'raw_transcript', 'edited_transcript', 'violation_tags',
+                    'tags_edited', 'is_reviewed'
+                )
+            )
+            quotes = list(
+                TranscriptQuote.objects.filter(video_evidence__document_id=document_id).only(
+                    'id', 'video_evidence_id', 'text', 'start_position', 'end_position', 'violation_tags',
+                    'tags_edited'
+                )
+            )
+            segment_tags, quote_tags = cls.propose_tags(segments, quotes)
+
+            tagged_segments = [
+                segment for segment in segments
+                if not segment.violation_tags and not segment.tags_edited and not segment.is_reviewed
+                and segment_tags[segment.pk]
+            ]
+            for segment in tagged_segments:
+                segment.violation_tags = ','.join(segment_tags[segment.pk])
+
+            tagged_quotes = [
+                quote for quote in quotes
+                if not quote.violation_tags and not quote.tags_edited and quote_tags[quote.pk]
+            ]
+            for quote in tagged_quotes:
+                quote.violation_tags = ','.join(quote_tags[quote.pk])
+
+            # bulk_update skips post_save, so sync tag rows and invalidate
+            # cached facts here
+            VideoEvidence.objects.bulk_update(tagged_segments, ['violation_tags'], batch_size=500)
+            TranscriptQuote.objects.bulk_update(tagged_quotes, ['violation_tags'], batch_size=500)
+            ViolationTagService.sync_segments(tagged_segments)
+            ViolationTagService.sync_quotes(tagged_quotes)
+            if tagged_segments or tagged_quotes:
+                bump_evidence_revision({'pk': document_id})
+
+        logger.info(
+            "Tagged %d/%d segments and %d/%d quotes for document %s",
+            len(tagged_segments), len(segments), len(tagged_quotes), len(quotes), document_id
+        )
+        return len(tagged_segments), len(tagged_quotes)
+
+    @staticmethod
+    def schedule_tagging(document_id):
+        """Queue tagging for a document once the current transaction commits"""
+        from ..tasks import tag_document_evidence
+        transaction.on_commit(lambda: tag_document_evidence.delay(document_id))
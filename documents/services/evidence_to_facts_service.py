@@ -2,121 +2,162 @@
 Service to convert reviewed video evidence into Statement of Facts.
 Generates numbered factual statements from tagged quotes with speaker attribution.
 """
+from django.db.models import Prefetch
+
+from core.cache import facts_cache
+
 from ..models import VideoEvidence, TranscriptQuote
+from .violation_tag_service import ViolationTagService
 
 
 class EvidenceToFactsService:
     """Convert tagged video quotes into legal Statement of Facts."""
 
     @staticmethod
-    def generate_facts_section(document):
+    def get_facts_section(document):
         """
-        Generate Statement of Facts from tagged quotes marked for inclusion.
+        Cached wrapper around generate_facts_section().
 
-        Uses the new TranscriptQuote model with speaker attribution.
-        Only includes quotes where include_in_document=True.
+        The rendered facts and exhibits are stored against the document's
+        evidence_revision, which is bumped on any VideoEvidence, TranscriptQuote
+        or Person write. Preview followed by generate is a single computation,
+        and a cache outage only costs the recomputation ('evidence_facts'
+        namespace).
+        """
+        return facts_cache.get_or_set(
+            f"{document.pk}:{document.evidence_revision}",
+            lambda: EvidenceToFactsService.generate_facts_section(document)
+        )
 
-        Returns:
-            dict with 'content' (formatted facts) and 'metadata'
+    @staticmethod
+    def _included_segments(document):
         """
-        # Get all video segments marked for inclusion
-        segments = VideoEvidence.objects.filter(
-            document=document,
-            include_in_complaint=True
-        ).prefetch_related('quotes__speaker').order_by('youtube_url', 'start_seconds')
+        Load every segment marked for inclusion together with its included quotes.
 
-        if not segments.exists():
-            return {
-                'content': '',
-                'metadata': {
-                    'segment_count': 0,
-                    'quote_count': 0,
-                    'error': 'No video segments marked for inclusion in complaint'
-                }
-            }
+        The quote filter and ordering live in the Prefetch, so the whole evidence
+        set is fetched in two queries regardless of segment or quote count.
+        Quotes are exposed on each segment as ``included_quotes``.
+        """
+        included_quotes = Prefetch(
+            'quotes',
+            queryset=TranscriptQuote.objects.filter(
+                include_in_document=True
+            ).select_related('speaker').order_by('sort_order', 'start_position'),
+            to_attr='included_quotes'
+        )
+        return list(
+            VideoEvidence.objects.filter(
+                document=document,
+                include_in_complaint=True
+            ).prefetch_related(included_quotes).order_by('youtube_url', 'start_seconds')
+        )
+
+    @staticmethod
+    def _group_by_video(segments):
+        """
+        Group segments by video URL and assign exhibit letters (A, B, C, etc.).
 
-        # Group segments by video URL for exhibit lettering
+        Returns:
+            tuple of (videos, exhibit_map) where videos maps URL -> segments
+            and exhibit_map maps URL -> exhibit letter.
+        """
         videos = {}
+        exhibit_map = {}
         for segment in segments:
             if segment.youtube_url not in videos:
                 videos[segment.youtube_url] = []
+                exhibit_map[segment.youtube_url] = chr(65 + len(exhibit_map))  # A=65 in ASCII
             videos[segment.youtube_url].append(segment)
+        return videos, exhibit_map
 
-        # Assign exhibit letters (A, B, C, etc.)
-        exhibit_map = {}
-        for idx, url in enumerate(videos.keys()):
-            exhibit_letter = chr(65 + idx)  # A=65 in ASCII
-            exhibit_map[url] = exhibit_letter
+    @staticmethod
+    def _iter_facts(videos, exhibit_map):
+        """
+        Yield (fact_text, is_quote) pairs in document order, numbering as it goes.
 
-        # Generate numbered facts from tagged quotes
-        facts = []
+        Works entirely from prefetched data; no queries are issued.
+        """
         fact_number = 1
-        total_quotes = 0
 
         for url, url_segments in videos.items():
             exhibit_letter = exhibit_map[url]
 
             for segment in url_segments:
-                # Get quotes for this segment that should be included
-                quotes = segment.quotes.filter(include_in_document=True).order_by('sort_order', 'start_position')
+                quotes = segment.included_quotes
 
-                if not quotes.exists():
+                if not quotes:
                     # Fallback: if no quotes tagged, mention the segment exists
-                    fact = (
+                    yield (
                         f"{fact_number}. Video evidence from {segment.start_time} to {segment.end_time} "
                         f"documents relevant events. See Exhibit {exhibit_letter}."
-                    )
-                    facts.append(fact)
+                    ), False
                     fact_number += 1
                     continue
 
+                # Use actual video source type instead of hardcoded "Body Camera Footage"
+                source_display = segment.get_source_type_display()
+
                 # Process each tagged quote - create narrative facts
                 for quote in quotes:
-                    total_quotes += 1
-
-                    # Get speaker information
-                    speaker_name = quote.speaker.display_name
-                    speaker_role = quote.speaker.role
-
-                    # Build narrative fact in legal format
                     fact_parts = []
 
                     # Add context/significance first if provided
                     if quote.significance:
-                        # Make significance part of the narrative
                         fact_parts.append(f"{quote.significance}.")
 
                     # Format the quote based on speaker role for natural narrative
-                    if speaker_role == 'plaintiff':
-                        # First person quotes for plaintiff
+                    if quote.speaker.role == 'plaintiff':
                         fact_parts.append(f'The Plaintiff stated, "{quote.text}"')
-                    elif speaker_role == 'defendant':
-                        # Third person for defendants (officers, etc.)
-                        fact_parts.append(f'{speaker_name} stated, "{quote.text}"')
-                    elif speaker_role == 'witness':
-                        fact_parts.append(f'{speaker_name} stated, "{quote.text}"')
                     else:
-                        fact_parts.append(f'{speaker_name} stated, "{quote.text}"')
+                        # Third person for defendants, witnesses and others
+                        fact_parts.append(f'{quote.speaker.display_name} stated, "{quote.text}"')
 
-                    # Combine narrative parts
                     fact_text = ' '.join(fact_parts)
 
                     # Add exhibit reference in legal format
-                    # Use actual video source type instead of hardcoded "Body Camera Footage"
-                    source_display = segment.get_source_type_display()
-                    fact = (
+                    yield (
                         f"{fact_number}. {fact_text} "
                         f"See Exhibit {exhibit_letter} ({source_display}) at {segment.start_time}."
-                    )
-
-                    facts.append(fact)
+                    ), True
                     fact_number += 1
 
+    @staticmethod
+    def generate_facts_section(document):
+        """
+        Generate Statement of Facts from tagged quotes marked for inclusion.
+
+        Uses the new TranscriptQuote model with speaker attribution.
+        Only includes quotes where include_in_document=True.
+
+        Returns:
+            dict with 'content' (formatted facts) and 'metadata'
+        """
+        segments = EvidenceToFactsService._included_segments(document)
+
+        if not segments:
+            return {
+                'content': '',
+                'metadata': {
+                    'segment_count': 0,
+                    'quote_count': 0,
+                    'error': 'No video segments marked for inclusion in complaint'
+                }
+            }
+
+        videos, exhibit_map = EvidenceToFactsService._group_by_video(segments)
+
+        # Generate numbered facts from tagged quotes
+        facts = []
+        total_quotes = 0
+        for fact, is_quote in EvidenceToFactsService._iter_facts(videos, exhibit_map):
+            facts.append(fact)
+            total_quotes += is_quote
+
         if not facts:
             return {
                 'content': '',
                 'metadata': {
-                    'segment_count': segments.count(),
+                    'segment_count': len(segments),
                     'quote_count': 0,
                     'error': 'No tagged quotes found. Please tag quotes with speaker attribution before generating.'
                 }
@@ -126,13 +167,15 @@ class EvidenceToFactsService:
         content = "\n\n".join(facts)
 
         # Generate exhibits list
-        exhibits_list = EvidenceToFactsService._generate_exhibits_list(videos, exhibit_map)
+        exhibits_list = EvidenceToFactsService._generate_exhibits_list(
+            videos, exhibit_map, ViolationTagService.tags_by_video(document)
+        )
 
         return {
             'content': content,
             'exhibits_list': exhibits_list,
             'metadata': {
-                'segment_count': segments.count(),
+                'segment_count': len(segments),
                 'quote_count': total_quotes,
                 'fact_count': len(facts),
                 'exhibit_count': len(videos)
@@ -140,8 +183,13 @@ class EvidenceToFactsService:
         }
 
     @staticmethod
-    def _generate_exhibits_list(videos, exhibit_map):
-        """Generate formatted exhibits list for complaint in legal format."""
+    def _generate_exhibits_list(videos, exhibit_map, tags_by_url):
+        """
+        Generate formatted exhibits list for complaint in legal format.
+
+        tags_by_url maps each video URL to the violation tags of its included
+        segments and quotes (ViolationTagService.tags_by_video).
+        """
         exhibits = []
 
         for url, segments in videos.items():
@@ -150,20 +198,7 @@ class EvidenceToFactsService:
             # Collect all timestamps for this video
             timestamps = [f"{s.start_time}-{s.end_time}" for s in segments]
 
-            # Get violation tags from quotes
-            all_tags = set()
-            for segment in segments:
-                # Get violation tags from the segment's quotes
-                quotes = segment.quotes.filter(include_in_document=True)
-                for quote in quotes:
-                    if quote.violation_tags:
-                        tags = quote.violation_tags.split(',')
-                        all_tags.update(t.strip() for t in tags)
-
-                # Also check segment-level tags
-                if segment.violation_tags:
-                    tags = segment.violation_tags.split(',')
-                    all_tags.update(t.strip() for t in tags)
+            all_tags = tags_by_url.get(url, set())
 
             # Format violation tags for display
             if all_tags:
@@ -185,4 +220,4 @@ class EvidenceToFactsService:
             )
             exhibits.append(exhibit_text)
 
-        return "\n\n---\n\n".join(exhibits)
\ No newline at end of file
+        return "\n\n---\n\n".join(exhibits)
@@ -0,0 +1,104 @@
+# documents/services/pattern_classifier.py
+"""
+Compiled phrase classifier.
+
+Takes {label: [phrase, ...]} and scores text by adding each phrase's weight
+to its labels once per occurrence, overlapping ones included ("threat"
+inside "threatened to arrest").
+
+Small phrase sets are counted with one str.count() per phrase. Larger ones
+are compiled into a single regular expression, factored as a character
+trie so its cost barely grows with the number of phrases; it pays a fixed
+cost per text position instead, which only wins past about a hundred
+phrases (see benchmark_violation_classifier).
+"""
+
+import re
+from collections import Counter
+
+
+def _trie_pattern(phrases):
+    """Regex source matching the longest phrase starting at a position"""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A phrase ends here, so the longer continuations are optional
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class PatternClassifier:
+    """Weighted phrase scoring for a set of labels"""
+
+    # Phrase sets up to this size are scanned with str.count()
+    MAX_COUNTED_PHRASES = 100
+
+    def __init__(self, patterns, max_counted_phrases=MAX_COUNTED_PHRASES):
+        """
+        Args:
+            patterns: {label: [phrase, ...]}. Matching is case-insensitive
+                substring matching, as with `phrase in text.lower()`. Label
+                order breaks ties in classify().
+            max_counted_phrases: Largest phrase set counted phrase by phrase
+                rather than compiled.
+        """
+        self.labels = list(patterns)
+
+        # phrase -> [(label, weight)]; multi-word phrases are more specific
+        # than single words, so each word counts once
+        self._phrase_scores = {}
+        for label, phrases in patterns.items():
+            for phrase in phrases:
+                phrase = phrase.lower()
+                self._phrase_scores.setdefault(phrase, []).append((label, len(phrase.split())))
+
+        self._regex = None
+        if len(self._phrase_scores) > max_counted_phrases:
+            # The regex reports the longest phrase at each position; credit
+            # every phrase that is a prefix of it, since those start there too
+            self._hit_scores = {}
+            for phrase in self._phrase_scores:
+                scores = Counter()
+                for prefix_end in range(1, len(phrase) + 1):
+                    for label, weight in self._phrase_scores.get(phrase[:prefix_end], ()):
+                        scores[label] += weight
+                self._hit_scores[phrase] = list(scores.items())
+
+            # The lookahead makes matches overlap: every position is tried
+            self._regex = re.compile(f'(?=({_trie_pattern(self._phrase_scores)}))')
+
+    def scores(self, text):
+        """{label: weighted score} for every label with at least one match"""
+        if not text:
+            return {}
+        text = text.lower()
+        if self._regex is None:
+            hits = ((phrase, text.count(phrase)) for phrase in self._phrase_scores)
+            phrase_scores = self._phrase_scores
+        else:
+            hits = Counter(self._regex.findall(text)).items()
+            phrase_scores = self._hit_scores
+
+        scores = Counter()
+        for phrase, count in hits:
+            if count:
+                for label, weight in phrase_scores[phrase]:
+                    scores[label] += weight * count
+        return dict(scores)
+
+    def classify(self, text, default):
+        """Highest-scoring label (earlier labels win ties), or default if nothing matches"""
+        scores = self.scores(text)
+        if not scores:
+            return default
+        return max(self.labels, key=lambda label: (scores.get(label, 0), -self.labels.index(label)))
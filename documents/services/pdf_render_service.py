@@ -0,0 +1,255 @@
+# documents/services/pdf_render_service.py
+"""
+PDF Render Service
+
+Renders the court-formatted complaint with WeasyPrint and stores the result
+on LawsuitDocument.pdf_file, keyed by a content hash of everything the PDF
+template prints. Downloads of an unchanged document stream the stored file;
+section edits queue a background re-render (see documents/tasks.py).
+
+The parsed stylesheet and font configuration are built once per process and
+reused by every render. Dedicated "pdf" queue workers warm them at startup.
+
+The complaint is laid out in one pass so sections flow continuously, as
+filed. The stored file is the shared cache: any web or worker process
+serves it while the content hash matches, and only an edit pays for a
+layout. Each numbered section's HTML is cached as a fragment keyed by its
+own hash ('pdf_fragments' namespace), so after an edit only the changed
+sections are rendered to HTML before the single WeasyPrint layout.
+"""
+
+import hashlib
+import logging
+import threading
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from core.cache import pdf_fragment_cache
+
+logger = logging.getLogger(__name__)
+
+
+class PDFRenderService:
+    """Render, hash and store complaint PDFs"""
+
+    TEMPLATE_NAME = 'documents/document_pdf.html'
+    SECTION_TEMPLATE_NAME = 'documents/pdf/_section.html'
+    STYLESHEET_NAME = 'documents/document_pdf.css'
+
+    # Bump when the PDF templates change so stored PDFs are re-rendered
+    TEMPLATE_VERSION = 3
+
+    # Seconds to wait before a background re-render, so a burst of section
+    # saves (e.g. the Manage Sections formset) produces a single render
+    RENDER_DELAY_SECONDS = 10
+
+    # Per-process WeasyPrint state, built lazily by warm()
+    _font_config = None
+    _stylesheets = None
+    _warm_lock = threading.Lock()
+
+    @classmethod
+    def warm(cls):
+        """
+        Parse document_pdf.css and set up font configuration for this process.
+
+        Safe to call repeatedly; only the first call does any work.
+        """
+        if cls._stylesheets is not None:
+            return
+
+        with cls._warm_lock:
+            if cls._stylesheets is not None:
+                return
+
+            # Imported lazily: WeasyPrint pulls in Pango/Cairo at import time
+            from weasyprint import CSS
+            from weasyprint.text.fonts import FontConfiguration
+
+            font_config = FontConfiguration()
+            stylesheet = CSS(
+                string=render_to_string(cls.STYLESHEET_NAME),
+                font_config=font_config
+            )
+            cls._font_config = font_config
+            cls._stylesheets = [stylesheet]
+
+    @staticmethod
+    def get_sections(document):
+        """Sections in the order they appear in the complaint"""
+        return list(document.sections.all().order_by('order'))
+
+    @staticmethod
+    def _hash_parts(parts):
+        """SHA-256 over a sequence of strings, NUL-separated"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update((part or '').encode('utf-8'))
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    @staticmethod
+    def _caption_parts(document):
+        """Values printed by _caption.html (court, plaintiff, defendants)"""
+        user = document.user
+        profile = getattr(user, 'profile', None)
+        return [
+            document.title,
+            document.user_confirmed_district,
+            document.suggested_federal_district,
+            document.defendants,
+            profile.full_legal_name if profile else '',
+            user.get_full_name(),
+            user.username,
+        ]
+
+    @staticmethod
+    def _signature_parts(document):
+        """Values printed by _signature.html"""
+        user = document.user
+        profile = getattr(user, 'profile', None)
+        parts = [user.username, user.get_full_name(), user.email]
+        if profile:
+            parts.extend([
+                profile.full_legal_name,
+                profile.street_address,
+                profile.city,
+                profile.state,
+                profile.zip_code,
+                profile.phone_number,
+            ])
+        return parts
+
+    @staticmethod
+    def compute_content_hash(document, sections):
+        """
+        SHA-256 over every value document_pdf.html prints.
+
+        Covers the caption (court, plaintiff, defendants), each section's
+        number, title and content, and the signature block.
+        """
+        parts = [f"v{PDFRenderService.TEMPLATE_VERSION}", 'caption']
+        parts.extend(PDFRenderService._caption_parts(document))
+        for number, section in enumerate(sections, start=1):
+            parts.extend(['section', str(number), section.title, section.content])
+        parts.append('signature')
+        parts.extend(PDFRenderService._signature_parts(document))
+        return PDFRenderService._hash_parts(parts)
+
+    @classmethod
+    def section_fragment_key(cls, number, section):
+        """Hash of everything _section.html prints for one numbered section"""
+        return cls._hash_parts([f"v{cls.TEMPLATE_VERSION}", str(number), section.title, section.content])
+
+    @classmethod
+    def render_section_fragments(cls, sections):
+        """_section.html for each section in order, reusing cached fragments"""
+        keys = [cls.section_fragment_key(number, section) for number, section in enumerate(sections, start=1)]
+        fragments = pdf_fragment_cache.get_many(keys)
+
+        rendered = {}
+        for number, (key, section) in enumerate(zip(keys, sections), start=1):
+            if key not in fragments and key not in rendered:
+                rendered[key] = render_to_string(cls.SECTION_TEMPLATE_NAME, {
+                    'section': section,
+                    'section_number': number,
+                })
+        if rendered:
+            pdf_fragment_cache.set_many(rendered)
+            fragments.update(rendered)
+
+        # Autoescaped by _section.html when rendered
+        return [mark_safe(fragments[key]) for key in keys]
+
+    @classmethod
+    def render_html(cls, document, sections):
+        """The complaint's HTML, assembled from the section fragments"""
+        return render_to_string(cls.TEMPLATE_NAME, {
+            'document': document,
+            'section_fragments': cls.render_section_fragments(sections),
+        })
+
+    @classmethod
+    def render_pdf_bytes(cls, document, sections):
+        """Render the complaint to PDF bytes with the warm WeasyPrint state"""
+        from weasyprint import HTML
+
+        cls.warm()
+        html = cls.render_html(document, sections)
+        return HTML(string=html, base_url=str(settings.BASE_DIR)).write_pdf(
+            stylesheets=cls._stylesheets,
+            font_config=cls._font_config
+        )
+
+    @staticmethod
+    def is_current(document, content_hash):
+        """Whether the stored PDF was rendered from content_hash"""
+        return bool(
+            document.pdf_file
+            and document.pdf_content_hash == content_hash
+            and document.pdf_file.storage.exists(document.pdf_file.name)
+        )
+
+    @staticmethod
+    def get_or_render(document):
+        """
+        Return the stored PDF for document, re-rendering first if it is stale.
+
+        Returns:
+            LawsuitDocument.pdf_file (a FieldFile pointing at a current PDF)
+        """
+        sections = PDFRenderService.get_sections(document)
+        content_hash = PDFRenderService.compute_content_hash(document, sections)
+
+        if PDFRenderService.is_current(document, content_hash):
+            return document.pdf_file
+
+        pdf_bytes = PDFRenderService.render_pdf_bytes(document, sections)
+        PDFRenderService._store(document, pdf_bytes, content_hash)
+        return document.pdf_file
+
+    @staticmethod
+    def _store(document, pdf_bytes, content_hash):
+        """Save pdf_bytes to pdf_file and drop the superseded file"""
+        old_name = document.pdf_file.name if document.pdf_file else None
+
+        filename = f"lawsuit_{document.pk}_{content_hash[:12]}.pdf"
+        document.pdf_file.save(filename, ContentFile(pdf_bytes), save=False)
+        document.pdf_content_hash = content_hash
+        document.save(update_fields=['pdf_file', 'pdf_content_hash'])
+
+        if old_name and old_name != document.pdf_file.name:
+            try:
+                document.pdf_file.storage.delete(old_name)
+            except OSError:
+                logger.warning("Could not delete superseded PDF %s", old_name)
+
+        logger.info("Rendered PDF for document %s (%s)", document.pk, content_hash[:12])
+
+    @staticmethod
+    def schedule_render(document_id):
+        """
+        Queue a background re-render for a document that already has a stored PDF.
+
+        Documents that have never been downloaded are skipped; their first
+        download renders on demand. When Celery runs eagerly (no worker
+        configured) nothing is queued, so section saves never block on WeasyPrint.
+        """
+        if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+            return
+
+        from ..models import LawsuitDocument
+        has_stored_pdf = LawsuitDocument.objects.filter(
+            pk=document_id
+        ).exclude(pdf_file='').exclude(pdf_file__isnull=True).exists()
+        if not has_stored_pdf:
+            return
+
+        from ..tasks import render_document_pdf
+        render_document_pdf.apply_async(
+            args=[document_id],
+            countdown=PDFRenderService.RENDER_DELAY_SECONDS
+        )
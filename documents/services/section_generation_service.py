@@ -1,6 +1,7 @@
 # documents/services/section_generation_service.py
 from django.db import models
 from ..models import DocumentSection
+from .template_matching_service import STATE_NAMES
 
 class SectionGenerationService:
     """Service to create and manage document sections"""
@@ -11,8 +12,8 @@ class SectionGenerationService:
         if order is None:
             order = SectionGenerationService._get_next_order(document)
         
-        section, created = DocumentSection.objects.get_or_create(
-            document=document,
+        # Through the related manager, so the section carries its document
+        section, created = document.sections.get_or_create(
             section_type=section_type,
             defaults={
                 'title': title,
@@ -128,7 +129,7 @@ class SectionGenerationService:
 
         Args:
             document: LawsuitDocument instance
-            templates: QuerySet of LegalTemplate instances
+            templates: list of LegalTemplate instances
             context_data: dict with placeholder values
             use_ai: bool - whether to attempt AI enhancement (default True)
 
@@ -182,7 +183,7 @@ class SectionGenerationService:
     @staticmethod
     def reorder_sections(document):
         """Reorder all sections according to standard legal document order"""
-        sections = DocumentSection.objects.filter(document=document)
+        sections = document.sections.all()
         
         for section in sections:
             standard_order = SectionGenerationService._get_standard_order(section.section_type)
@@ -260,23 +261,7 @@ class SectionGenerationService:
         print(f"DEBUG: user_profile.state = {user_profile.state if user_profile else 'None'}")
         
         if user_profile and user_profile.state:
-            # State abbreviation to full name mapping
-            state_names = {
-                'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
-                'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
-                'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
-                'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
-                'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
-                'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
-                'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
-                'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
-                'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
-                'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
-                'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
-                'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
-                'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'District of Columbia'
-            }
-            user_state = state_names.get(user_profile.state.upper(), user_profile.state)
+            user_state = STATE_NAMES.get(user_profile.state.upper(), user_profile.state)
 
         # Build the location string - prefer structured address over general location
         location_str = "[LOCATION]"  # fallback
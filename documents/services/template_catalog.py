@@ -0,0 +1,88 @@
+# documents/services/template_catalog.py
+"""
+Process-local catalog of LegalTemplate rows.
+
+Templates only change when an admin edits one or runs create_templates or
+seed_data, so every process keeps all of them in memory, indexed by
+(violation_type, location_type, section_type). Saves and deletes replace a
+version token in the shared 'templates' cache namespace; each process
+compares its token on access and reloads when it differs, so template
+matching reads no rows.
+
+The token expires after VERSION_TIMEOUT seconds and is then replaced, so
+every process reloads at least that often. That bounds staleness when the
+token cannot be shared: without REDIS_URL each process has its own memory
+cache and never sees another process's bump.
+"""
+import threading
+import uuid
+
+from core.cache import template_cache
+
+
+class TemplateCatalog:
+    """All legal templates, indexed for matching"""
+
+    VERSION_KEY = 'catalog_version'
+    VERSION_TIMEOUT = 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._by_key = {}
+        self._by_pair = {}
+        self._templates = []
+
+    @classmethod
+    def bump_version(cls):
+        """Invalidate every process's catalog; called when a template changes"""
+        token = uuid.uuid4().hex
+        template_cache.set(cls.VERSION_KEY, token, cls.VERSION_TIMEOUT)
+        return token
+
+    def _current(self):
+        """Reload from the database if the shared version token has moved"""
+        version = template_cache.get(self.VERSION_KEY)
+        if version is None:
+            # First use, token expired, or the cache was flushed: start a new version
+            version = self.bump_version()
+        if version == self._version:
+            return
+
+        with self._lock:
+            if version == self._version:
+                return
+            from ..models import LegalTemplate
+
+            # Read after taking the token: a save committed meanwhile leaves
+            # a newer token, so the next access reloads again
+            templates = list(LegalTemplate.objects.order_by('violation_type', 'location_type', 'section_type'))
+            by_pair = {}
+            for template in templates:
+                by_pair.setdefault((template.violation_type, template.location_type), []).append(template)
+
+            self._by_key = {
+                (template.violation_type, template.location_type, template.section_type): template
+                for template in templates
+            }
+            self._by_pair = by_pair
+            self._templates = templates
+            self._version = version
+
+    def find(self, violation_type, location_type):
+        """Templates for a violation/location pair, ordered by section_type"""
+        self._current()
+        return list(self._by_pair.get((violation_type, location_type), ()))
+
+    def get(self, violation_type, location_type, section_type):
+        """One template, or None"""
+        self._current()
+        return self._by_key.get((violation_type, location_type, section_type))
+
+    def all(self):
+        """Every template, ordered by violation, location and section type"""
+        self._current()
+        return list(self._templates)
+
+
+template_catalog = TemplateCatalog()
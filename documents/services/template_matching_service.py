@@ -1,37 +1,63 @@
 # documents/services/template_matching_service.py
+from functools import lru_cache
+
 from django.template import Template, Context
-from ..models import LegalTemplate
+from .template_catalog import template_catalog
 
-# Finds templates matching violation and location types
+# Finds templates matching violation and location types (from the in-memory catalog)
 # Renders templates with document context data
 # Provides preview functionality to see templates before applying
 # Offers statistics about available templates
 # Handles context preparation for template rendering
+# Keeps compiled templates in a bounded per-process cache, keyed by their text
+# Builds each document's render context once per request (get_document_context)
+
 
+# State abbreviation to full name mapping
+STATE_NAMES = {
+    'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
+    'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
+    'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
+    'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
+    'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
+    'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
+    'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
+    'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
+    'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
+    'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
+    'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
+    'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
+    'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'District of Columbia'
+}
+
+# Legacy video URL fields, lettered as exhibits in order
+VIDEO_URL_FIELDS = ['youtube_url_1', 'youtube_url_2', 'youtube_url_3', 'youtube_url_4']
 
 
 class TemplateMatchingService:
     """Service to find and process legal templates based on violation and location types"""
 
+    # Compiled templates kept per process; least recently used are evicted
+    TEMPLATE_CACHE_SIZE = 256
+
     @staticmethod
     def find_templates(violation_type, location_type):
         """Find all templates matching the violation and location types"""
-        return LegalTemplate.objects.filter(
-            violation_type=violation_type,
-            location_type=location_type
-        ).order_by('section_type')
+        return template_catalog.find(violation_type, location_type)
 
     @staticmethod
     def get_template_by_section(violation_type, location_type, section_type):
         """Find a specific template by violation, location, and section type"""
-        try:
-            return LegalTemplate.objects.get(
-                violation_type=violation_type,
-                location_type=location_type,
-                section_type=section_type
-            )
-        except LegalTemplate.DoesNotExist:
-            return None
+        return template_catalog.get(violation_type, location_type, section_type)
+
+    @staticmethod
+    def compile_template(template_text):
+        """
+        Compiled Template for template_text, from the per-process LRU cache.
+
+        Raises TemplateSyntaxError for invalid text (failures are not cached).
+        """
+        return _compile_template(template_text)
 
     @staticmethod
     def render_template_content(template_text, context_data):
@@ -40,7 +66,7 @@ class TemplateMatchingService:
             return template_text or ''
         
         try:
-            template = Template(template_text)
+            template = TemplateMatchingService.compile_template(template_text)
             context = Context(context_data)
             return template.render(context)
         except Exception as e:
@@ -48,6 +74,37 @@ class TemplateMatchingService:
             # Log the error in production
             return template_text
 
+    @staticmethod
+    def get_document_context(document):
+        """
+        The render context for a document, built once per document instance.
+
+        Views load a fresh instance per request, so this is computed once per
+        request and shared by section rendering, template previews and AI
+        prompt building. Treat the returned dict as read-only; call
+        prepare_document_context() directly after changing the document.
+        """
+        context = getattr(document, '_render_context', None)
+        if context is None:
+            context = TemplateMatchingService.prepare_document_context(document)
+            document._render_context = context
+        return context
+
+    @staticmethod
+    def video_exhibit_reference(document):
+        """'Exhibit A (video evidence), Exhibit B (additional video), ...' for the legacy URL fields"""
+        video_exhibits = []
+        for field in VIDEO_URL_FIELDS:
+            if getattr(document, field):
+                description = 'video evidence' if not video_exhibits else 'additional video'
+                video_exhibits.append(f"Exhibit {chr(65 + len(video_exhibits))} ({description})")
+
+        if len(video_exhibits) <= 1:
+            return ''.join(video_exhibits)
+        if len(video_exhibits) == 2:
+            return f"{video_exhibits[0]} and {video_exhibits[1]}"
+        return ", ".join(video_exhibits[:-1]) + f", and {video_exhibits[-1]}"
+
     @staticmethod
     def prepare_document_context(document):
         """Prepare context data for template rendering from a document"""
@@ -72,23 +129,9 @@ class TemplateMatchingService:
         # Get user's state for plaintiff residency
         user_state = '[STATE]'
         if user_profile and user_profile.state:
-            # State abbreviation to full name mapping
-            state_names = {
-                'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
-                'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
-                'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
-                'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
-                'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
-                'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
-                'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
-                'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
-                'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
-                'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
-                'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
-                'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
-                'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'District of Columbia'
-            }
-            user_state = state_names.get(user_profile.state.upper(), user_profile.state)
+            user_state = STATE_NAMES.get(user_profile.state.upper(), user_profile.state)
+
+        video_reference = TemplateMatchingService.video_exhibit_reference(document)
 
         return {
             'plaintiff_name': (
@@ -108,6 +151,8 @@ class TemplateMatchingService:
             'incident_street_address': document.incident_street_address or '',
             'defendants': document.defendants or '[DEFENDANTS TO BE IDENTIFIED]',
             'description': document.description or '[DESCRIPTION]',
+            'video_exhibits': video_reference,
+            'has_video_evidence': bool(video_reference),
         }
 
     @classmethod
@@ -131,7 +176,7 @@ class TemplateMatchingService:
             return None
         
         if document:
-            context = cls.prepare_document_context(document)
+            context = cls.get_document_context(document)
             rendered_content = cls.render_template_content(template.template_text, context)
         else:
             rendered_content = template.template_text
@@ -146,21 +191,25 @@ class TemplateMatchingService:
     @staticmethod
     def get_template_statistics():
         """Get statistics about available templates"""
-        from django.db.models import Count
-        
-        stats = LegalTemplate.objects.values(
-            'violation_type', 'location_type'
-        ).annotate(
-            section_count=Count('section_type')
-        ).order_by('violation_type', 'location_type')
-        
+        templates = template_catalog.all()
+
+        section_counts = {}
+        for template in templates:
+            pair = (template.violation_type, template.location_type)
+            section_counts[pair] = section_counts.get(pair, 0) + 1
+
         return {
-            'total_templates': LegalTemplate.objects.count(),
-            'by_violation_location': list(stats),
-            'violation_types': list(
-                LegalTemplate.objects.values_list('violation_type', flat=True).distinct()
-            ),
-            'location_types': list(
-                LegalTemplate.objects.values_list('location_type', flat=True).distinct()
-            )
-        }
\ No newline at end of file
+            'total_templates': len(templates),
+            'by_violation_location': [
+                {'violation_type': violation_type, 'location_type': location_type, 'section_count': count}
+                for (violation_type, location_type), count in sorted(section_counts.items())
+            ],
+            'violation_types': list(dict.fromkeys(template.violation_type for template in templates)),
+            'location_types': list(dict.fromkeys(template.location_type for template in templates)),
+        }
+
+
+@lru_cache(maxsize=TemplateMatchingService.TEMPLATE_CACHE_SIZE)
+def _compile_template(template_text):
+    # Keyed by the text itself: identical boilerplate shares one compiled Template
+    return Template(template_text)
@@ -6,6 +6,10 @@
 # Makes methods static using @classmethod (don't need a document instance)
 # Adds helper methods for getting human-readable descriptions
 # Improves organization with clear separation of concerns
+# Scores text with PatternClassifier (weighted phrase counts, see pattern_classifier.py)
+
+from .pattern_classifier import PatternClassifier
+
 
 class ViolationAnalysisService:
     """Service to analyze incident descriptions and determine violation types"""
@@ -60,44 +64,77 @@ class ViolationAnalysisService:
         ]
     }
 
+    # Evidence tag definitions (the tags offered in the evidence manager),
+    # matched against spoken transcript text as Whisper writes it
+    EVIDENCE_TAG_PATTERNS = {
+        'first_amendment': [
+            'recording', 'filming', 'camera', 'stop recording', 'turn off the camera',
+            'put the camera away', 'no filming', 'no recording', 'first amendment',
+            'freedom of the press', 'free speech', 'my right to record', 'public property',
+            'journalist', 'auditing', 'taking pictures'
+        ],
+        'fourth_amendment': [
+            'identification', 'show me your id', 'your id', "driver's license", 'drivers license',
+            'what is your name', "what's your name", 'fourth amendment', 'search you',
+            'searching', 'pat you down', 'empty your pockets', 'warrant',
+            'reasonable suspicion', 'probable cause', 'i do not consent', "i don't consent",
+            'seize', 'took my phone', 'give me your phone'
+        ],
+        'unlawful_detention': [
+            'detained', 'detaining', 'detain you', 'am i being detained', 'are you detaining me',
+            'am i free to go', 'free to leave', 'not free to leave', 'investigative detention',
+            'stay right there', "don't move", 'handcuff', 'cuffed', 'under arrest',
+            'back of the car', 'turn around'
+        ],
+        'excessive_force': [
+            'stop resisting', 'taser', 'tased', 'tase you', 'pepper spray', 'maced',
+            'choking', "can't breathe", 'you are hurting me', "you're hurting me", 'my arm',
+            'slammed', 'tackled', 'punched', 'hit me', 'get on the ground', 'on the ground',
+            'too tight', 'knee on'
+        ]
+    }
+
+    # A tag is proposed once its weighted score reaches this: one two-word
+    # phrase, or two single-word hits
+    EVIDENCE_TAG_MIN_SCORE = 2
+
+    # Built from the pattern lists once per process, below the class
+    violation_classifier = None
+    forum_classifier = None
+    evidence_tag_classifier = None
+
+    @classmethod
+    def score_violation_types(cls, description):
+        """Weighted pattern scores per violation type, e.g. {'interference_recording': 3}"""
+        return cls.violation_classifier.scores(description)
+
+    @classmethod
+    def score_location_types(cls, location):
+        """Weighted pattern scores per forum type"""
+        return cls.forum_classifier.scores(location)
+
+    @classmethod
+    def suggest_evidence_tags(cls, transcript):
+        """Evidence tags scoring at least EVIDENCE_TAG_MIN_SCORE, in EVIDENCE_TAG_PATTERNS order"""
+        scores = cls.evidence_tag_classifier.scores(transcript)
+        return [tag for tag in cls.EVIDENCE_TAG_PATTERNS if scores.get(tag, 0) >= cls.EVIDENCE_TAG_MIN_SCORE]
+
     @classmethod
     def analyze_violation_type(cls, description):
-        """Analyze incident description to determine violation type"""
-        if not description:
-            return 'threatened_arrest_public'  # default
-        
-        description_lower = description.lower()
-        
-        # Check patterns in priority order (most specific first)
-        for violation_type, patterns in cls.VIOLATION_PATTERNS.items():
-            if violation_type == 'threatened_arrest_public':
-                continue  # Check this last as it's the default
-            
-            if any(phrase in description_lower for phrase in patterns):
-                return violation_type
-        
-        # Check threatened arrest patterns last
-        if any(phrase in description_lower for phrase in cls.VIOLATION_PATTERNS['threatened_arrest_public']):
-            return 'threatened_arrest_public'
-        
-        # Default fallback
-        return 'threatened_arrest_public'
+        """
+        Analyze incident description to determine violation type.
+
+        The type with the highest weighted score wins; ties go to the more
+        specific types, with threatened arrest last.
+        """
+        # Default to threatened arrest for empty or ambiguous descriptions
+        return cls.violation_classifier.classify(description, default='threatened_arrest_public')
 
     @classmethod
     def analyze_location_type(cls, location):
         """Analyze location to determine forum type"""
-        if not location:
-            return 'traditional_public_forum'  # default to strongest protection
-        
-        location_lower = location.lower()
-        
-        # Check each forum type
-        for forum_type, patterns in cls.FORUM_PATTERNS.items():
-            if any(term in location_lower for term in patterns):
-                return forum_type
-        
         # Default to traditional public forum (strongest protection)
-        return 'traditional_public_forum'
+        return cls.forum_classifier.classify(location, default='traditional_public_forum')
 
     @classmethod
     def get_violation_description(cls, violation_type):
@@ -118,4 +155,9 @@ class ViolationAnalysisService:
             'designated_public_forum': 'Designated Public Forum',
             'limited_public_forum': 'Limited Public Forum'
         }
-        return descriptions.get(forum_type, forum_type.replace('_', ' ').title())
\ No newline at end of file
+        return descriptions.get(forum_type, forum_type.replace('_', ' ').title())
+
+
+ViolationAnalysisService.violation_classifier = PatternClassifier(ViolationAnalysisService.VIOLATION_PATTERNS)
+ViolationAnalysisService.forum_classifier = PatternClassifier(ViolationAnalysisService.FORUM_PATTERNS)
+ViolationAnalysisService.evidence_tag_classifier = PatternClassifier(ViolationAnalysisService.EVIDENCE_TAG_PATTERNS)
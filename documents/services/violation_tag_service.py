@@ -0,0 +1,107 @@
+# documents/services/violation_tag_service.py
+"""
+Indexed violation tag storage and queries.
+
+The evidence manager edits tags as comma-separated violation_tags strings on
+VideoEvidence and TranscriptQuote. Every write is mirrored into ViolationTag
+rows (one per tag, indexed by document and by tag), which is what filters and
+rollups query.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from ..models import TranscriptQuote, VideoEvidence, ViolationTag
+
+
+class ViolationTagService:
+    """Sync and query normalized violation tags"""
+
+    @staticmethod
+    def sync_segments(segments):
+        """Replace the segment-level tag rows of the given segments"""
+        segments = list(segments)
+        if not segments:
+            return
+        rows = [
+            ViolationTag(document_id=segment.document_id, video_evidence_id=segment.pk, tag=tag)
+            for segment in segments
+            for tag in ViolationTag.parse(segment.violation_tags)
+        ]
+        with transaction.atomic():
+            ViolationTag.objects.filter(
+                video_evidence__in=[segment.pk for segment in segments], quote__isnull=True
+            ).delete()
+            ViolationTag.objects.bulk_create(rows)
+
+    @staticmethod
+    def sync_quotes(quotes):
+        """Replace the tag rows of the given quotes"""
+        quotes = list(quotes)
+        if not quotes:
+            return
+        # One query for the documents of all the quotes' segments
+        document_ids = dict(
+            VideoEvidence.objects.filter(
+                pk__in={quote.video_evidence_id for quote in quotes}
+            ).values_list('pk', 'document_id')
+        )
+        rows = [
+            ViolationTag(
+                document_id=document_ids[quote.video_evidence_id],
+                video_evidence_id=quote.video_evidence_id,
+                quote_id=quote.pk,
+                tag=tag
+            )
+            for quote in quotes
+            for tag in ViolationTag.parse(quote.violation_tags)
+        ]
+        with transaction.atomic():
+            ViolationTag.objects.filter(quote__in=[quote.pk for quote in quotes]).delete()
+            ViolationTag.objects.bulk_create(rows)
+
+    @staticmethod
+    def quotes_tagged(document, tag):
+        """Queryset of the document's quotes carrying tag"""
+        return TranscriptQuote.objects.filter(
+            pk__in=ViolationTag.objects.filter(
+                document=document, tag=tag, quote__isnull=False
+            ).values('quote_id')
+        )
+
+    @staticmethod
+    def segments_tagged(document, tag):
+        """Queryset of the document's segments tagged directly or through a quote"""
+        return VideoEvidence.objects.filter(
+            pk__in=ViolationTag.objects.filter(document=document, tag=tag).values('video_evidence_id')
+        )
+
+    @staticmethod
+    def tag_counts(document):
+        """{tag: number of segments and quotes carrying it} for a document"""
+        return dict(
+            ViolationTag.objects.filter(document=document)
+            .values_list('tag')
+            .annotate(count=Count('pk'))
+            .order_by()
+        )
+
+    @staticmethod
+    def tags_by_video(document):
+        """
+        {youtube_url: {tag, ...}} over the segments and quotes included in the complaint.
+
+        One query; this is the exhibits list rollup.
+        """
+        rows = ViolationTag.objects.filter(
+            document=document,
+            video_evidence__include_in_complaint=True
+        ).filter(
+            Q(quote__isnull=True) | Q(quote__include_in_document=True)
+        ).values_list('video_evidence__youtube_url', 'tag').distinct()
+
+        tags = defaultdict(set)
+        for url, tag in rows:
+            tags[url].add(tag)
+        return dict(tags)
@@ -9,9 +9,15 @@ from openai import OpenAI
 import re
 from urllib.parse import urlparse, parse_qs
 
+from core.cache import transcript_cache
+
 
 class WhisperTranscriptService:
     """Extract transcripts using Whisper API."""
+
+    # Captions are cached per video for the 'transcripts' namespace default
+    # (a day); paid Whisper transcriptions per segment for longer
+    WHISPER_CACHE_TIMEOUT = 60 * 60 * 24 * 30
     
     @staticmethod
     def extract_video_id(url):
@@ -89,9 +95,12 @@ class WhisperTranscriptService:
             else:
                 api = YouTubeTranscriptApi()
 
-            # Fetch the transcript using the correct API for v1.2.2
-            fetched_transcript = api.fetch(video_id)
-            transcript_list = fetched_transcript.to_raw_data()
+            # Fetch the transcript using the correct API for v1.2.2; the
+            # whole video is cached so other segments of it skip the fetch
+            transcript_list = transcript_cache.get_or_set(
+                f'captions:{video_id}',
+                lambda: api.fetch(video_id).to_raw_data()
+            )
 
             # Filter by time range if specified
             if start_seconds is not None and end_seconds is not None:
@@ -175,6 +184,20 @@ class WhisperTranscriptService:
                 'cost_estimate': 0.0,
                 'duration_minutes': round(duration_minutes, 1)
             }
+        # Whisper runs are paid, so a segment is only transcribed once
+        cache_key = f'whisper:{video_id}:{start_time}:{end_time}'
+        cached = transcript_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached, cost_estimate=0.0)
+
+        result = WhisperTranscriptService._transcribe_with_whisper(api_key, video_id, start_time, end_time)
+        if result['success']:
+            transcript_cache.set(cache_key, result, WhisperTranscriptService.WHISPER_CACHE_TIMEOUT)
+        return result
+
+    @staticmethod
+    def _transcribe_with_whisper(api_key, video_id, start_time=None, end_time=None):
+        """Download the segment's audio with yt-dlp and transcribe it with Whisper."""
         try:
             # Create temporary directory for audio file
             with tempfile.TemporaryDirectory() as temp_dir:
@@ -0,0 +1,45 @@
+# documents/tasks.py
+"""
+Celery tasks for the documents app.
+"""
+import logging
+
+from celery import shared_task
+from celery.signals import worker_process_init
+
+logger = logging.getLogger(__name__)
+
+
+@worker_process_init.connect
+def warm_pdf_renderer(**kwargs):
+    """Parse the PDF stylesheet and load fonts before the first job arrives"""
+    from .services.pdf_render_service import PDFRenderService
+    try:
+        PDFRenderService.warm()
+    except OSError:
+        # WeasyPrint's native libraries are missing on this worker; it can
+        # still run non-PDF tasks.
+        logger.warning("WeasyPrint unavailable; PDF renderer not warmed")
+
+
+@shared_task
+def render_document_pdf(document_id):
+    """Re-render and store a document's PDF if its content hash changed"""
+    from .models import LawsuitDocument
+    from .services.pdf_render_service import PDFRenderService
+
+    try:
+        document = LawsuitDocument.objects.select_related('user__profile').get(pk=document_id)
+    except LawsuitDocument.DoesNotExist:
+        logger.info("Skipping PDF render for deleted document %s", document_id)
+        return
+
+    PDFRenderService.get_or_render(document)
+
+
+@shared_task
+def tag_document_evidence(document_id):
+    """Propose violation tags for a document's untagged segments and quotes"""
+    from .services.evidence_tagging_service import EvidenceTaggingService
+
+    EvidenceTaggingService.tag_document(document_id)
@@ -0,0 +1,52 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from .models import LawsuitDocument, Person, TranscriptQuote, VideoEvidence
+from .services.evidence_to_facts_service import EvidenceToFactsService
+
+
+class EvidenceToFactsQueryCountTests(TestCase):
+    """Statement of Facts generation must not query per segment or quote"""
+
+    # Segments, their included quotes with speakers, and violation tags
+    EXPECTED_QUERIES = 3
+
+    def setUp(self):
+        user = User.objects.create_user('plaintiff', 'plaintiff@example.com', 'password')
+        self.document = LawsuitDocument.objects.create(user=user, title='Test Complaint')
+        self.officer = Person.objects.create(document=self.document, name='Officer Smith', role='defendant')
+        self.plaintiff = Person.objects.create(document=self.document, name='Jane Doe', role='plaintiff')
+
+    def add_evidence(self, segments, quotes_per_segment):
+        for n in range(segments):
+            segment = VideoEvidence.objects.create(
+                document=self.document,
+                youtube_url=f'https://www.youtube.com/watch?v=video{n % 3}',
+                start_time=f'0{n}:00', end_time=f'0{n}:30',
+                start_seconds=n * 60, end_seconds=n * 60 + 30,
+                raw_transcript='Stop recording or you are under arrest.',
+                violation_tags='first_amendment',
+                include_in_complaint=True,
+            )
+            for q in range(quotes_per_segment):
+                TranscriptQuote.objects.create(
+                    video_evidence=segment,
+                    text='Stop recording or you are under arrest.',
+                    start_position=0, end_position=39,
+                    speaker=self.officer if q % 2 else self.plaintiff,
+                    violation_tags='fourth_amendment',
+                    sort_order=q,
+                )
+
+    def test_query_count_is_independent_of_evidence_size(self):
+        self.add_evidence(segments=2, quotes_per_segment=2)
+        with self.assertNumQueries(self.EXPECTED_QUERIES):
+            small = EvidenceToFactsService.generate_facts_section(self.document)
+
+        self.add_evidence(segments=10, quotes_per_segment=5)
+        with self.assertNumQueries(self.EXPECTED_QUERIES):
+            large = EvidenceToFactsService.generate_facts_section(self.document)
+
+        self.assertEqual(small['metadata']['quote_count'], 4)
+        self.assertEqual(large['metadata']['quote_count'], 54)
+        self.assertEqual(large['metadata']['exhibit_count'], 3)
@@ -7,6 +7,7 @@ from django.contrib.auth.decorators import login_required
 from .views import whisper_views
 from .views import evidence_views
 from .views import section_views
+from .views import court_views
 
 
 urlpatterns = [
@@ -28,6 +29,7 @@ urlpatterns = [
     path('<int:pk>/download-pdf/', login_required(views_main.DocumentPDFView.as_view()), name='download_pdf'),
     # path('api/extract-transcript-mock/', transcript_views.extract_transcript_mock, name='extract_transcript_mock'),
     path('api/extract-transcript/', whisper_views.extract_transcript_whisper, name='extract_transcript_whisper'),
+    path('api/court-lookup/', court_views.court_lookup, name='court_lookup'),
 
 
     # Evidence management URLs
@@ -0,0 +1,62 @@
+# documents/views/court_views.py
+"""
+Federal district suggestions for the incident location fields.
+
+Called from create.html as the user types, so it is GET-only, answers from
+the per-process lookup cache, and lets the browser reuse responses: court
+data only changes when the bundled dataset is rebuilt or the code changes,
+so responses carry an ETag of the dataset, lookup and app versions and the
+query, and a private max-age.
+"""
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
+
+from ..services.court_data.dataset import court_dataset
+from ..services.court_lookup_service import CourtLookupService
+
+
+# Browsers may reuse a suggestion for this long without asking again
+COURT_LOOKUP_MAX_AGE = 60 * 60
+
+
+def _lookup_params(request):
+    return (
+        request.GET.get('city', '')[:100],
+        request.GET.get('state', '')[:2],
+        request.GET.get('county', '')[:100],
+        request.GET.get('zip', '')[:10],
+    )
+
+
+def _court_lookup_etag(request):
+    versions = (settings.APP_VERSION, str(CourtLookupService.LOOKUP_VERSION), court_dataset.version or '')
+    key = '\x00'.join(versions + _lookup_params(request)).lower()
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+@login_required
+@require_GET
+@cache_control(private=True, max_age=COURT_LOOKUP_MAX_AGE)
+@condition(etag_func=_court_lookup_etag)
+def court_lookup(request):
+    """
+    Suggest the federal district for ?city=&state=&zip=&county=.
+
+    Returns JSON with the lookup result (court_name, confidence, method,
+    district and, for misspelled cities, ranked candidates) or null.
+    """
+    city, state, county, zip_code = _lookup_params(request)
+    if not state:
+        return JsonResponse({'success': False, 'error': 'State is required'}, status=400)
+
+    result = CourtLookupService.lookup_court_cached(city, state, county=county, zip_code=zip_code)
+    return JsonResponse({
+        'success': True,
+        'result': result,
+        'dataset_version': court_dataset.version,
+    })
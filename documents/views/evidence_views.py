@@ -12,6 +12,7 @@ import json
 from accounts.models import Subscription
 from ..models import LawsuitDocument, VideoEvidence, Person, TranscriptQuote
 from ..services.whisper_transcript_service import WhisperTranscriptService
+from ..services.evidence_tagging_service import EvidenceTaggingService
 from accounts.emails import EmailService
 from decimal import Decimal
 
@@ -157,6 +158,9 @@ def extract_evidence_segment(request, pk):
         from decimal import Decimal
         document.extraction_minutes_used += Decimal(str(duration_minutes))
         document.save()
+
+        # Propose violation tags for the new transcript in the background
+        EvidenceTaggingService.schedule_tagging(document.id)
         
         return JsonResponse({
             'success': True,
@@ -191,6 +195,7 @@ def update_evidence_segment(request, pk, segment_id):
         
         if 'violation_tags' in data:
             segment.violation_tags = data['violation_tags']
+            segment.tags_edited = True
         
         if 'notes' in data:
             segment.notes = data['notes']
@@ -270,6 +275,9 @@ def add_manual_segment(request, pk):
             manually_entered=True,
             source_type=source_type
         )
+
+        # Propose violation tags for the typed transcript in the background
+        EvidenceTaggingService.schedule_tagging(document.id)
         
         return JsonResponse({
             'success': True,
@@ -296,7 +304,7 @@ def generate_facts_from_evidence(request, pk):
     from ..services.evidence_to_facts_service import EvidenceToFactsService
     
     # Generate facts from evidence
-    result = EvidenceToFactsService.generate_facts_section(document)
+    result = EvidenceToFactsService.get_facts_section(document)
     
     if not result['content']:
         messages.warning(
@@ -305,11 +313,8 @@ def generate_facts_from_evidence(request, pk):
         )
         return redirect('evidence_manager', pk=pk)
     
-    from ..models import DocumentSection
-    
     # Create or update Statement of Facts section
-    facts_section, created = DocumentSection.objects.get_or_create(
-        document=document,
+    facts_section, created = document.sections.get_or_create(
         section_type='facts',
         defaults={
             'title': 'Statement of Facts',
@@ -355,8 +360,7 @@ def generate_facts_from_evidence(request, pk):
     
     # Create or update List of Exhibits section (separate from facts)
     if result.get('exhibits_list'):
-        exhibits_section, created = DocumentSection.objects.get_or_create(
-            document=document,
+        exhibits_section, created = document.sections.get_or_create(
             section_type='exhibits',
             defaults={
                 'title': 'List of Exhibits',
@@ -389,7 +393,7 @@ def preview_facts_from_evidence(request, pk):
     
     from ..services.evidence_to_facts_service import EvidenceToFactsService
     
-    result = EvidenceToFactsService.generate_facts_section(document)
+    result = EvidenceToFactsService.get_facts_section(document)
     
     if not result['content']:
         return JsonResponse({
@@ -704,6 +708,8 @@ def add_quote(request, pk, segment_id):
             approximate_timestamp=data.get('approximate_timestamp', '').strip(),
             significance=data.get('significance', '').strip(),
             violation_tags=data.get('violation_tags', '').strip(),
+            # Tags chosen here, even none, are the user's: tagging leaves them alone
+            tags_edited='violation_tags' in data,
             notes=data.get('notes', '').strip(),
             sort_order=max_order + 1,
             include_in_document=data.get('include_in_document', True)
@@ -766,6 +772,7 @@ def update_quote(request, pk, segment_id, quote_id):
             quote.significance = data['significance'].strip()
         if 'violation_tags' in data:
             quote.violation_tags = data['violation_tags'].strip()
+            quote.tags_edited = True
         if 'notes' in data:
             quote.notes = data['notes'].strip()
         if 'sort_order' in data:
@@ -6,11 +6,10 @@ from django.core.paginator import Paginator
 from django.db.models import Q
 from .models import LawsuitDocument, DocumentSection
 from .forms import LawsuitDocumentForm, DocumentSearchForm
-from django.http import JsonResponse
+from django.http import JsonResponse, FileResponse
 from django.db import models
 import json
 from django.views.decorators.http import require_POST
-from django_weasyprint import WeasyTemplateResponseMixin
 from django.views.generic import DetailView
 
 
@@ -362,18 +361,18 @@ def generate_default_sections(request, pk):
     return redirect('document_detail', pk=pk)
 
 
-class DocumentPDFView(WeasyTemplateResponseMixin, DetailView):
+class DocumentPDFView(DetailView):
     """
-    Generate PDF of lawsuit document using django-weasyprint.
-    This class-based view handles all the PDF generation automatically.
+    Download the PDF of a lawsuit document.
+    Streams the stored PDF when the sections are unchanged; otherwise renders
+    it once with WeasyPrint (via PDFRenderService) and stores it for next time.
     """
     model = LawsuitDocument
-    template_name = 'documents/document_pdf.html'
     context_object_name = 'document'
     
     def get_queryset(self):
         # Security: only return documents owned by current user
-        return LawsuitDocument.objects.filter(user=self.request.user)
+        return LawsuitDocument.objects.filter(user=self.request.user).select_related('user__profile')
 
 
     def dispatch(self, request, *args, **kwargs):
@@ -402,12 +401,18 @@ class DocumentPDFView(WeasyTemplateResponseMixin, DetailView):
         messages.error(request, 'You need to purchase this document or upgrade to Standard plan to download PDFs.')
         return redirect('document_detail', pk=document.pk)    
     
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['sections'] = self.object.sections.all().order_by('order')
-        return context
+    def get(self, request, *args, **kwargs):
+        from documents.services.pdf_render_service import PDFRenderService
+        self.object = self.get_object()
+        pdf_file = PDFRenderService.get_or_render(self.object)
+        return FileResponse(
+            pdf_file.open('rb'),
+            as_attachment=True,
+            filename=self.get_pdf_filename(),
+            content_type='application/pdf'
+        )
     
     def get_pdf_filename(self):
         # Custom filename for the PDF
         safe_title = self.object.title[:30].replace(' ', '_').replace('/', '-')
-        return f"lawsuit_{self.object.pk}_{safe_title}.pdf"
\ No newline at end of file
+        return f"lawsuit_{self.object.pk}_{safe_title}.pdf"